@@ -1,18 +1,31 @@
 #!/usr/bin/env python3
 """Run tests with comprehensive timing diagnostics."""
 
+import os
 import subprocess
 import sys
+import threading
 import time
 from pathlib import Path
+from typing import BinaryIO
 
 from rich.console import Console
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
 from timing_diagnostics import generate_report, timing
 
 console = Console()
 
+LOG_FILE = "test_results.log"
+
+
+def tee_output(process: subprocess.Popen[bytes], log_file: BinaryIO) -> None:
+    """Copy pytest output to the terminal and the log file as it arrives."""
+    assert process.stdout is not None
+    for chunk in iter(lambda: process.stdout.read1(65536), b""):
+        sys.stdout.buffer.write(chunk)
+        sys.stdout.buffer.flush()
+        log_file.write(chunk)
+
 
 def run_tests_with_timing():
     """Run pytest with comprehensive timing analysis."""
@@ -34,15 +47,24 @@ def run_tests_with_timing():
 
     timing.checkpoint("Project validation", "Found pyproject.toml")
 
-    # Run pytest with timing
+    # Run pytest with timing, spread across all cores via pytest-xdist.
+    # loadfile keeps each test module on one worker so fixtures are reused.
     cmd = [
         "poetry",
         "run",
         "pytest",
         "--no-cov",
+        "-n",
+        str(os.cpu_count() or 4),
+        "--dist=loadfile",
         "--durations=20",
         "--timeout=30",
-        "-v",
+        "--tb=short",
+        # Cancels the -v from pyproject addopts; per-test lines are noise here.
+        "-q",
+        # The logging plugin adds per-test capture overhead we never read.
+        "-p",
+        "no:logging",
     ]
 
     console.print(f"🚀 [green]Running: {' '.join(cmd)}[/green]")
@@ -51,21 +73,25 @@ def run_tests_with_timing():
     start_time = time.time()
 
     try:
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Running tests...", total=None)
-
-            result = subprocess.run(
+        # Stream output to the terminal and the log as it is produced
+        # instead of buffering the whole run in memory.
+        with open(LOG_FILE, "wb", buffering=0) as log_file:
+            process = subprocess.Popen(
                 cmd,
-                capture_output=True,
-                text=True,
-                timeout=300,  # 5 minute timeout
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
             )
-
-            progress.update(task, description="Tests completed!")
+            tee = threading.Thread(
+                target=tee_output, args=(process, log_file), daemon=True
+            )
+            tee.start()
+            try:
+                returncode = process.wait(timeout=300)  # 5 minute timeout
+            finally:
+                if process.poll() is None:
+                    process.kill()
+                    process.wait()
+                tee.join()
 
     except subprocess.TimeoutExpired:
         timing.checkpoint("Test timeout", "Tests exceeded 5 minute limit")
@@ -81,27 +107,20 @@ def run_tests_with_timing():
     timing.checkpoint("Test execution", f"Completed in {duration:.2f}s")
 
     # Analyze results
-    if result.returncode == 0:
+    if returncode == 0:
         console.print("✅ [green]All tests passed![/green]")
         timing.checkpoint("Test success", "All tests passed")
     else:
         console.print("❌ [red]Some tests failed[/red]")
-        timing.checkpoint("Test failure", f"Exit code: {result.returncode}")
-
-    # Save output for analysis
-    with open("test_results.log", "w") as f:
-        f.write(result.stdout)
-        if result.stderr:
-            f.write("\n--- STDERR ---\n")
-            f.write(result.stderr)
+        timing.checkpoint("Test failure", f"Exit code: {returncode}")
 
-    timing.checkpoint("Results saved", "Written to test_results.log")
+    timing.checkpoint("Results saved", f"Written to {LOG_FILE}")
 
     # Generate comprehensive report
     console.print("\n" + "=" * 60)
     generate_report()
 
-    return result.returncode == 0
+    return returncode == 0
 
 
 if __name__ == "__main__":
@@ -8,6 +8,8 @@ This script provides comprehensive timing analysis for:
 - Performance bottlenecks
 """
 
+import heapq
+import re
 import time
 from datetime import UTC, datetime
 from pathlib import Path
@@ -18,33 +20,53 @@ from rich.table import Table
 
 console = Console()
 
+NS_PER_SECOND = 1_000_000_000
+
+# Matches pytest --durations rows such as "1.23s call     tests/x.py::test_y".
+PYTEST_DURATION = re.compile(rb"^\s*(\d+\.\d+)s\s+call\s+(\S+)")
+
 
 class TimingDiagnostics:
     """Comprehensive timing analysis for development workflow."""
 
     def __init__(self):
-        self.start_time = time.time()
+        # Wall-clock time is captured once for the session; every interval
+        # is measured with the monotonic integer perf counter.
+        self.started_at = datetime.now(UTC)
+        self.start_ns = time.perf_counter_ns()
         self.checkpoints: list[dict[str, Any]] = []
-        self.provider_times: dict[str, list[float]] = {}
+        # Running count/sum/min/max per provider; O(1) per recorded call.
+        self.provider_stats: dict[str, dict[str, float]] = {}
 
     def checkpoint(self, name: str, details: str = ""):
         """Record a timing checkpoint."""
-        elapsed = time.time() - self.start_time
+        elapsed_ns = time.perf_counter_ns() - self.start_ns
         self.checkpoints.append(
             {
                 "name": name,
-                "elapsed": elapsed,
-                "timestamp": datetime.now(UTC),
+                "elapsed_ns": elapsed_ns,
                 "details": details,
             }
         )
-        console.print(f"⏱️  [{elapsed:.2f}s] {name}: {details}")
+        console.print(f"⏱️  [{elapsed_ns / NS_PER_SECOND:.2f}s] {name}: {details}")
 
     def record_provider_time(self, provider: str, duration: float):
         """Record provider API response time."""
-        if provider not in self.provider_times:
-            self.provider_times[provider] = []
-        self.provider_times[provider].append(duration)
+        stats = self.provider_stats.get(provider)
+        if stats is None:
+            self.provider_stats[provider] = {
+                "count": 1,
+                "sum": duration,
+                "min": duration,
+                "max": duration,
+            }
+            return
+        stats["count"] += 1
+        stats["sum"] += duration
+        if duration < stats["min"]:
+            stats["min"] = duration
+        if duration > stats["max"]:
+            stats["max"] = duration
 
     def analyze_test_timing(self, test_results_file: str = "test_results.log"):
         """Analyze pytest timing from log file."""
@@ -54,25 +76,23 @@ class TimingDiagnostics:
 
         console.print("\n🔍 [bold]Test Timing Analysis[/bold]")
 
-        # Parse pytest durations from log
+        # Parse pytest durations from log; only matching lines are decoded.
         slow_tests = []
-        with open(test_results_file) as f:
+        with open(test_results_file, "rb") as f:
             for line in f:
-                if "call     " in line and "s call" in line:
-                    # Extract test name and duration
-                    parts = line.strip().split()
-                    if len(parts) >= 3:
-                        duration = float(parts[0].replace("s", ""))
-                        test_name = parts[2]
-                        if duration > 1.0:  # Tests taking > 1 second
-                            slow_tests.append((duration, test_name))
+                match = PYTEST_DURATION.match(line)
+                if match is None:
+                    continue
+                duration = float(match.group(1))
+                if duration > 1.0:  # Tests taking > 1 second
+                    slow_tests.append((duration, match.group(2).decode()))
 
         if slow_tests:
             table = Table(title="🐌 Slow Tests (>1s)")
             table.add_column("Duration", style="red")
             table.add_column("Test", style="yellow")
 
-            for duration, test_name in sorted(slow_tests, reverse=True)[:10]:
+            for duration, test_name in heapq.nlargest(10, slow_tests):
                 table.add_row(f"{duration:.2f}s", test_name)
 
             console.print(table)
@@ -81,7 +101,7 @@ class TimingDiagnostics:
 
     def analyze_provider_performance(self):
         """Analyze provider API performance."""
-        if not self.provider_times:
+        if not self.provider_stats:
             console.print("📊 No provider timing data recorded")
             return
 
@@ -94,14 +114,14 @@ class TimingDiagnostics:
         table.add_column("Min (ms)", style="blue")
         table.add_column("Max (ms)", style="red")
 
-        for provider, times in self.provider_times.items():
-            avg_ms = sum(times) / len(times) * 1000
-            min_ms = min(times) * 1000
-            max_ms = max(times) * 1000
+        for provider, stats in self.provider_stats.items():
+            avg_ms = stats["sum"] / stats["count"] * 1000
+            min_ms = stats["min"] * 1000
+            max_ms = stats["max"] * 1000
 
             table.add_row(
                 provider,
-                str(len(times)),
+                str(int(stats["count"])),
                 f"{avg_ms:.1f}",
                 f"{min_ms:.1f}",
                 f"{max_ms:.1f}",
@@ -111,28 +131,29 @@ class TimingDiagnostics:
 
     def generate_timing_report(self):
         """Generate comprehensive timing report."""
-        total_time = time.time() - self.start_time
+        total_ns = time.perf_counter_ns() - self.start_ns
 
         console.print("\n📈 [bold]Timing Report[/bold]")
-        console.print(f"Total elapsed: {total_time:.2f}s")
+        console.print(f"Session started: {self.started_at.isoformat()}")
+        console.print(f"Total elapsed: {total_ns / NS_PER_SECOND:.2f}s")
 
         if self.checkpoints:
             console.print("\n⏰ [bold]Checkpoint Timeline[/bold]")
             for i, cp in enumerate(self.checkpoints):
-                prev_time = self.checkpoints[i - 1]["elapsed"] if i > 0 else 0
-                delta = cp["elapsed"] - prev_time
+                prev_ns = self.checkpoints[i - 1]["elapsed_ns"] if i > 0 else 0
+                delta = (cp["elapsed_ns"] - prev_ns) / NS_PER_SECOND
                 console.print(f"  {cp['name']}: +{delta:.2f}s ({cp['details']})")
 
     async def monitor_async_operation(self, name: str, coro):
         """Monitor an async operation with timing."""
-        start = time.time()
+        start_ns = time.perf_counter_ns()
         try:
             result = await coro
-            duration = time.time() - start
+            duration = (time.perf_counter_ns() - start_ns) / NS_PER_SECOND
             console.print(f"✅ {name}: {duration:.2f}s")
             return result
         except Exception as e:
-            duration = time.time() - start
+            duration = (time.perf_counter_ns() - start_ns) / NS_PER_SECOND
             console.print(f"❌ {name}: {duration:.2f}s - {e}")
             raise
 
@@ -145,8 +166,9 @@ class TimingDiagnostics:
             gaps = []
             for i in range(1, len(self.checkpoints)):
                 gap = (
-                    self.checkpoints[i]["elapsed"] - self.checkpoints[i - 1]["elapsed"]
-                )
+                    self.checkpoints[i]["elapsed_ns"]
+                    - self.checkpoints[i - 1]["elapsed_ns"]
+                ) / NS_PER_SECOND
                 if gap > 5.0:  # Gaps > 5 seconds
                     gaps.append(
                         (
@@ -170,16 +192,16 @@ class TimingDiagnostics:
         suggestions = []
 
         # Check provider times
-        for provider, times in self.provider_times.items():
-            avg_time = sum(times) / len(times)
+        for provider, stats in self.provider_stats.items():
+            avg_time = stats["sum"] / stats["count"]
             if avg_time > 2.0:  # Average > 2 seconds
                 suggestions.append(
                     f"Consider caching for {provider} (avg: {avg_time:.1f}s)"
                 )
 
         # Check for many slow tests
-        if len(self.provider_times) > 0:
-            total_calls = sum(len(times) for times in self.provider_times.values())
+        if len(self.provider_stats) > 0:
+            total_calls = sum(stats["count"] for stats in self.provider_stats.values())
             if total_calls > 50:
                 suggestions.append("Consider parallel API calls for better performance")
 
@@ -7,6 +7,7 @@ Run this after setting up a new development environment.
 
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 
 def run_command(cmd: list[str]) -> tuple[bool, str]:
@@ -23,61 +24,58 @@ def run_command(cmd: list[str]) -> tuple[bool, str]:
         return False, str(e)
 
 
-def check_python() -> bool:
+CheckResult = tuple[bool, list[str]]
+
+
+def check_python() -> CheckResult:
     """Check Python version >= 3.12."""
     success, output = run_command([sys.executable, "--version"])
     if not success:
-        print("❌ Python not found")
-        return False
+        return False, ["❌ Python not found"]
 
     version_str = output.split()[1]
     major, minor = map(int, version_str.split(".")[:2])
 
     if major >= 3 and minor >= 12:
-        print(f"✅ Python {version_str} (>= 3.12 required)")
-        return True
+        return True, [f"✅ Python {version_str} (>= 3.12 required)"]
     else:
-        print(f"❌ Python {version_str} (>= 3.12 required)")
-        return False
+        return False, [f"❌ Python {version_str} (>= 3.12 required)"]
 
 
-def check_poetry() -> bool:
+def check_poetry() -> CheckResult:
     """Check Poetry is installed."""
     success, output = run_command(["poetry", "--version"])
     if not success:
-        print("❌ Poetry not found")
-        print("   Install: curl -sSL https://install.python-poetry.org | python3 -")
-        return False
+        return False, [
+            "❌ Poetry not found",
+            "   Install: curl -sSL https://install.python-poetry.org | python3 -",
+        ]
 
-    print(f"✅ {output}")
-    return True
+    return True, [f"✅ {output}"]
 
 
-def check_git() -> bool:
+def check_git() -> CheckResult:
     """Check Git is installed."""
     success, output = run_command(["git", "--version"])
     if not success:
-        print("❌ Git not found")
-        return False
+        return False, ["❌ Git not found"]
 
-    print(f"✅ {output}")
-    return True
+    return True, [f"✅ {output}"]
 
 
-def check_poetry_config() -> bool:
+def check_poetry_config() -> CheckResult:
     """Check Poetry virtualenvs.in-project setting."""
     success, output = run_command(["poetry", "config", "virtualenvs.in-project"])
     if not success:
-        print("❌ Poetry config check failed")
-        return False
+        return False, ["❌ Poetry config check failed"]
 
     if output == "true":
-        print("✅ Poetry configured for in-project .venv")
-        return True
+        return True, ["✅ Poetry configured for in-project .venv"]
     else:
-        print("❌ Poetry not configured for in-project .venv")
-        print("   Run: poetry config virtualenvs.in-project true")
-        return False
+        return False, [
+            "❌ Poetry not configured for in-project .venv",
+            "   Run: poetry config virtualenvs.in-project true",
+        ]
 
 
 def main() -> int:
@@ -91,10 +89,18 @@ def main() -> int:
         ("Poetry Config", check_poetry_config),
     ]
 
+    # Each check is dominated by subprocess startup, so run them concurrently
+    # and report in the declared order once they finish.
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        futures = [executor.submit(check_func) for _name, check_func in checks]
+        outcomes = [future.result() for future in futures]
+
     results = []
-    for _name, check_func in checks:
-        results.append(check_func())
+    for passed, messages in outcomes:
+        for message in messages:
+            print(message)
         print()
+        results.append(passed)
 
     if all(results):
         print("✅ All toolchain checks passed!")
@@ -1,6 +1,5 @@
 -- Initial cache schema for NameGnome Serve.
-
-BEGIN;
+-- The migration runner wraps pending migrations in a single transaction.
 
 CREATE TABLE IF NOT EXISTS kv (
     k TEXT PRIMARY KEY,
@@ -83,5 +82,3 @@ CREATE INDEX IF NOT EXISTS idx_cache_entries_provider
 
 CREATE INDEX IF NOT EXISTS idx_cache_entries_expires
     ON cache_entries (expires_at);
-
-COMMIT;
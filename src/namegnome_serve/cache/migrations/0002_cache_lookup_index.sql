@@ -0,0 +1,9 @@
+-- Lookup index for ProviderCache.get, which filters on
+-- (cache_key, provider, expires_at). The `data` payload is left out so cached
+-- blobs are not copied into the index b-tree.
+
+CREATE INDEX IF NOT EXISTS idx_cache_entries_lookup
+    ON cache_entries (cache_key, provider, expires_at);
+
+-- No query filters on provider alone; the lookup index supersedes it.
+DROP INDEX IF EXISTS idx_cache_entries_provider;
@@ -0,0 +1,25 @@
+-- Store cache payloads as version-tagged BLOBs instead of JSON text.
+-- SQLite cannot change a declared column type in place, so the table is
+-- rebuilt. Existing TEXT payloads are copied verbatim; ProviderCache still
+-- decodes them as legacy JSON.
+
+CREATE TABLE cache_entries_new (
+    cache_key TEXT PRIMARY KEY,
+    provider TEXT NOT NULL,
+    data BLOB NOT NULL,
+    expires_at REAL NOT NULL,
+    created_at REAL NOT NULL
+);
+
+INSERT INTO cache_entries_new (cache_key, provider, data, expires_at, created_at)
+    SELECT cache_key, provider, data, expires_at, created_at FROM cache_entries;
+
+DROP TABLE cache_entries;
+
+ALTER TABLE cache_entries_new RENAME TO cache_entries;
+
+CREATE INDEX IF NOT EXISTS idx_cache_entries_lookup
+    ON cache_entries (cache_key, provider, expires_at);
+
+CREATE INDEX IF NOT EXISTS idx_cache_entries_expires
+    ON cache_entries (expires_at);
@@ -0,0 +1,11 @@
+-- Per-entry access statistics used to warm the in-process tier on startup.
+-- ProviderCache accumulates hit counts in memory and flushes them on close.
+
+CREATE TABLE IF NOT EXISTS cache_access (
+    cache_key TEXT PRIMARY KEY,
+    hit_count INTEGER NOT NULL DEFAULT 0,
+    last_access_at REAL NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_cache_access_hit_count
+    ON cache_access (hit_count);
@@ -2,22 +2,43 @@
 
 from __future__ import annotations
 
+import asyncio
+import sqlite3
 from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from functools import lru_cache
 from importlib import resources
 from importlib.abc import Traversable
+from operator import itemgetter
 from pathlib import Path
 
-import aiosqlite
-
 __all__ = [
+    "CURRENT_SCHEMA_VERSION",
     "MigrationFile",
     "apply_migrations",
     "ensure_connection_migrated",
     "get_migration_files",
+    "migrate_connection",
+    "schema_is_current",
 ]
 
+#: Schema version recorded in ``PRAGMA user_version`` once every bundled
+#: migration is applied. Bump it together with each new migration file.
+CURRENT_SCHEMA_VERSION = 4
+
+
+# Connection tuning for a cache workload: losing the last few writes on power
+# loss is acceptable, paying an fsync on every commit is not. In-memory
+# databases ignore the journal_mode request and keep their `memory` journal.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+
 
 @dataclass(frozen=True)
 class MigrationFile:
@@ -27,30 +48,43 @@ class MigrationFile:
     sql: str
 
 
-def _iter_sql_resources() -> Iterable[Traversable]:
-    """Iterate over SQL migration files bundled with the package."""
+def _iter_sql_resources() -> Iterable[tuple[str, Traversable]]:
+    """Iterate over `(name, resource)` pairs for bundled SQL migrations."""
 
     package = resources.files(__name__)
     for entry in package.iterdir():
-        if entry.name.endswith(".sql"):
-            yield entry
+        name = entry.name
+        if name.endswith(".sql"):
+            yield name, entry
 
 
-def get_migration_files() -> list[MigrationFile]:
-    """Load bundled migration files as `MigrationFile` objects."""
+@lru_cache(maxsize=1)
+def get_migration_files() -> tuple[MigrationFile, ...]:
+    """Load bundled migration files as `MigrationFile` objects.
 
-    files = [
-        MigrationFile(name=entry.name, sql=entry.read_text(encoding="utf-8"))
-        for entry in sorted(_iter_sql_resources(), key=lambda item: item.name)
-    ]
-    return files
+    The bundled SQL never changes at runtime, so the files are read once per
+    process and the resulting tuple is shared by every connection.
+    """
 
+    return tuple(
+        MigrationFile(name=name, sql=entry.read_bytes().decode("utf-8"))
+        for name, entry in sorted(_iter_sql_resources(), key=itemgetter(0))
+    )
 
-async def ensure_connection_migrated(connection: aiosqlite.Connection) -> None:
-    """Apply migrations to an existing SQLite connection."""
 
-    await connection.execute("PRAGMA foreign_keys=ON")
-    await connection.execute(
+def migrate_connection(connection: sqlite3.Connection) -> None:
+    """Apply pending migrations to an open `sqlite3` connection.
+
+    Blocking; async callers go through `ensure_connection_migrated`.
+    """
+
+    connection.execute("PRAGMA foreign_keys=ON")
+    for pragma in _CONNECTION_PRAGMAS:
+        connection.execute(pragma)
+    if _read_user_version(connection) == CURRENT_SCHEMA_VERSION:
+        return
+
+    connection.execute(
         """
         CREATE TABLE IF NOT EXISTS migrations (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -59,23 +93,88 @@ async def ensure_connection_migrated(connection: aiosqlite.Connection) -> None:
         )
         """
     )
-    await connection.commit()
-
-    async with connection.execute("SELECT name FROM migrations") as cursor:
-        applied = {row[0] for row in await cursor.fetchall()}
+    connection.commit()
 
-    for migration in get_migration_files():
-        if migration.name in applied:
-            continue
+    applied = frozenset(
+        row[0] for row in connection.execute("SELECT name FROM migrations")
+    )
 
-        await connection.executescript(migration.sql)
-        applied_at = datetime.now(UTC).isoformat().replace("+00:00", "Z")
-        await connection.execute(
+    pending = [
+        migration
+        for migration in get_migration_files()
+        if migration.name not in applied
+    ]
+    if not pending:
+        # Databases migrated before user_version was tracked.
+        connection.execute(f"PRAGMA user_version={CURRENT_SCHEMA_VERSION}")
+        return
+
+    # All pending migrations share one transaction so a cold start pays for a
+    # single commit. `executescript` commits any open transaction before it
+    # runs, so the whole batch goes through one call.
+    script = "\n".join(["BEGIN;", *(migration.sql for migration in pending)])
+    # The batch is applied atomically, so every row shares one timestamp.
+    applied_at = datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+    try:
+        connection.executescript(script)
+        connection.executemany(
             "INSERT INTO migrations (name, applied_at) VALUES (?, ?)",
-            (migration.name, applied_at),
+            [(migration.name, applied_at) for migration in pending],
         )
-        await connection.commit()
-        applied.add(migration.name)
+        connection.execute(f"PRAGMA user_version={CURRENT_SCHEMA_VERSION}")
+        connection.commit()
+    except Exception:
+        connection.rollback()
+        raise
+
+
+def _read_user_version(connection: sqlite3.Connection) -> int:
+    """Return the database's ``PRAGMA user_version``."""
+
+    row = connection.execute("PRAGMA user_version").fetchone()
+    return int(row[0]) if row else 0
+
+
+def schema_is_current(db_path: str | Path) -> bool:
+    """Return True when the database at `db_path` needs no migrations.
+
+    Opens the file read-only and checks ``PRAGMA user_version`` only, so
+    callers can skip the async migration path (and its event loop) entirely.
+    Missing files and in-memory databases always report False.
+    """
+
+    if str(db_path) == ":memory:":
+        return False
+    path_obj = Path(db_path).expanduser()
+    if not path_obj.is_file():
+        return False
+
+    try:
+        connection = sqlite3.connect(f"{path_obj.as_uri()}?mode=ro", uri=True)
+    except sqlite3.Error:
+        return False
+    try:
+        return _read_user_version(connection) == CURRENT_SCHEMA_VERSION
+    except sqlite3.Error:
+        return False
+    finally:
+        connection.close()
+
+
+async def ensure_connection_migrated(connection: sqlite3.Connection) -> None:
+    """Apply migrations to an existing SQLite connection."""
+
+    await asyncio.to_thread(migrate_connection, connection)
+
+
+def _apply_migrations_sync(target_path: str) -> None:
+    """Open `target_path`, migrate it, and close the connection."""
+
+    connection = sqlite3.connect(target_path)
+    try:
+        migrate_connection(connection)
+    finally:
+        connection.close()
 
 
 async def apply_migrations(db_path: str | Path) -> None:
@@ -88,5 +187,4 @@ async def apply_migrations(db_path: str | Path) -> None:
     else:
         target_path = ":memory:"
 
-    async with aiosqlite.connect(target_path) as connection:
-        await ensure_connection_migrated(connection)
+    await asyncio.to_thread(_apply_migrations_sync, target_path)
@@ -2,25 +2,175 @@
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
+import sqlite3
 import time
+from collections import Counter, OrderedDict
+from collections.abc import Callable, Iterable
 from pathlib import Path
-from typing import Any, cast
+from typing import Any, TypeVar, cast
 
-import aiosqlite
-
-from namegnome_serve.cache.migrations import ensure_connection_migrated
+from namegnome_serve.cache.migrations import migrate_connection
 from namegnome_serve.cache.paths import resolve_cache_db_path
+from namegnome_serve.utils.json_codec import dumps, loads
+
+# One-byte tag prefixed to stored payloads. Rows written before payloads were
+# tagged hold plain JSON text and are decoded as-is.
+_PAYLOAD_JSON_V1 = b"\x01"
+
+
+def _encode_payload(data: dict[str, Any]) -> bytes:
+    """Encode a payload as a tagged, compact UTF-8 JSON blob."""
+
+    return _PAYLOAD_JSON_V1 + dumps(data)
+
+
+def _decode_payload(raw: bytes | str) -> dict[str, Any]:
+    """Decode a stored payload, accepting legacy untagged JSON text."""
+
+    if isinstance(raw, bytes) and raw[:1] == _PAYLOAD_JSON_V1:
+        return cast(dict[str, Any], loads(memoryview(raw)[1:]))
+    return cast(dict[str, Any], loads(raw))
+
+
+T = TypeVar("T")
+
+_SELECT_ENTRY_SQL = """
+    SELECT data, expires_at FROM cache_entries
+    WHERE cache_key = ? AND provider = ? AND expires_at > ?
+"""
+
+_UPSERT_ENTRY_SQL = """
+    INSERT OR REPLACE INTO cache_entries
+    (cache_key, provider, data, expires_at, created_at)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+_RECORD_ACCESS_SQL = """
+    INSERT INTO cache_access (cache_key, hit_count, last_access_at)
+    VALUES (?, ?, ?)
+    ON CONFLICT (cache_key) DO UPDATE SET
+        hit_count = hit_count + excluded.hit_count,
+        last_access_at = excluded.last_access_at
+"""
+
+_SELECT_HOTTEST_SQL = """
+    SELECT e.provider, e.cache_key, e.data, e.expires_at
+    FROM cache_entries AS e
+    JOIN cache_access AS a USING (cache_key)
+    WHERE e.expires_at > ?
+    ORDER BY a.hit_count DESC
+    LIMIT ?
+"""
+
+_CLEAR_SQL = """
+    DELETE FROM cache_entries;
+    DELETE FROM cache_access;
+"""
+
+_DELETE_ORPHAN_ACCESS_SQL = """
+    DELETE FROM cache_access
+    WHERE cache_key NOT IN (SELECT cache_key FROM cache_entries)
+"""
+
+_DELETE_EXPIRED_BATCH_SQL = """
+    DELETE FROM cache_entries WHERE rowid IN (
+        SELECT rowid FROM cache_entries
+        WHERE expires_at <= ?
+        LIMIT ?
+    )
+"""
+
+
+def _open_connection(db_path: str) -> sqlite3.Connection:
+    """Open an autocommit connection usable from worker threads and migrate it."""
+
+    connection = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+    try:
+        migrate_connection(connection)
+    except Exception:
+        connection.close()
+        raise
+    return connection
+
+
+def _fetch_entry(
+    db: sqlite3.Connection, provider: str, key: str, current_time: float
+) -> tuple[dict[str, Any], float] | None:
+    """Look up and decode a live entry in one worker-thread hop."""
+
+    row = db.execute(_SELECT_ENTRY_SQL, (key, provider, current_time)).fetchone()
+    if row is None:
+        return None
+    payload, expires_at = row
+    return _decode_payload(payload), expires_at
+
+
+def _write_entries(
+    db: sqlite3.Connection, rows: list[tuple[str, str, bytes, float, float]]
+) -> None:
+    """Upsert encoded rows inside a single explicit transaction."""
+
+    db.execute("BEGIN")
+    try:
+        db.executemany(_UPSERT_ENTRY_SQL, rows)
+    except Exception:
+        db.execute("ROLLBACK")
+        raise
+    db.execute("COMMIT")
+
+
+def _record_access(db: sqlite3.Connection, rows: list[tuple[str, int, float]]) -> None:
+    """Add buffered `(cache_key, hits, last_access_at)` counts to `cache_access`."""
+
+    db.execute("BEGIN")
+    try:
+        db.executemany(_RECORD_ACCESS_SQL, rows)
+    except Exception:
+        db.execute("ROLLBACK")
+        raise
+    db.execute("COMMIT")
+
+
+def _fetch_hottest(
+    db: sqlite3.Connection, current_time: float, limit: int
+) -> list[tuple[str, str, dict[str, Any], float]]:
+    """Load and decode the most frequently hit live entries."""
+
+    return [
+        (provider, key, _decode_payload(payload), expires_at)
+        for provider, key, payload, expires_at in db.execute(
+            _SELECT_HOTTEST_SQL, (current_time, limit)
+        )
+    ]
+
+
+def _delete_expired_batch(
+    db: sqlite3.Connection, current_time: float, limit: int
+) -> int:
+    """Delete up to `limit` expired rows and return how many were removed."""
+
+    return db.execute(_DELETE_EXPIRED_BATCH_SQL, (current_time, limit)).rowcount
 
 
 class ProviderCache:
-    """Async SQLite cache for provider API responses."""
+    """Async SQLite cache for provider API responses.
+
+    All access goes through one `sqlite3` connection. Blocking calls run via
+    `asyncio.to_thread` and are serialised with an `asyncio.Lock`.
+    """
+
+    _CLEANUP_BATCH_SIZE = 1000
+    _OPTIMIZE_INTERVAL = 600.0
 
     def __init__(
         self,
         db_path: str | Path | None = None,
         default_ttl: int = 3600,
+        memory_size: int = 1024,
+        warm_size: int = 50,
     ) -> None:
         """Initialize the provider cache.
 
@@ -28,51 +178,98 @@ class ProviderCache:
             db_path: Path to SQLite database file (\":memory:\" for in-memory). When
                 omitted, resolves to `NAMEGNOME_CACHE_PATH` or `./.cache/namegnome.db`.
             default_ttl: Default TTL in seconds (default: 1 hour).
+            memory_size: Maximum number of decoded entries kept in the in-process
+                LRU tier in front of SQLite (0 disables it).
+            warm_size: Number of most frequently hit entries from earlier sessions
+                to preload into the in-process tier on entry (0 disables it).
         """
 
         self.default_ttl = default_ttl
         self._db_path = resolve_cache_db_path(db_path)
-        self._db: aiosqlite.Connection | None = None
+        self._db: sqlite3.Connection | None = None
+        self._lock = asyncio.Lock()
+        self._memory_size = memory_size
+        self._memory: OrderedDict[tuple[str, str], tuple[float, dict[str, Any]]] = (
+            OrderedDict()
+        )
+        self._warm_size = warm_size
+        self._warm_task: asyncio.Task[None] | None = None
+        self._access_counts: Counter[str] = Counter()
+        self._last_optimize = time.monotonic()
         self._hits = 0
         self._misses = 0
 
-    async def _get_connection(self) -> aiosqlite.Connection:
+    async def _get_connection(self) -> sqlite3.Connection:
         """Get or create the cache database connection."""
 
         if self._db is None:
-            self._db = await aiosqlite.connect(self._db_path)
-            await ensure_connection_migrated(self._db)
+            async with self._lock:
+                if self._db is None:
+                    self._db = await asyncio.to_thread(_open_connection, self._db_path)
         return self._db
 
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a blocking `func(db, *args)` on a worker thread."""
+
+        db = await self._get_connection()
+        async with self._lock:
+            return await asyncio.to_thread(func, db, *args)
+
     def _generate_key(self, provider: str, params: dict[str, Any]) -> str:
-        """Generate consistent cache key from provider and params."""
+        """Generate consistent cache key from provider and params.
 
-        sorted_params = json.dumps(params, sort_keys=True)
-        key_string = f"{provider}:{sorted_params}"
-        return hashlib.sha256(key_string.encode()).hexdigest()
+        Keys never leave the process, so a 128-bit BLAKE2b digest is plenty and
+        noticeably cheaper than SHA-256.
+        """
 
-    async def get(self, provider: str, key: str) -> dict[str, Any] | None:
-        """Get cached data if available and not expired."""
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(provider.encode())
+        hasher.update(b":")
+        hasher.update(json.dumps(params, sort_keys=True).encode())
+        return hasher.hexdigest()
 
-        db = await self._get_connection()
-        current_time = time.time()
+    def _remember(
+        self, provider: str, key: str, data: dict[str, Any], expires_at: float
+    ) -> None:
+        """Keep a private shallow copy of an entry in the in-process LRU tier."""
+
+        if self._memory_size <= 0:
+            return
+        memory_key = (provider, key)
+        self._memory[memory_key] = (expires_at, dict(data))
+        self._memory.move_to_end(memory_key)
+        if len(self._memory) > self._memory_size:
+            self._memory.popitem(last=False)
+
+    async def get(self, provider: str, key: str) -> dict[str, Any] | None:
+        """Get cached data if available and not expired.
 
-        async with db.execute(
-            """
-            SELECT data FROM cache_entries
-            WHERE cache_key = ? AND provider = ? AND expires_at > ?
-            """,
-            (key, provider, current_time),
-        ) as cursor:
-            row = await cursor.fetchone()
+        Hits served from the in-process tier return a shallow copy, so
+        rebinding top-level keys on the result never leaks into later hits.
+        """
 
-        if row is None:
+        current_time = time.time()
+        memory_key = (provider, key)
+        remembered = self._memory.get(memory_key)
+        if remembered is not None:
+            expires_at, data = remembered
+            if expires_at > current_time:
+                self._memory.move_to_end(memory_key)
+                self._hits += 1
+                self._access_counts[key] += 1
+                return dict(data)
+            del self._memory[memory_key]
+
+        entry = await self._run(_fetch_entry, provider, key, current_time)
+        if entry is None:
             self._misses += 1
             return None
 
         self._hits += 1
-        data_json = row[0]
-        return cast(dict[str, Any], json.loads(data_json))
+        self._access_counts[key] += 1
+        data, expires_at = entry
+        self._remember(provider, key, data, expires_at)
+        return data
 
     async def set(
         self,
@@ -83,39 +280,112 @@ class ProviderCache:
     ) -> None:
         """Store data in cache with TTL."""
 
-        db = await self._get_connection()
         ttl_seconds = ttl if ttl is not None else self.default_ttl
 
         current_time = time.time()
         expires_at = current_time + ttl_seconds
-        data_json = json.dumps(data)
-
-        await db.execute(
-            """
-            INSERT OR REPLACE INTO cache_entries
-            (cache_key, provider, data, expires_at, created_at)
-            VALUES (?, ?, ?, ?, ?)
-            """,
-            (key, provider, data_json, expires_at, current_time),
+        payload = _encode_payload(data)
+
+        await self._run(
+            sqlite3.Connection.execute,
+            _UPSERT_ENTRY_SQL,
+            (key, provider, payload, expires_at, current_time),
         )
-        await db.commit()
+        self._remember(provider, key, data, expires_at)
+        await self._maybe_optimize()
+
+    async def set_many(
+        self,
+        entries: Iterable[tuple[str, str, dict[str, Any], int | None]],
+    ) -> None:
+        """Store several `(provider, key, data, ttl)` entries in one transaction."""
+
+        current_time = time.time()
+        batch = [
+            (
+                provider,
+                key,
+                data,
+                current_time + (ttl if ttl is not None else self.default_ttl),
+            )
+            for provider, key, data, ttl in entries
+        ]
+        if not batch:
+            return
+
+        await self._run(
+            _write_entries,
+            [
+                (key, provider, _encode_payload(data), expires_at, current_time)
+                for provider, key, data, expires_at in batch
+            ],
+        )
+        for provider, key, data, expires_at in batch:
+            self._remember(provider, key, data, expires_at)
+        await self._maybe_optimize()
 
     async def clear(self) -> None:
         """Clear all cache entries."""
 
-        db = await self._get_connection()
-        await db.execute("DELETE FROM cache_entries")
-        await db.commit()
+        await self._run(sqlite3.Connection.executescript, _CLEAR_SQL)
+        self._memory.clear()
+        self._access_counts.clear()
 
     async def cleanup_expired(self) -> None:
         """Remove expired cache entries."""
 
-        db = await self._get_connection()
         current_time = time.time()
-        await db.execute(
-            "DELETE FROM cache_entries WHERE expires_at <= ?", (current_time,)
-        )
-        await db.commit()
+        for memory_key in [
+            memory_key
+            for memory_key, (expires_at, _data) in self._memory.items()
+            if expires_at <= current_time
+        ]:
+            del self._memory[memory_key]
+
+        # Delete in bounded batches so a large purge never holds the write lock
+        # long enough to stall concurrent readers.
+        while True:
+            deleted = await self._run(
+                _delete_expired_batch, current_time, self._CLEANUP_BATCH_SIZE
+            )
+            if deleted < self._CLEANUP_BATCH_SIZE:
+                break
+
+        await self._run(sqlite3.Connection.execute, _DELETE_ORPHAN_ACCESS_SQL)
+
+    async def _warm_memory(self) -> None:
+        """Preload the hottest entries from earlier sessions into memory."""
+
+        try:
+            entries = await self._run(
+                _fetch_hottest, time.time(), min(self._warm_size, self._memory_size)
+            )
+        except sqlite3.Error:
+            # Warming is best-effort; a cold tier is still correct.
+            return
+        # Iterate coldest-first so the hottest entries end up most recent.
+        for provider, key, data, expires_at in reversed(entries):
+            if (provider, key) not in self._memory:
+                self._remember(provider, key, data, expires_at)
+
+    async def _maybe_optimize(self) -> None:
+        """Refresh planner statistics periodically while writes keep coming."""
+
+        now = time.monotonic()
+        if now - self._last_optimize < self._OPTIMIZE_INTERVAL:
+            return
+        self._last_optimize = now
+        await self._run(sqlite3.Connection.execute, "PRAGMA optimize")
+
+    async def _flush_access_counts(self) -> None:
+        """Persist buffered hit counts in a single transaction."""
+
+        if not self._access_counts:
+            return
+        current_time = time.time()
+        rows = [(key, hits, current_time) for key, hits in self._access_counts.items()]
+        self._access_counts.clear()
+        await self._run(_record_access, rows)
 
     def get_stats(self) -> dict[str, int | float]:
         """Get cache statistics."""
@@ -133,14 +403,24 @@ class ProviderCache:
     async def close(self) -> None:
         """Close database connection."""
 
+        if self._warm_task is not None:
+            await self._warm_task
+            self._warm_task = None
         if self._db is not None:
-            await self._db.close()
-            self._db = None
+            await self._flush_access_counts()
+            # Let SQLite re-analyze tables whose contents changed enough to
+            # matter so TTL churn does not degrade the lookup plan over time.
+            await self._run(sqlite3.Connection.execute, "PRAGMA optimize")
+            async with self._lock:
+                await asyncio.to_thread(self._db.close)
+                self._db = None
 
     async def __aenter__(self) -> ProviderCache:
         """Async context manager entry."""
 
         await self._get_connection()
+        if self._warm_size > 0 and self._memory_size > 0:
+            self._warm_task = asyncio.create_task(self._warm_memory())
         return self
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
@@ -1,5 +1,6 @@
 -- Canonical schema for the NameGnome cache database.
--- This mirrors migration 0001_initial.sql and is provided for reference / tooling.
+-- This mirrors the cumulative result of the bundled migrations and is provided
+-- for reference / tooling.
 
 CREATE TABLE IF NOT EXISTS kv (
     k TEXT PRIMARY KEY,
@@ -63,7 +64,7 @@ CREATE TABLE IF NOT EXISTS locks (
 CREATE TABLE IF NOT EXISTS cache_entries (
     cache_key TEXT PRIMARY KEY,
     provider TEXT NOT NULL,
-    data TEXT NOT NULL,
+    data BLOB NOT NULL,
     expires_at REAL NOT NULL,
     created_at REAL NOT NULL
 );
@@ -77,8 +78,17 @@ CREATE INDEX IF NOT EXISTS idx_episodes_series_season_ep
 CREATE INDEX IF NOT EXISTS idx_tracks_album_disc_track
     ON tracks (album_id, disc, track);
 
-CREATE INDEX IF NOT EXISTS idx_cache_entries_provider
-    ON cache_entries (provider);
+CREATE INDEX IF NOT EXISTS idx_cache_entries_lookup
+    ON cache_entries (cache_key, provider, expires_at);
 
 CREATE INDEX IF NOT EXISTS idx_cache_entries_expires
     ON cache_entries (expires_at);
+
+CREATE TABLE IF NOT EXISTS cache_access (
+    cache_key TEXT PRIMARY KEY,
+    hit_count INTEGER NOT NULL DEFAULT 0,
+    last_access_at REAL NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_cache_access_hit_count
+    ON cache_access (hit_count);
@@ -5,22 +5,16 @@ of the scan→plan→apply pipeline, handling rollback manifests, structured log
 and Rich console output.
 """
 
-import json
+from __future__ import annotations
+
+import mmap
+import os
 import time
-from collections.abc import Sequence
+import uuid
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Literal
-
-import structlog
-from rich.console import Console
-from rich.progress import (
-    BarColumn,
-    Progress,
-    SpinnerColumn,
-    TaskProgressColumn,
-    TextColumn,
-)
+from typing import TYPE_CHECKING, Any, Literal
 
 from namegnome_serve.fs.fs_ops import (
     ApplyOutcome,
@@ -30,6 +24,13 @@ from namegnome_serve.fs.fs_ops import (
 )
 from namegnome_serve.fs.manifest import RollbackWriter
 from namegnome_serve.routes.schemas import PlanItem
+from namegnome_serve.utils.json_codec import loads
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    # structlog and Rich are imported when an ApplyChain is built so that
+    # importing this module (e.g. from CLI commands that never apply) stays cheap.
+    from rich.console import Console
+    from rich.progress import Progress
 
 Mode = Literal["transactional", "continue_on_error", "dry_run"]
 OnCollision = Literal["backup", "overwrite", "skip"]
@@ -54,6 +55,28 @@ class ApplyOptions:
     hash_before: bool = False
 
 
+def _iter_manifest_reverse(manifest_path: Path) -> Iterator[dict[str, Any]]:
+    """Yield manifest entries (header excluded) from last to first.
+
+    Lines are located with ``rfind`` on a memory map and decoded one at a time,
+    so only the pages actually touched are read and no entry list is built.
+    """
+    with open(manifest_path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Entries start after the header line
+            body_start = mm.find(b"\n") + 1 or size
+            end = size
+            while end > body_start:
+                start = mm.rfind(b"\n", body_start, end) + 1 or body_start
+                line = mm[start:end]
+                if line.strip():
+                    yield loads(line)
+                end = start - 1
+
+
 class ApplyChain:
     """Orchestrates apply operations with rollback manifests and structured logging.
 
@@ -69,6 +92,9 @@ class ApplyChain:
             logger: Optional structlog logger instance
             ui: Optional Rich console for output
         """
+        import structlog
+        from rich.console import Console
+
         self._logger = logger or structlog.get_logger()
         self._ui = ui or Console()
 
@@ -92,9 +118,7 @@ class ApplyChain:
         """Apply items with enhanced logging and Rich output."""
         root_path = Path(opts.root)
 
-        # Generate report ID
-        import uuid
-
+        # Generate report ID (shared with the manifest written below)
         report_id = str(uuid.uuid4())
 
         # Bind logger context with report_id
@@ -119,6 +143,7 @@ class ApplyChain:
                 plan_id=opts.plan_id,
                 mode=opts.mode,
                 on_collision=opts.on_collision,
+                report_id=report_id,
             )
 
             # Update progress
@@ -145,14 +170,27 @@ class ApplyChain:
             return result
 
     def _create_progress(self) -> Progress:
-        """Create Rich progress display."""
+        """Create Rich progress display.
+
+        The display is transient and refreshed at a fixed, low rate so the
+        live region is not re-rendered more often than a terminal can show.
+        """
+        from rich.progress import (
+            BarColumn,
+            Progress,
+            SpinnerColumn,
+            TaskProgressColumn,
+            TextColumn,
+        )
+
         return Progress(
             SpinnerColumn(),
             TextColumn("[bold blue]{task.description}"),
             BarColumn(),
             TaskProgressColumn(),
             console=self._ui,
-            transient=False,
+            transient=True,
+            refresh_per_second=10,
         )
 
     async def _apply_item_with_logging(
@@ -163,7 +201,7 @@ class ApplyChain:
         bound_logger: Any,
     ) -> ApplyOutcome:
         """Apply a single item with logging."""
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
 
         # Apply the item
         outcome = rename_with_rollback(
@@ -175,7 +213,7 @@ class ApplyChain:
             hash_before=opts.hash_before,
         )
 
-        elapsed_ms = int((time.time() - start_time) * 1000)
+        elapsed_ms = (time.monotonic_ns() - start_ns) // 1_000_000
 
         # Log the item result
         bound_logger.info(
@@ -224,23 +262,20 @@ class ApplyChain:
             self._ui.print("❌ [red]No manifest found for rollback[/red]")
             return
 
-        with open(manifest_path) as f:
-            lines = f.readlines()
-
-        # Skip header, process entries in reverse
-        entries = [json.loads(line) for line in lines[1:] if line.strip()]
-
-        for entry in reversed(entries):
+        for entry in _iter_manifest_reverse(manifest_path):
             if entry.get("status") == "applied" and entry.get("op") == "rename":
-                src = Path(entry["src_before"])
-                dst = Path(entry["dst_after"])
+                src = entry["src_before"]
+                name = os.path.basename(src)
 
                 try:
-                    # Restore original file
-                    if dst.exists():
-                        dst.rename(src)
-                    self._ui.print(f"↩️ [blue]Restored[/blue] {src.name}")
+                    # Restore original file; a missing destination raises
+                    # FileNotFoundError, so no separate exists() stat is needed.
+                    os.rename(entry["dst_after"], src)
+                except FileNotFoundError:
+                    continue
                 except OSError as e:
-                    self._ui.print(f"❌ [red]Failed to restore[/red] {src.name}: {e}")
+                    self._ui.print(f"❌ [red]Failed to restore[/red] {name}: {e}")
+                    continue
+                self._ui.print(f"↩️ [blue]Restored[/blue] {name}")
 
         self._ui.print("✅ [green]Rollback completed[/green]")
@@ -1,6 +1,24 @@
 """CLI entrypoints for NameGnome Serve."""
 
-from namegnome_serve.cli.cache import app as cache_app
-from namegnome_serve.cli.plan import app as plan_app
+from __future__ import annotations
+
+import importlib
+from typing import Any
 
 __all__ = ["cache_app", "plan_app"]
+
+# Sub-apps are imported on first access so that loading one command group
+# (e.g. ``cache``) does not pull in the planning stack behind ``plan``.
+_LAZY_APPS = {
+    "cache_app": "namegnome_serve.cli.cache",
+    "plan_app": "namegnome_serve.cli.plan",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_APPS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    app = importlib.import_module(module_name).app
+    globals()[name] = app
+    return app
@@ -14,7 +14,7 @@ else:  # pragma: no cover - runtime fallback for typing
     typer = importlib.import_module("typer")
     TyperType = Any
 
-from namegnome_serve.cache.migrations import apply_migrations
+from namegnome_serve.cache.migrations import apply_migrations, schema_is_current
 from namegnome_serve.cache.paths import resolve_cache_db_path
 
 app: TyperType = typer.Typer(help="Manage the NameGnome cache database.")
@@ -32,6 +32,13 @@ def migrate(db_path: DbPathOption = None) -> None:
     """Apply cache migrations to ensure schema is up-to-date."""
 
     resolved_path = resolve_cache_db_path(db_path)
+    if schema_is_current(resolved_path):
+        typer.secho(
+            f"Cache schema already up-to-date at {resolved_path}",
+            fg=typer.colors.GREEN,
+        )
+        return
+
     asyncio.run(apply_migrations(resolved_path))
     typer.secho(f"Migrations applied to {resolved_path}", fg=typer.colors.GREEN)
 
@@ -4,8 +4,8 @@ from __future__ import annotations
 
 import asyncio
 import importlib
-import json
 from collections.abc import Sequence
+from contextlib import suppress
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Annotated, Any
@@ -19,9 +19,11 @@ else:  # pragma: no cover - runtime fallback for typing
 
 from namegnome_serve.cache.migrations import apply_migrations
 from namegnome_serve.cache.paths import resolve_cache_db_path
+from namegnome_serve.cache.provider_cache import ProviderCache
 from namegnome_serve.chains.plan_chain import PlanChain
 from namegnome_serve.core.plan_service import create_plan_engine
 from namegnome_serve.core.scanner import scan
+from namegnome_serve.utils.json_codec import dumps_indented
 
 app: TyperType = typer.Typer(help="Generate planning previews with PlanReview output.")
 
@@ -73,28 +75,57 @@ def generate_plan(  # noqa: D401
         )
         raise typer.Exit(code=1) from exc
 
-    try:
-        engine = create_plan_engine()
-    except ValueError as exc:  # Missing API keys, etc.
-        typer.secho(
-            f"Failed to create plan engine: {exc}", err=True, fg=typer.colors.RED
-        )
-        raise typer.Exit(code=1) from exc
-
-    chain = PlanChain(engine)
-
-    scan_result = scan(paths=[root], media_type=media_type)  # type: ignore[arg-type]
-    generated_at = datetime.now(UTC)
+    async def _scan_and_plan() -> dict[str, object] | str:
+        # Provider lookups persist to the on-disk cache, so later runs are
+        # answered from it (stale rows are refreshed in the background)
+        async with ProviderCache(cache_path) as provider_cache:
+            try:
+                engine = create_plan_engine(provider_cache=provider_cache)
+            except ValueError as exc:  # Missing API keys, etc.
+                typer.secho(
+                    f"Failed to create plan engine: {exc}",
+                    err=True,
+                    fg=typer.colors.RED,
+                )
+                raise typer.Exit(code=1) from exc
 
-    result = asyncio.run(
-        chain.plan(
+            try:
+                return await _plan_with(engine)
+            finally:
+                # Finish background refreshes and close pooled provider
+                # connections before the cache and the loop go away
+                aclose = getattr(engine, "aclose", None)
+                if callable(aclose):
+                    await aclose()
+
+    async def _plan_with(engine: Any) -> dict[str, object] | str:
+        # Provider logins overlap the filesystem scan instead of delaying
+        # the first lookup
+        warmup = getattr(engine, "warmup", None)
+        warming = asyncio.ensure_future(warmup()) if callable(warmup) else None
+        try:
+            scan_result = await asyncio.to_thread(
+                scan,
+                paths=[root],
+                media_type=media_type,  # type: ignore[arg-type]
+            )
+        except BaseException:
+            if warming is not None:
+                warming.cancel()
+                with suppress(asyncio.CancelledError):
+                    await warming
+            raise
+        if warming is not None:
+            await warming
+        return await PlanChain(engine).plan(
             scan_result=scan_result,
             plan_id=plan_id,
             scan_id=scan_id,
-            generated_at=generated_at,
+            generated_at=datetime.now(UTC),
             as_json=json_output,
         )
-    )
+
+    result = asyncio.run(_scan_and_plan())
 
     if json_output:
         typer.echo(result)
@@ -105,7 +136,7 @@ def generate_plan(  # noqa: D401
         raise typer.Exit(code=1)
 
     result_dict: dict[str, object] = result
-    typer.echo(json.dumps(result_dict, indent=2, sort_keys=True))
+    typer.echo(dumps_indented(result_dict, sort_keys=True).decode("utf-8"))
 
     if verbose:
         summary = result_dict.get("summary", {})
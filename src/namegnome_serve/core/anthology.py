@@ -5,40 +5,67 @@ from __future__ import annotations
 import re
 from collections.abc import Iterable, Sequence
 from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import accumulate
 from typing import Any
 
 from namegnome_serve.routes.schemas import EpisodeSegment, MediaFile
 
-_STOPWORDS = {
-    "the",
-    "and",
-    "a",
-    "an",
-    "of",
-    "in",
-    "to",
-    "for",
-    "with",
-}
+_STOPWORDS: frozenset[str] = frozenset(
+    {
+        "the",
+        "and",
+        "a",
+        "an",
+        "of",
+        "in",
+        "to",
+        "for",
+        "with",
+    }
+)
 
+_TOKEN_RE = re.compile(r"[A-Za-z0-9']+")
 
-def _tokenize(text: str) -> set[str]:
-    tokens = [token.lower() for token in _split_tokens(text)]
-    return {token for token in tokens if token and token not in _STOPWORDS}
+# Preformatted "E00".."E999" episode tags; raw spans are rebuilt on every
+# simplification, so a tuple index beats a format-spec f-string per segment.
+_E_TAGS: tuple[str, ...] = tuple(f"E{number:02d}" for number in range(1000))
+
+# Sort key for missing segment bounds (they sort last)
+_INF = float("inf")
+
+
+@lru_cache(maxsize=4096)
+def _tokenize(text: str) -> frozenset[str]:
+    # The regex never yields empty tokens, so one C-level set difference is
+    # enough to drop stopwords.
+    return frozenset({token.lower() for token in _split_tokens(text)} - _STOPWORDS)
 
 
 def _split_tokens(text: str) -> list[str]:
-    return re.findall(r"[A-Za-z0-9']+", text or "")
+    return _TOKEN_RE.findall(text or "")
+
+
+@dataclass(slots=True)
+class _ProviderTokens:
+    """Provider episode titles encoded as token bitmasks.
+
+    Each distinct token is assigned one bit, so Jaccard similarity between two
+    titles reduces to popcounts of ``a & b`` and ``a | b`` on Python ints.
+    """
 
+    masks: dict[int, int] = field(default_factory=dict)
+    token_bits: dict[str, int] = field(default_factory=dict)
 
-def _similarity(tokens_a: Iterable[str], tokens_b: Iterable[str]) -> float:
-    set_a = set(tokens_a)
-    set_b = set(tokens_b)
-    if not set_a or not set_b:
-        return 0.0
-    intersection = len(set_a & set_b)
-    union = len(set_a | set_b)
-    return intersection / union if union else 0.0
+    def add(self, episode_number: int, tokens: Iterable[str]) -> None:
+        mask = 0
+        token_bits = self.token_bits
+        for token in tokens:
+            bit = token_bits.get(token)
+            if bit is None:
+                bit = token_bits[token] = 1 << len(token_bits)
+            mask |= bit
+        self.masks[episode_number] = mask
 
 
 @dataclass(slots=True)
@@ -51,6 +78,110 @@ class SimplifyResult:
     punt_to_llm: bool = False
 
 
+# (start, end, title_tokens, raw_span, source) -- hashable, so it can key caches
+_SegmentRow = tuple[Any, Any, tuple[str, ...], Any, str]
+# (season value, episode number value, title) as read from a provider payload
+_EpisodeFields = tuple[Any, Any, str]
+
+
+def _segment_row(segment: Any) -> _SegmentRow:
+    if isinstance(segment, EpisodeSegment):
+        # Read fields directly; model_dump() would run the serializer (and
+        # deep-copy) just to produce a throwaway dict.
+        return (
+            segment.start,
+            segment.end,
+            tuple(segment.title_tokens),
+            segment.raw_span,
+            segment.source,
+        )
+    data = dict(segment)
+    return (
+        data.get("start"),
+        data.get("end"),
+        tuple(data.get("title_tokens") or ()),
+        data.get("raw_span"),
+        data.get("source") or "unknown",
+    )
+
+
+def _episode_fields(episode: dict[str, Any]) -> _EpisodeFields:
+    season_value = (
+        episode.get("seasonNumber")
+        or episode.get("SeasonNumber")
+        or episode.get("season")
+        or episode.get("season_number")
+    )
+    number_value = (
+        episode.get("number")
+        or episode.get("episodeNumber")
+        or episode.get("EpisodeNumber")
+        or episode.get("episode")
+    )
+    title = (
+        episode.get("name") or episode.get("episodeName") or episode.get("title") or ""
+    )
+    return season_value, number_value, title
+
+
+@dataclass(slots=True)
+class _Segments:
+    """Mutable anthology segments stored column-wise, one list per field.
+
+    The simplification passes only look at starts and ends, so keeping them in
+    parallel lists avoids a dict lookup per field access.
+    """
+
+    starts: list[int | None] = field(default_factory=list)
+    ends: list[int | None] = field(default_factory=list)
+    tokens: list[tuple[str, ...]] = field(default_factory=list)
+    raw_spans: list[str | None] = field(default_factory=list)
+    sources: list[str] = field(default_factory=list)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[_SegmentRow]) -> _Segments:
+        columns = cls()
+        for start, end, tokens, raw_span, source in rows:
+            columns.starts.append(start)
+            columns.ends.append(end)
+            columns.tokens.append(tokens)
+            columns.raw_spans.append(raw_span)
+            columns.sources.append(source)
+        return columns
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def reorder(self, order: Sequence[int]) -> None:
+        self.starts[:] = [self.starts[i] for i in order]
+        self.ends[:] = [self.ends[i] for i in order]
+        self.tokens[:] = [self.tokens[i] for i in order]
+        self.raw_spans[:] = [self.raw_spans[i] for i in order]
+        self.sources[:] = [self.sources[i] for i in order]
+
+    def to_rows(self) -> tuple[_SegmentRow, ...]:
+        return tuple(
+            zip(
+                self.starts,
+                self.ends,
+                self.tokens,
+                self.raw_spans,
+                self.sources,
+                strict=True,
+            )
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class _Simplification:
+    """Immutable outcome of the simplification passes (safe to cache)."""
+
+    rows: tuple[_SegmentRow, ...]
+    warnings: tuple[str, ...]
+    confidence: float
+    punt_to_llm: bool
+
+
 def interval_simplify(
     media_file: MediaFile,
     provider_episodes: Sequence[dict[str, Any]],
@@ -58,21 +189,75 @@ def interval_simplify(
     """Simplify anthology episode segments before invoking the LLM."""
 
     original_segments = media_file.segments or []
-    mutable_segments: list[dict[str, Any]] = [
-        segment.model_dump() if hasattr(segment, "model_dump") else dict(segment)
-        for segment in original_segments
+    if not original_segments:
+        return SimplifyResult(segments=list(original_segments), warnings=[])
+
+    rows = tuple(_segment_row(segment) for segment in original_segments)
+    episodes = tuple(_episode_fields(episode) for episode in provider_episodes)
+    try:
+        outcome = _simplify_rows_cached(rows, media_file.parsed_season, episodes)
+    except TypeError:  # unhashable provider values; simplify without caching
+        outcome = _simplify_rows(rows, media_file.parsed_season, episodes)
+
+    validated = all(
+        isinstance(segment, EpisodeSegment) for segment in original_segments
+    )
+    if validated and outcome.rows == rows:
+        simplified_segments = list(original_segments)
+    else:
+        simplified_segments = _rows_to_models(outcome.rows, validated=validated)
+
+    return SimplifyResult(
+        segments=simplified_segments,
+        warnings=list(outcome.warnings),
+        confidence=outcome.confidence,
+        punt_to_llm=outcome.punt_to_llm,
+    )
+
+
+def _rows_to_models(
+    rows: Iterable[_SegmentRow], *, validated: bool
+) -> list[EpisodeSegment]:
+    if validated:
+        # Values came from validated models and every pass keeps start <= end,
+        # so pydantic's no-validation constructor is safe.
+        return [
+            EpisodeSegment.model_construct(
+                start=start,
+                end=end,
+                title_tokens=list(tokens),
+                raw_span=raw_span,
+                source=source,
+            )
+            for start, end, tokens, raw_span, source in rows
+        ]
+    return [
+        EpisodeSegment.model_validate(
+            {
+                "start": start,
+                "end": end,
+                "title_tokens": list(tokens),
+                "raw_span": raw_span,
+                "source": source,
+            }
+        )
+        for start, end, tokens, raw_span, source in rows
     ]
 
+
+def _simplify_rows(
+    rows: tuple[_SegmentRow, ...],
+    season: int | None,
+    episodes: tuple[_EpisodeFields, ...],
+) -> _Simplification:
+    mutable_segments = _Segments.from_rows(rows)
+
     warnings: list[str] = []
     confidence = 1.0
 
-    if not mutable_segments:
-        return SimplifyResult(segments=list(original_segments), warnings=warnings)
-
     _normalise_segments(mutable_segments)
 
-    season = media_file.parsed_season
-    provider_map, season_bounds = _build_provider_lookup(provider_episodes, season)
+    provider_map, season_bounds = _build_provider_lookup(episodes, season)
 
     if season_bounds is not None:
         changed = _clamp_to_bounds(mutable_segments, season_bounds)
@@ -93,18 +278,12 @@ def interval_simplify(
     if gap_detected:
         warnings.append("gap_unresolved")
 
-    singleton_applied = _maybe_singleton_collapse(
-        mutable_segments,
-        provider_map,
-        media_file,
-    )
+    singleton_applied = _maybe_singleton_collapse(mutable_segments, provider_map)
     if singleton_applied:
         warnings.append("singleton_collapse")
         confidence = _deduct(confidence, 0.05)
 
-    ambiguous_segment = any(
-        seg.get("start") is None or seg.get("end") is None for seg in mutable_segments
-    )
+    ambiguous_segment = None in mutable_segments.starts or None in mutable_segments.ends
     if ambiguous_segment:
         warnings.append("ambiguous_segment")
 
@@ -123,55 +302,52 @@ def interval_simplify(
 
     _update_raw_spans(mutable_segments)
 
-    simplified_segments = [
-        EpisodeSegment.model_validate(segment) for segment in mutable_segments
-    ]
-
     if has_unresolved_overlap or gap_detected or ambiguous_segment:
         punt = True
 
-    return SimplifyResult(
-        segments=simplified_segments,
-        warnings=_deduplicate_preserve_order(warnings),
+    return _Simplification(
+        rows=mutable_segments.to_rows(),
+        warnings=tuple(_deduplicate_preserve_order(warnings)),
         confidence=confidence,
         punt_to_llm=punt,
     )
 
 
-def _normalise_segments(segments: list[dict[str, Any]]) -> None:
-    segments.sort(
-        key=lambda seg: (
-            seg.get("start") if isinstance(seg.get("start"), int) else float("inf"),
-            seg.get("end") if isinstance(seg.get("end"), int) else float("inf"),
-        )
-    )
+# Planning retries and repeated passes simplify the same files against the
+# same provider listings; results are immutable tuples, so they can be shared.
+_simplify_rows_cached = lru_cache(maxsize=512)(_simplify_rows)
 
-    for segment in segments:
-        start = segment.get("start")
-        end = segment.get("end")
 
-        if isinstance(start, int) and end is None:
-            segment["end"] = start
-        elif start is None and isinstance(end, int):
-            segment["start"] = end
-        elif isinstance(start, int) and isinstance(end, int) and end < start:
-            segment["start"], segment["end"] = end, start
+def _normalise_segments(segments: _Segments) -> None:
+    starts = segments.starts
+    ends = segments.ends
+    # Build every sort key in one comprehension and sort indices by a C-level
+    # lookup, instead of calling a Python lambda per segment.
+    keys = [
+        (start if start is not None else _INF, end if end is not None else _INF)
+        for start, end in zip(starts, ends, strict=True)
+    ]
+    order = sorted(range(len(keys)), key=keys.__getitem__)
+    if any(position != index for position, index in enumerate(order)):
+        segments.reorder(order)
+
+    for idx, (start, end) in enumerate(zip(starts, ends, strict=True)):
+        if start is not None and end is None:
+            ends[idx] = start
+        elif start is None and end is not None:
+            starts[idx] = end
+        elif start is not None and end is not None and end < start:
+            starts[idx], ends[idx] = end, start
 
 
 def _build_provider_lookup(
-    provider_episodes: Sequence[dict[str, Any]],
+    episodes: Iterable[_EpisodeFields],
     season: int | None,
-) -> tuple[dict[int, set[str]], tuple[int, int] | None]:
-    tokens_map: dict[int, set[str]] = {}
+) -> tuple[_ProviderTokens, tuple[int, int] | None]:
+    tokens_map = _ProviderTokens()
     episode_numbers: list[int] = []
 
-    for episode in provider_episodes:
-        season_value = (
-            episode.get("seasonNumber")
-            or episode.get("SeasonNumber")
-            or episode.get("season")
-            or episode.get("season_number")
-        )
+    for season_value, number_value, title in episodes:
         if (
             season is not None
             and season_value is not None
@@ -179,23 +355,11 @@ def _build_provider_lookup(
         ):
             continue
 
-        number_value = (
-            episode.get("number")
-            or episode.get("episodeNumber")
-            or episode.get("EpisodeNumber")
-            or episode.get("episode")
-        )
         if number_value is None:
             continue
 
         number = int(number_value)
-        title = (
-            episode.get("name")
-            or episode.get("episodeName")
-            or episode.get("title")
-            or ""
-        )
-        tokens_map[number] = _tokenize(title)
+        tokens_map.add(number, _tokenize(title))
         episode_numbers.append(number)
 
     bounds = None
@@ -205,50 +369,60 @@ def _build_provider_lookup(
     return tokens_map, bounds
 
 
-def _clamp_to_bounds(segments: list[dict[str, Any]], bounds: tuple[int, int]) -> bool:
+def _clamp_to_bounds(segments: _Segments, bounds: tuple[int, int]) -> bool:
     changed = False
     lower, upper = bounds
+    starts = segments.starts
+    ends = segments.ends
+
+    # Common case: everything is already in bounds. min()/max() run in C, so
+    # check that before walking (and mutating) the segments one by one.
+    known_starts = [start for start in starts if start is not None]
+    known_ends = [end for end in ends if end is not None]
+    if (not known_starts or min(known_starts) >= lower) and (
+        not known_ends or max(known_ends) <= upper
+    ):
+        return False
 
-    for segment in segments:
-        start = segment.get("start")
-        end = segment.get("end")
+    for idx in range(len(segments)):
+        start = starts[idx]
+        end = ends[idx]
 
-        if isinstance(start, int) and start < lower:
-            segment["start"] = lower
+        if start is not None and start < lower:
+            start = starts[idx] = lower
             changed = True
-        if isinstance(end, int) and end > upper:
-            segment["end"] = upper
+        if end is not None and end > upper:
+            end = ends[idx] = upper
             changed = True
 
-        if (
-            isinstance(segment.get("start"), int)
-            and isinstance(segment.get("end"), int)
-            and segment["end"] < segment["start"]
-        ):
-            segment["end"] = segment["start"]
+        if start is not None and end is not None and end < start:
+            ends[idx] = start
 
     return changed
 
 
 def _resolve_simple_overlaps(
-    segments: list[dict[str, Any]],
+    segments: _Segments,
     warnings: list[str],
 ) -> tuple[bool, int]:
     has_unresolved = False
     resolved_count = 0
 
-    for idx in range(len(segments) - 1):
-        current = segments[idx]
-        nxt = segments[idx + 1]
+    if len(segments) < 2:
+        return has_unresolved, resolved_count
+
+    starts = segments.starts
+    ends = segments.ends
 
-        curr_start = current.get("start")
-        curr_end = current.get("end")
-        next_start = nxt.get("start")
-        next_end = nxt.get("end")
+    for idx in range(len(segments) - 1):
+        curr_start = starts[idx]
+        curr_end = ends[idx]
+        next_start = starts[idx + 1]
+        next_end = ends[idx + 1]
 
-        if not isinstance(curr_start, int) or not isinstance(curr_end, int):
+        if curr_start is None or curr_end is None:
             continue
-        if not isinstance(next_start, int) or not isinstance(next_end, int):
+        if next_start is None or next_end is None:
             continue
 
         if curr_end < next_start:
@@ -256,9 +430,7 @@ def _resolve_simple_overlaps(
 
         if curr_end == next_start:
             # Trim the boundary episode from the first segment.
-            current["end"] = curr_end - 1
-            if current["end"] < curr_start:
-                current["end"] = curr_start
+            ends[idx] = max(curr_end - 1, curr_start)
             warnings.append("overlap_resolved")
             resolved_count += 1
         else:
@@ -267,39 +439,36 @@ def _resolve_simple_overlaps(
     return has_unresolved, resolved_count
 
 
-def _detect_gaps(segments: list[dict[str, Any]]) -> bool:
-    previous_end: int | None = None
-    gap_detected = False
-
-    for segment in segments:
-        start = segment.get("start")
-        end = segment.get("end")
-
-        if not isinstance(start, int) or not isinstance(end, int):
-            continue
-
-        if previous_end is not None and start > previous_end + 1:
-            gap_detected = True
-
-        previous_end = max(previous_end or end, end)
+def _detect_gaps(segments: _Segments) -> bool:
+    spans = [
+        (start, end)
+        for start, end in zip(segments.starts, segments.ends, strict=True)
+        if start is not None and end is not None
+    ]
+    if len(spans) < 2:
+        return False
 
-    return gap_detected
+    # A gap exists when a segment starts more than one episode after the
+    # furthest end seen so far (running maximum of the preceding ends).
+    furthest_ends = accumulate((end for _, end in spans[:-1]), max)
+    return any(
+        start > furthest + 1
+        for (start, _), furthest in zip(spans[1:], furthest_ends, strict=True)
+    )
 
 
 def _maybe_singleton_collapse(
-    segments: list[dict[str, Any]],
-    provider_tokens: dict[int, set[str]],
-    media_file: MediaFile,
+    segments: _Segments,
+    provider_tokens: _ProviderTokens,
 ) -> bool:
     if len(segments) != 1:
         return False
 
-    segment = segments[0]
-    start = segment.get("start")
-    end = segment.get("end")
-    tokens = segment.get("title_tokens") or []
+    start = segments.starts[0]
+    end = segments.ends[0]
+    tokens = segments.tokens[0]
 
-    if not isinstance(start, int) or not isinstance(end, int) or start == end:
+    if start is None or end is None or start == end:
         return False
 
     if not tokens:
@@ -310,21 +479,40 @@ def _maybe_singleton_collapse(
     if matched_episode is None:
         return False
 
-    segment["start"] = matched_episode
-    segment["end"] = matched_episode
-    segment["raw_span"] = f"E{matched_episode:02d}"
+    segments.starts[0] = matched_episode
+    segments.ends[0] = matched_episode
+    segments.raw_spans[0] = _episode_tag(matched_episode)
     return True
 
 
 def _match_unique_episode(
     tokens: Iterable[str],
-    provider_tokens: dict[int, set[str]],
+    provider_tokens: _ProviderTokens,
     range_start: int,
     range_end: int,
 ) -> int | None:
+    segment_tokens = frozenset(tokens)
+    if not segment_tokens:
+        return None
+
+    # Tokens no provider title contains never intersect; they only widen the
+    # union, so count them instead of allocating bits for them.
+    segment_mask = 0
+    unknown_count = 0
+    for token in segment_tokens:
+        bit = provider_tokens.token_bits.get(token)
+        if bit is None:
+            unknown_count += 1
+        else:
+            segment_mask |= bit
+
     matches: list[tuple[float, int]] = []
-    for episode_number, candidate_tokens in provider_tokens.items():
-        similarity = _similarity(tokens, candidate_tokens)
+    for episode_number, candidate_mask in provider_tokens.masks.items():
+        if not candidate_mask:
+            continue
+        intersection = (segment_mask & candidate_mask).bit_count()
+        union = (segment_mask | candidate_mask).bit_count() + unknown_count
+        similarity = intersection / union
         if similarity >= 0.85:
             matches.append((similarity, episode_number))
 
@@ -341,20 +529,26 @@ def _match_unique_episode(
     return None
 
 
-def _update_raw_spans(segments: list[dict[str, Any]]) -> None:
-    for segment in segments:
-        start = segment.get("start")
-        end = segment.get("end")
-
-        if isinstance(start, int) and isinstance(end, int):
+def _update_raw_spans(segments: _Segments) -> None:
+    raw_spans = segments.raw_spans
+    for idx, (start, end) in enumerate(
+        zip(segments.starts, segments.ends, strict=True)
+    ):
+        if start is not None and end is not None:
             if end == start:
-                segment["raw_span"] = f"E{start:02d}"
+                raw_spans[idx] = _episode_tag(start)
             else:
-                segment["raw_span"] = f"E{start:02d}-E{end:02d}"
-        elif isinstance(start, int):
-            segment["raw_span"] = f"E{start:02d}"
+                raw_spans[idx] = f"{_episode_tag(start)}-{_episode_tag(end)}"
+        elif start is not None:
+            raw_spans[idx] = _episode_tag(start)
         else:
-            segment["raw_span"] = segment.get("raw_span") or ""
+            raw_spans[idx] = raw_spans[idx] or ""
+
+
+def _episode_tag(number: int) -> str:
+    if 0 <= number < len(_E_TAGS):
+        return _E_TAGS[number]
+    return f"E{number:02d}"
 
 
 def _deduct(confidence: float, amount: float) -> float:
@@ -54,9 +54,23 @@ MUSIC_EXTENSIONS: tuple[str, ...] = (
     ".alac",
 )
 
+#: Lowercase extension sets for membership tests (built once, shareable)
+TV_EXTENSIONS_SET: frozenset[str] = frozenset(ext.lower() for ext in TV_EXTENSIONS)
+MOVIE_EXTENSIONS_SET: frozenset[str] = frozenset(
+    ext.lower() for ext in MOVIE_EXTENSIONS
+)
+MUSIC_EXTENSIONS_SET: frozenset[str] = frozenset(
+    ext.lower() for ext in MUSIC_EXTENSIONS
+)
+
 #: All media extensions combined
-ALL_MEDIA_EXTENSIONS: set[str] = (
-    set(TV_EXTENSIONS) | set(MOVIE_EXTENSIONS) | set(MUSIC_EXTENSIONS)
+ALL_MEDIA_EXTENSIONS: frozenset[str] = (
+    TV_EXTENSIONS_SET | MOVIE_EXTENSIONS_SET | MUSIC_EXTENSIONS_SET
+)
+
+#: All media extensions without the leading dot (e.g. "mkv")
+ALL_MEDIA_EXTENSIONS_NODOT: frozenset[str] = frozenset(
+    ext[1:] for ext in ALL_MEDIA_EXTENSIONS
 )
 
 # ============================================================================
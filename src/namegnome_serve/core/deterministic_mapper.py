@@ -1,15 +1,37 @@
 """Deterministic mapper for mapping scan fields to provider entities."""
 
+import asyncio
+import inspect
+import os
+import re
+import sqlite3
+import sys
+import time
+import unicodedata
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from datetime import date
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
 
+import httpx
+
+from namegnome_serve.cache.provider_cache import ProviderCache
 from namegnome_serve.core.anthology import interval_simplify
+from namegnome_serve.core.constants import ALL_MEDIA_EXTENSIONS_NODOT
+from namegnome_serve.core.ttl_cache import (
+    NEGATIVE_TTL,
+    CoalescingTTLCache,
+    result_lifetime,
+)
 from namegnome_serve.metadata.providers import (
     MusicBrainzProvider,
     TheAudioDBProvider,
     TMDBProvider,
     TVDBProvider,
     TVMazeProvider,
+    create_http_client,
 )
 from namegnome_serve.routes.schemas import (
     EpisodeSegment,
@@ -17,6 +39,440 @@ from namegnome_serve.routes.schemas import (
     PlanItem,
     SourceRef,
 )
+from namegnome_serve.utils.fuzzy import token_set_ratio
+from namegnome_serve.utils.json_codec import dumps
+
+#: Provider title searches rarely change; keep them for a week
+_SEARCH_TTL = 7 * 24 * 60 * 60
+#: Episode lists and detail payloads pick up new airings daily
+_DETAILS_TTL = 24 * 60 * 60
+#: How long past its TTL a persisted result may still be served while a
+#: background refresh fetches a new copy
+_STALE_WINDOW = 30 * 24 * 60 * 60
+#: Normalised search queries whose results are kept for other spellings
+_LNRM_CACHE_SIZE = 1024
+#: Finished mappings kept for duplicate files of the same item
+_MAPPED_CACHE_SIZE = 4096
+#: Per-series episode indexes kept across files
+_EPISODE_INDEX_CACHE_SIZE = 256
+
+# Characters that are unsafe in a single path component on common
+# filesystems, mapped to readable stand-ins (or dropped)
+_PATH_TRANS = str.maketrans(
+    {
+        "/": "-",
+        "\\": "-",
+        ":": " -",
+        "*": "",
+        "?": "",
+        '"': "'",
+        "<": "",
+        ">": "",
+        "|": "-",
+        "\0": "",
+    }
+)
+
+#: Recordings requested per MusicBrainz search. Fielded queries put the real
+#: match near the top; a few runners-up are enough for fuzzy ranking, and the
+#: payload is a fraction of the provider's default 25
+_MUSICBRAINZ_SEARCH_LIMIT = 5
+
+# Lucene query syntax characters that must be escaped in MusicBrainz queries,
+# each mapped to its backslash-escaped form for a single translate() pass
+_LUCENE_ESCAPE = str.maketrans({char: f"\\{char}" for char in '+-!(){}[]^"~*?:\\/&|'})
+
+# First standalone four-digit run in a provider date such as "2021-05-03"
+_YEAR_RE = re.compile(r"(?<!\d)(\d{4})(?!\d)")
+_ASCII_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+# Trailing " (2005)" left on a title by loose parsing
+_TITLE_YEAR_RE = re.compile(r"\s*\((\d{4})\)\s*$")
+
+# Destination path templates, formatted once per plan item
+_TV_CODE = "S{season:02d}E{start:02d}"
+_TV_SPAN_CODE = "S{season:02d}E{start:02d}-E{end:02d}"
+_TV_SEASON_DIR = "/tv/{show}/Season {season:02d}"
+_TV_PATH = "{season_dir}/{show} - {code}.mkv"
+_TV_PATH_WITH_TITLE = "{season_dir}/{show} - {code} - {title}.mkv"
+_MOVIE_PATH = "/movies/{title} ({year})/{title} ({year}).mkv"
+_MUSIC_ALBUM_DIR = "/music/{artist}/{album}"
+_MUSIC_PATH = "{album_dir}/{track:02d} - {title}.flac"
+
+# Several search results: accept the closest only if it scores at least
+# _FUZZY_MIN_SCORE and beats the runner-up by _FUZZY_MIN_MARGIN points
+_FUZZY_MIN_SCORE = 90.0
+_FUZZY_MIN_MARGIN = 10.0
+#: Fuzzy picks never claim the confidence of a unique provider match
+_FUZZY_MAX_CONFIDENCE = 0.9
+# With a parsed year, points deducted from a result premiering in another
+# year, or from one whose year the provider does not report
+_YEAR_MISMATCH_PENALTY = 20.0
+_YEAR_UNKNOWN_PENALTY = 10.0
+
+_PERSIST_ERRORS = (sqlite3.Error, OSError, TypeError, ValueError)
+
+#: Files mapped at once by ``map_many`` unless NAMEGNOME_MAP_CONCURRENCY is set
+DEFAULT_MAP_CONCURRENCY = 8
+
+# TV fallbacks after TVDB, in priority order: (provider, label, confidence)
+_TV_FALLBACKS = (
+    ("tmdb", "TMDB", 0.85),
+    ("omdb", "OMDb", 0.7),  # only when an OMDb provider is configured
+    ("tvmaze", "TVMaze", 0.6),
+)
+
+#: Head start TVDB gets before the TV fallbacks are queried speculatively
+_TV_HEDGE_DELAY = 0.25
+
+# Lazily built providers that warmup() may construct to log them in
+_WARMUP_PROVIDERS = (
+    ("tvdb", TVDBProvider),
+    ("tmdb", TMDBProvider),
+    ("musicbrainz", MusicBrainzProvider),
+    ("theaudiodb", TheAudioDBProvider),
+    ("tvmaze", TVMazeProvider),
+)
+
+# Fields a TVDB search result may carry its premiere year in
+_SERIES_YEAR_FIELDS = ("year", "firstAired", "first_air_time")
+
+# Season/episode number fields across TVDB (v3 and v4) and TMDB payloads
+_SEASON_FIELDS = (
+    "seasonNumber",
+    "SeasonNumber",
+    "airedSeason",
+    "season",
+    "season_number",
+)
+_NUMBER_FIELDS = ("number", "episodeNumber", "airedEpisodeNumber", "episode_number")
+_TITLE_FIELDS = ("name", "episodeName", "title")
+
+
+def resolve_map_concurrency(default: int = DEFAULT_MAP_CONCURRENCY) -> int:
+    """Number of files to map at once, from ``NAMEGNOME_MAP_CONCURRENCY``.
+
+    Lower it (5 or less) if providers start timing out or rate limiting.
+    Unset, non-numeric or non-positive values fall back to ``default``.
+    """
+    raw = os.getenv("NAMEGNOME_MAP_CONCURRENCY", "").strip()
+    try:
+        value = int(raw)
+    except ValueError:
+        return default
+    return value if value > 0 else default
+
+
+def _safe(component: str) -> str:
+    """Make provider text safe to use as a single path component."""
+    return component.translate(_PATH_TRANS).strip()
+
+
+# Every episode of a season (and track of an album) shares its directory, so
+# the sanitised names and directory string are built once per show/album.
+@lru_cache(maxsize=1024)
+def _tv_season_dir(show_name: str, season: int) -> tuple[str, str]:
+    """Return ``(season_dir, safe_show_name)`` for a show's season."""
+    show = _safe(show_name)
+    return _TV_SEASON_DIR.format(show=show, season=season), show
+
+
+@lru_cache(maxsize=1024)
+def _music_album_dir(artist: str, album: str) -> str:
+    """Return the directory an album's tracks are placed in."""
+    return _MUSIC_ALBUM_DIR.format(artist=_safe(artist), album=_safe(album))
+
+
+def _lucene_escape(text: str) -> str:
+    """Escape Lucene query syntax so MusicBrainz treats ``text`` literally."""
+    return text.translate(_LUCENE_ESCAPE)
+
+
+def _is_searchable(title: str, artist: str) -> bool:
+    """Whether a parsed track is specific enough to be worth a search."""
+    title = title.strip()
+    return (
+        len(title) >= 2
+        and len(artist.strip()) >= 2
+        and any(char.isalpha() for char in title)
+    )
+
+
+def _lnrm(text: Any) -> str:
+    """Normalise a title for matching: no diacritics, case or punctuation.
+
+    ``"WALL·E"`` and ``"Wall-E"`` both become ``"walle"``; ``"Mr. Robot"``
+    and ``"Mr Robot"`` both become ``"mrrobot"``.
+    """
+    if not text:
+        return ""
+    return _lnrm_text(text if isinstance(text, str) else str(text))
+
+
+@lru_cache(maxsize=8192)
+def _lnrm_text(text: str) -> str:
+    """Memoised ``_lnrm`` body; files of one show repeat the same titles."""
+    if text.isascii():
+        # NFKD is the identity on ASCII, so one C-level regex pass suffices
+        return _ASCII_NON_ALNUM_RE.sub("", text.lower())
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(
+        char.lower()
+        for char in decomposed
+        if char.isalnum() and not unicodedata.combining(char)
+    )
+
+
+@lru_cache(maxsize=8192)
+def _query_key(text: str) -> str:
+    """Cache key for a search string: NFKC, casefolded, whitespace collapsed.
+
+    ``"The Office"`` and ``"the  office"`` share one cached provider result.
+    Memoised and interned so the files of one show build their cache keys
+    from a single shared string.
+    """
+    return sys.intern(" ".join(unicodedata.normalize("NFKC", text).casefold().split()))
+
+
+def _first_field(payload: dict[str, Any], fields: tuple[str, ...]) -> Any:
+    """Return the first of ``fields`` present (and not None) in ``payload``."""
+    for field in fields:
+        value = payload.get(field)
+        if value is not None:
+            return value
+    return None
+
+
+def _pick_name(*candidates: Any, default: str) -> str:
+    """Return the first truthy candidate as a string, else ``default``."""
+    for candidate in candidates:
+        if candidate:
+            return candidate if isinstance(candidate, str) else str(candidate)
+    return default
+
+
+def _episode_title(episode: dict[str, Any] | None) -> str | None:
+    """Return an episode's first non-empty title field, if any."""
+    if not episode:
+        return None
+    for field in _TITLE_FIELDS:
+        title = episode.get(field)
+        if title:
+            return str(title)
+    return None
+
+
+def _index_episodes(
+    episodes: Iterable[dict[str, Any]],
+) -> dict[tuple[int, int], dict[str, Any]]:
+    """Index episodes by ``(season, number)``; the first duplicate wins."""
+    index: dict[tuple[int, int], dict[str, Any]] = {}
+    for episode in episodes:
+        season = _first_field(episode, _SEASON_FIELDS)
+        number = _first_field(episode, _NUMBER_FIELDS)
+        if season is None or number is None:
+            continue
+        try:
+            index.setdefault((int(season), int(number)), episode)
+        except (TypeError, ValueError):
+            continue
+    return index
+
+
+def _series_lnrm_keys(series: dict[str, Any]) -> set[str]:
+    """Normalised keys for a TVDB series: its name plus any aliases."""
+    names = [series.get("name") or series.get("seriesName")]
+    names.extend(series.get("aliases") or ())
+    return {key for key in map(_lnrm, names) if key}
+
+
+def _recording_lnrm_keys(recording: dict[str, Any]) -> set[tuple[str, str]]:
+    """Normalised ``(title, artist)`` keys for a MusicBrainz recording."""
+    title = _lnrm(recording.get("title"))
+    if not title:
+        return set()
+    return {
+        (title, artist)
+        for credit in recording.get("artist-credit") or ()
+        if isinstance(credit, dict) and (artist := _lnrm(credit.get("name")))
+    }
+
+
+def _select_match(
+    query: str,
+    results: list[dict[str, Any]],
+    label_of: Callable[[dict[str, Any]], str],
+    provider: str,
+    warnings: list[str],
+    *,
+    year: int | None = None,
+    year_of: Callable[[dict[str, Any]], int | None] | None = None,
+) -> tuple[dict[str, Any], float] | None:
+    """Pick the result to map and its confidence.
+
+    A unique result is taken with confidence 1.0. Among several, the closest
+    by ``token_set_ratio`` is taken when it clears the score and margin
+    thresholds, with confidence scaled by its score; otherwise ``None``.
+    With ``year`` and ``year_of``, results from another or an unknown year
+    lose points, so a title match alone cannot beat the right year.
+    """
+    if len(results) == 1:
+        return results[0], 1.0
+
+    def score(result: dict[str, Any]) -> float:
+        title_score = token_set_ratio(query, label_of(result))
+        if year is None or year_of is None:
+            return title_score
+        result_year = year_of(result)
+        if result_year is None:
+            return title_score - _YEAR_UNKNOWN_PENALTY
+        if result_year != year:
+            return title_score - _YEAR_MISMATCH_PENALTY
+        return title_score
+
+    scored = sorted(
+        ((score(result), index) for index, result in enumerate(results)),
+        reverse=True,
+    )
+    best_score, best_index = scored[0]
+    runner_up = scored[1][0]
+    if best_score < _FUZZY_MIN_SCORE or best_score - runner_up < _FUZZY_MIN_MARGIN:
+        return None
+
+    warnings.append(
+        f"{provider} returned {len(results)} matches; picked the closest "
+        f"(score {best_score:.0f})."
+    )
+    return results[best_index], min(best_score / 100, _FUZZY_MAX_CONFIDENCE)
+
+
+def _recording_label(recording: dict[str, Any]) -> str:
+    """``"title artist"`` text of a MusicBrainz recording for fuzzy scoring."""
+    artists = " ".join(
+        str(credit.get("name") or "")
+        for credit in recording.get("artist-credit") or ()
+        if isinstance(credit, dict)
+    )
+    return f"{recording.get('title') or ''} {artists}"
+
+
+def _dispatch_key(media_file: MediaFile, media_type: str) -> tuple[Any, ...]:
+    """Sort key grouping files that share provider lookups."""
+    if media_type == "music":
+        return (
+            media_file.parsed_artist or "",
+            media_file.parsed_album or "",
+            media_file.parsed_track or 0,
+        )
+    if media_type == "movie":
+        return (media_file.parsed_title or "", media_file.parsed_year or 0)
+    return (
+        media_file.parsed_title or "",
+        media_file.parsed_season or 0,
+        media_file.parsed_episode or 0,
+    )
+
+
+def _clean_title(media_file: MediaFile, media_type: str) -> MediaFile:
+    """Strip a leftover file extension and, for video, a trailing year.
+
+    A stripped year fills ``parsed_year`` when the parser left it empty.
+    Track titles keep their year since "(1977)" often names a live take.
+    """
+    title = media_file.parsed_title
+    if not title:
+        return media_file
+
+    cleaned = title.strip()
+    stem, dot, extension = cleaned.rpartition(".")
+    if dot and stem and extension.lower() in ALL_MEDIA_EXTENSIONS_NODOT:
+        cleaned = stem.rstrip()
+
+    update: dict[str, Any] = {}
+    match = _TITLE_YEAR_RE.search(cleaned) if media_type != "music" else None
+    if match:
+        cleaned = cleaned[: match.start()]
+        if media_file.parsed_year is None:
+            update["parsed_year"] = int(match.group(1))
+    if cleaned != title:
+        update["parsed_title"] = cleaned
+    return media_file.model_copy(update=update) if update else media_file
+
+
+def _valid_tv(media_file: MediaFile) -> bool:
+    season, episode = media_file.parsed_season, media_file.parsed_episode
+    return (
+        bool(_lnrm(media_file.parsed_title))
+        and (season is None or season >= 0)
+        and (episode is None or episode >= 0)
+        # A specials folder without an episode number cannot be placed
+        and not (season == 0 and episode is None)
+    )
+
+
+def _valid_movie(media_file: MediaFile) -> bool:
+    return bool(_lnrm(media_file.parsed_title))
+
+
+def _valid_music(media_file: MediaFile) -> bool:
+    title, artist = media_file.parsed_title, media_file.parsed_artist
+    return (
+        bool(title and artist)
+        and _is_searchable(cast(str, title), cast(str, artist))
+        and (media_file.parsed_track is None or media_file.parsed_track >= 0)
+    )
+
+
+# Pre-flight checks per media type; files failing them never reach a provider
+_VALIDATORS: dict[str, Callable[[MediaFile], bool]] = {
+    "tv": _valid_tv,
+    "movie": _valid_movie,
+    "music": _valid_music,
+}
+
+
+def _mapping_key(media_file: MediaFile, media_type: str) -> tuple[Any, ...]:
+    """Parsed fields that fully determine a mapping; excludes the file path."""
+    return (
+        media_type,
+        media_file.parsed_title,
+        media_file.parsed_year,
+        media_file.parsed_season,
+        media_file.parsed_episode,
+        media_file.parsed_artist,
+        media_file.parsed_album,
+        media_file.parsed_track,
+    )
+
+
+#: ``(media_file, title, warnings) -> (series_id, show_name, episode_title)``
+_ShowLookup = Callable[
+    [MediaFile, str, list[str]], Awaitable[tuple[Any, str, str | None] | None]
+]
+
+
+@lru_cache(maxsize=4096)
+def _source_ref(provider: Any, entity_id: str) -> SourceRef:
+    """Shared SourceRef per ``(provider, id)``; safe because it is frozen."""
+    return SourceRef(provider=provider, id=entity_id)
+
+
+def _persisted_key(key: tuple[Any, ...]) -> tuple[str, str]:
+    """Split ``(provider, endpoint, *args)`` into a ProviderCache row key."""
+    provider, endpoint, *args = key
+    return str(provider), f"{endpoint}:{dumps(args).decode('utf-8')}"
+
+
+async def _authenticate(provider: Any) -> None:
+    """Run ``provider.authenticate()`` if it has one, ignoring failures."""
+    authenticate = getattr(provider, "authenticate", None)
+    if not callable(authenticate):
+        return
+    try:
+        result = authenticate()
+        if inspect.isawaitable(result):
+            await result
+    except Exception:
+        pass
 
 
 class DeterministicMapper:
@@ -37,20 +493,138 @@ class DeterministicMapper:
         omdb: Any | None = None,
         theaudiodb: TheAudioDBProvider | None = None,
         tvmaze: TVMazeProvider | None = None,
+        provider_cache: ProviderCache | None = None,
+        http_client: httpx.AsyncClient | None = None,
     ):
-        """Initialize mapper with provider clients and fallback providers."""
-        self.tmdb = tmdb or TMDBProvider()
-        self.tvdb = tvdb or TVDBProvider()
-        self.musicbrainz = musicbrainz or MusicBrainzProvider()
+        """Initialize mapper with provider clients and fallback providers.
+
+        When ``provider_cache`` is given, lookups are also persisted to it so
+        later runs start warm. Results older than their TTL are served from
+        it immediately while a background task refreshes them.
+
+        Providers that are not passed in are only constructed the first time
+        they are used, so a music-only scan never sets up TMDB or TVDB. They
+        share one pooled ``http_client`` (created on demand when omitted) so
+        connections are reused across lookups; call ``aclose()`` when done.
+        """
+        self._owns_http_client = http_client is None
+        self.http_client = http_client
+
+        self._tmdb = tmdb
+        self._tvdb = tvdb
+        self._musicbrainz = musicbrainz
         self.omdb = omdb
-        self.theaudiodb = theaudiodb or TheAudioDBProvider()
-        self.tvmaze = tvmaze or TVMazeProvider()
+        self._theaudiodb = theaudiodb
+        self._tvmaze = tvmaze
+
+        # (provider, endpoint, args) -> provider result
+        self._cache = CoalescingTTLCache()
+        self.provider_cache = provider_cache
+        self._refreshing: dict[tuple[Any, ...], asyncio.Task[None]] = {}
+        # (namespace, normalised query) -> full search results for that query
+        self._lnrm_results = CoalescingTTLCache(maxsize=_LNRM_CACHE_SIZE)
+        # _mapping_key -> plan item so duplicate files (other qualities of
+        # the same episode, say) reuse one mapping
+        self._mapped = CoalescingTTLCache(maxsize=_MAPPED_CACHE_SIZE)
+        # (provider, series, ...) -> (episode list the index was built from,
+        # index), least recently used first
+        self._episode_indexes: OrderedDict[
+            Hashable,
+            tuple[list[dict[str, Any]], dict[tuple[int, int], dict[str, Any]]],
+        ] = OrderedDict()
+
+    def _shared_http_client(self) -> httpx.AsyncClient:
+        if self.http_client is None:
+            self.http_client = create_http_client()
+        return self.http_client
+
+    @property
+    def tmdb(self) -> TMDBProvider:
+        """TMDB provider, constructed on first use."""
+        if self._tmdb is None:
+            self._tmdb = TMDBProvider(http_client=self._shared_http_client())
+        return self._tmdb
+
+    @property
+    def tvdb(self) -> TVDBProvider:
+        """TVDB provider, constructed on first use."""
+        if self._tvdb is None:
+            self._tvdb = TVDBProvider(http_client=self._shared_http_client())
+        return self._tvdb
+
+    @property
+    def musicbrainz(self) -> MusicBrainzProvider:
+        """MusicBrainz provider, constructed on first use."""
+        if self._musicbrainz is None:
+            self._musicbrainz = MusicBrainzProvider(
+                http_client=self._shared_http_client()
+            )
+        return self._musicbrainz
+
+    @property
+    def theaudiodb(self) -> TheAudioDBProvider:
+        """TheAudioDB provider, constructed on first use."""
+        if self._theaudiodb is None:
+            self._theaudiodb = TheAudioDBProvider(
+                http_client=self._shared_http_client()
+            )
+        return self._theaudiodb
+
+    @property
+    def tvmaze(self) -> TVMazeProvider:
+        """TVMaze provider, constructed on first use."""
+        if self._tvmaze is None:
+            self._tvmaze = TVMazeProvider(http_client=self._shared_http_client())
+        return self._tvmaze
+
+    async def warmup(self) -> None:
+        """Authenticate providers up front so the first lookup skips it.
+
+        Providers that need a login handshake (TVDB) are built and logged in
+        concurrently. Failures are ignored here; the provider retries on its
+        first real request.
+        """
+        providers: list[Any] = []
+        for name, provider_class in _WARMUP_PROVIDERS:
+            provider = getattr(self, f"_{name}")
+            if provider is None:
+                if not hasattr(provider_class, "authenticate"):
+                    continue
+                try:
+                    provider = getattr(self, name)
+                except ValueError:
+                    continue  # not configured (missing API key)
+            providers.append(provider)
+        if self.omdb:
+            providers.append(self.omdb)
+
+        await asyncio.gather(*(_authenticate(provider) for provider in providers))
+
+    async def aclose(self) -> None:
+        """Finish background refreshes, then close the shared HTTP client.
+
+        Refreshes of stale ``provider_cache`` rows are awaited so their
+        results reach disk before the caller closes the cache. The HTTP
+        client is only closed if this mapper created it.
+        """
+        if self._refreshing:
+            await asyncio.gather(*self._refreshing.values(), return_exceptions=True)
+        if self._owns_http_client and self.http_client is not None:
+            await self.http_client.aclose()
+            self.http_client = None
 
     async def map_media_file(
         self, media_file: MediaFile, media_type: str
     ) -> PlanItem | None:
         """Map a media file to a provider entity.
 
+        Parsed fields are cleaned and checked first, so malformed files
+        return None without a provider call. Files whose parsed fields match
+        an earlier one reuse its result with ``src_path`` swapped, so
+        duplicates never repeat the provider chain. Results with warnings
+        (and misses) are kept for ``NEGATIVE_TTL`` only, in case they stem
+        from a transient provider failure.
+
         Args:
             media_file: The scanned media file to map
             media_type: Type of media ('tv', 'movie', or 'music')
@@ -58,6 +632,38 @@ class DeterministicMapper:
         Returns:
             PlanItem with mapping details, or None if no match/ambiguous
         """
+        validate = _VALIDATORS.get(media_type)
+        if validate is None:
+            return None
+        media_file = _clean_title(media_file, media_type)
+        if not validate(media_file):
+            return None
+
+        key = _mapping_key(media_file, media_type)
+        item = await self._mapped.get_or_fetch(
+            key,
+            _DETAILS_TTL,
+            lambda: self._memoise(key, media_file, media_type),
+            store=False,
+        )
+
+        if item is None or item.src_path == media_file.path:
+            return item
+        return item.model_copy(update={"src_path": media_file.path})
+
+    async def _memoise(
+        self, key: tuple[Any, ...], media_file: MediaFile, media_type: str
+    ) -> PlanItem | None:
+        """Map ``media_file`` and record the result; failures are retried."""
+        item = await self._map_uncached(media_file, media_type)
+        ttl = _DETAILS_TTL if item is not None and not item.warnings else NEGATIVE_TTL
+        self._mapped.set(key, item, ttl)
+        return item
+
+    async def _map_uncached(
+        self, media_file: MediaFile, media_type: str
+    ) -> PlanItem | None:
+        """Dispatch a mapping to the handler for ``media_type``."""
         if media_type == "tv":
             return await self._map_tv_show(media_file)
         if media_type == "movie":
@@ -66,246 +672,574 @@ class DeterministicMapper:
             return await self._map_music(media_file)
         return None
 
+    async def map_many(
+        self,
+        files: list[MediaFile],
+        media_type: str,
+        concurrency: int | None = None,
+    ) -> list[PlanItem | None]:
+        """Map several media files with bounded concurrency.
+
+        Provider latency overlaps across files while at most ``concurrency``
+        mappings run at once. Files are dispatched grouped by show/season (or
+        artist/album, or title) so siblings run back to back and share their
+        lookups through the in-flight cache.
+
+        Args:
+            files: Scanned media files to map
+            media_type: Type of media ('tv', 'movie', or 'music')
+            concurrency: Maximum number of files mapped at the same time;
+                defaults to ``resolve_map_concurrency()``
+
+        Returns:
+            One PlanItem (or None) per input file, in input order
+        """
+        if concurrency is None:
+            concurrency = resolve_map_concurrency()
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def _map_one(media_file: MediaFile) -> PlanItem | None:
+            async with semaphore:
+                return await self.map_media_file(media_file, media_type)
+
+        order = sorted(
+            range(len(files)), key=lambda i: _dispatch_key(files[i], media_type)
+        )
+        mapped = await asyncio.gather(*(_map_one(files[i]) for i in order))
+
+        results: list[PlanItem | None] = [None] * len(files)
+        for index, item in zip(order, mapped, strict=True):
+            results[index] = item
+        return results
+
+    async def _cached(
+        self,
+        key: tuple[Any, ...],
+        ttl: float,
+        coro_factory: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Return a cached provider result, fetching it on a miss or expiry.
+
+        Empty results are cached for ``NEGATIVE_TTL`` (or ``ttl`` if shorter)
+        so dead titles are not retried on every file. Exceptions are not
+        cached. With a ``provider_cache``, an in-memory miss is served from
+        disk when possible; stale rows are returned as-is and refreshed in
+        the background. Concurrent misses for the same key share a single
+        in-flight fetch.
+
+        Args:
+            key: ``(provider, endpoint, *args)`` identifying the lookup
+            ttl: Seconds a non-empty result stays fresh
+            coro_factory: Callable producing the provider coroutine
+
+        Returns:
+            The provider result
+        """
+        # _load_or_fetch caches what it returns itself: stale disk rows are
+        # served without being remembered as fresh
+        return await self._cache.get_or_fetch(
+            key, ttl, lambda: self._load_or_fetch(key, ttl, coro_factory), store=False
+        )
+
+    async def _load_or_fetch(
+        self,
+        key: tuple[Any, ...],
+        ttl: float,
+        coro_factory: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Resolve an in-memory miss from the provider cache or the provider."""
+        if self.provider_cache is not None:
+            persisted = await self._load_persisted(key)
+            if persisted is not None:
+                synced_at, value = persisted
+                lifetime = result_lifetime(value, ttl)
+                age = time.time() - synced_at
+                if age < lifetime:
+                    self._cache.set(key, value, lifetime - age)
+                elif key not in self._refreshing:
+                    task = asyncio.create_task(self._refresh(key, ttl, coro_factory))
+                    self._refreshing[key] = task
+                return value
+
+        value = await coro_factory()
+        await self._store(key, ttl, value)
+        return value
+
+    async def _load_persisted(self, key: tuple[Any, ...]) -> tuple[float, Any] | None:
+        """Read ``(synced_at, value)`` for ``key`` from the provider cache."""
+        if self.provider_cache is None:
+            return None
+        provider, row_key = _persisted_key(key)
+        try:
+            row = await self.provider_cache.get(provider, row_key)
+        except _PERSIST_ERRORS:
+            return None
+        if row is None or "synced_at" not in row:
+            return None
+        return float(row["synced_at"]), row.get("value")
+
+    async def _store(self, key: tuple[Any, ...], ttl: float, value: Any) -> None:
+        """Remember a fresh result in memory and, if configured, on disk."""
+        self._cache.set(key, value, ttl)
+        if self.provider_cache is None:
+            return
+        provider, row_key = _persisted_key(key)
+        try:
+            await self.provider_cache.set(
+                provider,
+                row_key,
+                {"synced_at": time.time(), "value": value},
+                ttl=int(result_lifetime(value, ttl) + _STALE_WINDOW),
+            )
+        except _PERSIST_ERRORS:
+            # The disk tier is an optimisation; mapping must not fail on it
+            pass
+
+    async def _refresh(
+        self,
+        key: tuple[Any, ...],
+        ttl: float,
+        coro_factory: Callable[[], Awaitable[Any]],
+    ) -> None:
+        """Re-fetch a stale persisted result, keeping the old copy on failure."""
+        try:
+            await self._store(key, ttl, await coro_factory())
+        except Exception:
+            pass
+        finally:
+            self._refreshing.pop(key, None)
+
+    async def _search_lnrm(
+        self,
+        namespace: str,
+        key: Hashable,
+        keys_of: Callable[[dict[str, Any]], Iterable[Hashable]],
+        search: Callable[[], Awaitable[Any]],
+    ) -> list[dict[str, Any]] | None:
+        """Search once per normalised query, then narrow to an exact match.
+
+        Results are remembered under the query's own normalised ``key``, so
+        "Mr. Robot" and "mr robot" share one search while "Doctor Who 1963"
+        never answers for "Doctor Who". When several results come back but
+        exactly one matches ``key``, that one is returned on its own.
+        """
+        if key:
+            results = await self._lnrm_results.get_or_fetch(
+                (namespace, key), _SEARCH_TTL, search
+            )
+        else:
+            results = await search()
+        if not results:
+            return cast(list[dict[str, Any]] | None, results)
+        if key and len(results) > 1:
+            exact = [result for result in results if key in keys_of(result)]
+            if len(exact) == 1:
+                return exact
+        return list(results)
+
+    def _episode_index(
+        self, memo_key: Hashable, episodes: list[dict[str, Any]]
+    ) -> dict[tuple[int, int], dict[str, Any]]:
+        """Return a ``(season, number) -> episode`` index for an episode list.
+
+        The index is rebuilt only when the cached episode list changes, so
+        mapping many files of one show costs one pass over its episodes.
+        """
+        memo = self._episode_indexes.get(memo_key)
+        if memo is not None and memo[0] is episodes:
+            self._episode_indexes.move_to_end(memo_key)
+            return memo[1]
+
+        index = _index_episodes(episodes)
+        self._episode_indexes[memo_key] = (episodes, index)
+        self._episode_indexes.move_to_end(memo_key)
+        while len(self._episode_indexes) > _EPISODE_INDEX_CACHE_SIZE:
+            self._episode_indexes.popitem(last=False)
+        return index
+
+    @classmethod
+    def _movie_lnrm_keys(cls, movie: dict[str, Any]) -> set[tuple[str, int | None]]:
+        """Normalised ``(title, year)`` keys for a TMDB movie.
+
+        A ``(title, None)`` key is included so lookups without a parsed year
+        still find the movie.
+        """
+        keys: set[tuple[str, int | None]] = set()
+        year = cls._extract_year(movie.get("release_date"))
+        for name in (movie.get("title"), movie.get("original_title")):
+            title = _lnrm(name)
+            if title:
+                keys.add((title, None))
+                if year is not None:
+                    keys.add((title, year))
+        return keys
+
     @staticmethod
     def _extract_year(value: Any) -> int | None:
         """Extract four-digit year from provider payload."""
-
+        # Exact type checks skip the MRO walk; date strings are the common case
+        kind = type(value)
+        if kind is str:
+            match = _YEAR_RE.search(value)
+            return int(match.group(1)) if match else None
+        if kind is int:
+            return cast(int, value)
         if value is None:
             return None
+        if isinstance(value, date):
+            return value.year
 
-        if isinstance(value, int):
-            return value
+        match = _YEAR_RE.search(str(value))
+        return int(match.group(1)) if match else None
 
-        text = str(value)
-        for token in text.split("-"):
-            if token.isdigit() and len(token) == 4:
-                return int(token)
-        return None
+    @classmethod
+    def _series_year(cls, series: dict[str, Any]) -> int | None:
+        """Premiere year of a TVDB search result, if it reports one.
+
+        With a parsed year, "Doctor Who (2005)" outscores the 1963 series
+        instead of tying with it.
+        """
+        return cls._extract_year(_first_field(series, _SERIES_YEAR_FIELDS))
 
     async def _map_tv_show(self, media_file: MediaFile) -> PlanItem | None:
-        """Map TV show using TVDB primary and TMDB→OMDb→TVMaze fallbacks."""
-        if not media_file.parsed_title:
-            return None
+        """Map TV show using TVDB primary and TMDB→OMDb→TVMaze fallbacks.
 
-        warnings: list[str] = []
+        TVDB gets a ``_TV_HEDGE_DELAY`` head start; if it has not settled the
+        match by then, the fallbacks are launched speculatively so a slow
+        TVDB miss costs the slower provider's latency rather than the sum.
+        Fallbacks run concurrently and their results are only used when TVDB
+        finds nothing or fails.
+        """
+        if not media_file.parsed_title or not _lnrm(media_file.parsed_title):
+            return None
 
-        # Try TVDB first
+        title = media_file.parsed_title
+        primary = asyncio.ensure_future(self._try_tvdb_show(media_file, title))
+        fallbacks: list[asyncio.Future[tuple[PlanItem | None, list[str]]]] = []
         try:
-            search_results = await self.tvdb.search_series(media_file.parsed_title)
+            done, _ = await asyncio.wait({primary}, timeout=_TV_HEDGE_DELAY)
+            if not done:
+                fallbacks = self._start_tv_fallbacks(media_file, title)
+
+            plan_item, warnings, settled = await primary
+            if settled:
+                return plan_item
+
+            # TVDB missed: take the first fallback match in priority order
+            # (TMDB > OMDb > TVMaze).
+            fallbacks = fallbacks or self._start_tv_fallbacks(media_file, title)
+            for task in fallbacks:
+                plan_item, attempt_warnings = await task
+                if plan_item is not None:
+                    if warnings:
+                        plan_item = plan_item.model_copy(
+                            update={"warnings": [*warnings, *attempt_warnings]}
+                        )
+                    return plan_item
+                warnings.extend(attempt_warnings)
+        finally:
+            # Attempts still in flight are no longer needed; shared provider
+            # fetches underneath are shielded and still warm the cache
+            primary.cancel()
+            for task in fallbacks:
+                task.cancel()
 
-            if search_results:
-                if len(search_results) > 1:
-                    warnings.append(
-                        "TVDB returned multiple matches; requires disambiguation."
-                    )
-                    return None
-
-                series = search_results[0]
-                series_id = series["id"]
-
-                # Get episode details if we have season/episode info
-                episode_title = None
-                if media_file.parsed_season and media_file.parsed_episode:
-                    episodes = await self.tvdb.get_series_episodes(series_id)
-                    for episode in episodes:
-                        if (
-                            episode.get("seasonNumber") == media_file.parsed_season
-                            and episode.get("number") == media_file.parsed_episode
-                        ):
-                            episode_title = episode.get("name")
-                            break
+        return None
 
-                # Build destination path
-                show_name = series["name"]
-                dst_path = self._build_tv_path(
-                    show_name,
-                    media_file.parsed_season,
-                    media_file.parsed_episode,
-                    episode_title,
-                )
+    async def _try_tvdb_show(
+        self, media_file: MediaFile, title: str
+    ) -> tuple[PlanItem | None, list[str], bool]:
+        """Resolve a TV file with TVDB.
 
-                return PlanItem(
-                    src_path=media_file.path,
-                    dst_path=dst_path,
-                    reason=f"Matched TV show '{show_name}' with TVDB",
-                    confidence=1.0,  # High confidence for exact matches
-                    sources=[SourceRef(provider="tvdb", id=str(series_id))],
-                    warnings=warnings,
+        Returns ``(plan_item, warnings, settled)``; ``settled`` is False when
+        TVDB found nothing or failed and the fallbacks should decide.
+        """
+        warnings: list[str] = []
+        try:
+            search_results = await self._search_tvdb_series(title)
+            if not search_results:
+                return None, warnings, False
+
+            selected = _select_match(
+                title,
+                search_results,
+                lambda result: str(
+                    result.get("name") or result.get("seriesName") or ""
+                ),
+                "TVDB",
+                warnings,
+                year=media_file.parsed_year,
+                year_of=self._series_year,
+            )
+            if selected is None:
+                warnings.append(
+                    "TVDB returned multiple matches; requires disambiguation."
+                )
+                return None, warnings, True
+
+            series, confidence = selected
+            series_id = series["id"]
+
+            # Get episode details if we have season/episode info
+            episode_title = None
+            if media_file.parsed_season and media_file.parsed_episode:
+                episodes = await self._tvdb_episodes(series_id)
+                episode_index = self._episode_index(("tvdb", series_id), episodes)
+                episode = episode_index.get(
+                    (media_file.parsed_season, media_file.parsed_episode)
                 )
+                episode_title = _episode_title(episode)
+
+            # Build destination path
+            show_name = series["name"]
+            dst_path = self._build_tv_path(
+                show_name,
+                media_file.parsed_season,
+                media_file.parsed_episode,
+                episode_title,
+            )
+
+            plan_item = PlanItem(
+                src_path=media_file.path,
+                dst_path=dst_path,
+                reason=f"Matched TV show '{show_name}' with TVDB",
+                confidence=confidence,
+                sources=[_source_ref("tvdb", str(series_id))],
+                warnings=warnings,
+            )
+            return plan_item, warnings, True
         except Exception as e:
             warnings.append(f"TVDB failed: {str(e)}")
+            return None, warnings, False
+
+    def _start_tv_fallbacks(
+        self, media_file: MediaFile, title: str
+    ) -> list[asyncio.Future[tuple[PlanItem | None, list[str]]]]:
+        """Launch the configured TV fallbacks concurrently, in priority order."""
+        lookups: dict[str, _ShowLookup] = {
+            "tmdb": self._lookup_tmdb_show,
+            "omdb": self._lookup_omdb_show,
+            "tvmaze": self._lookup_tvmaze_show,
+        }
+        return [
+            asyncio.ensure_future(
+                self._try_tv_fallback(
+                    media_file, title, provider, label, confidence, lookups[provider]
+                )
+            )
+            for provider, label, confidence in _TV_FALLBACKS
+            if provider != "omdb" or self.omdb
+        ]
 
-        # TMDB fallback
+    async def _try_tv_fallback(
+        self,
+        media_file: MediaFile,
+        title: str,
+        provider: str,
+        label: str,
+        confidence: float,
+        lookup: _ShowLookup,
+    ) -> tuple[PlanItem | None, list[str]]:
+        """Run one TV fallback lookup; returns the match and its own warnings."""
+        warnings: list[str] = []
         try:
-            search_results = await self.tmdb.search_tv(
-                media_file.parsed_title, year=media_file.parsed_year
-            )
+            match = await lookup(media_file, title, warnings)
+        except Exception as e:
+            warnings.append(f"{label} fallback failed: {str(e)}")
+            return None, warnings
+        if match is None:
+            return None, warnings
+
+        series_id, show_name, episode_title = match
+        dst_path = self._build_tv_path(
+            show_name,
+            media_file.parsed_season,
+            media_file.parsed_episode,
+            episode_title,
+        )
+        plan_item = PlanItem(
+            src_path=media_file.path,
+            dst_path=dst_path,
+            reason=f"Matched TV show '{show_name}' with {label} (fallback)",
+            confidence=confidence,
+            sources=[_source_ref(provider, str(series_id))],
+            warnings=warnings,
+        )
+        return plan_item, warnings
+
+    async def _lookup_tmdb_show(
+        self, media_file: MediaFile, title: str, warnings: list[str]
+    ) -> tuple[Any, str, str | None] | None:
+        """Resolve ``(series_id, show_name, episode_title)`` via TMDB."""
+        year = media_file.parsed_year
+        search_results = await self._cached(
+            ("tmdb", "search_tv", _query_key(title), year),
+            _SEARCH_TTL,
+            lambda: self.tmdb.search_tv(title, year=year),
+        )
+        if not search_results or len(search_results) != 1:
+            return None
 
-            if search_results and len(search_results) == 1:
-                series = search_results[0]
-                series_id = series["id"]
-                show_name_raw = series.get("name") or series.get("original_name")
-                show_name = str(
-                    show_name_raw or media_file.parsed_title or "Unknown Series"
-                )
+        series = search_results[0]
+        series_id = series["id"]
+        show_name = _pick_name(
+            series.get("name"),
+            series.get("original_name"),
+            media_file.parsed_title,
+            default="Unknown Series",
+        )
 
-                episode_title = None
-                if media_file.parsed_season and media_file.parsed_episode:
-                    try:
-                        episodes = await self.tmdb.get_tv_episodes(
-                            series_id, season=media_file.parsed_season
-                        )
-                        for episode in episodes:
-                            if (
-                                episode.get("episode_number")
-                                == media_file.parsed_episode
-                            ):
-                                episode_title = episode.get("name")
-                                break
-                    except Exception as exc:
-                        warnings.append(f"TMDB episode lookup failed: {exc}")
-
-                dst_path = self._build_tv_path(
-                    show_name,
-                    media_file.parsed_season,
-                    media_file.parsed_episode,
-                    episode_title,
+        episode_title = None
+        season, number = media_file.parsed_season, media_file.parsed_episode
+        if season and number:
+            try:
+                episodes = await self._cached(
+                    ("tmdb", "get_tv_episodes", series_id, season),
+                    _DETAILS_TTL,
+                    lambda: self.tmdb.get_tv_episodes(series_id, season=season),
                 )
+                episode = self._episode_index(
+                    ("tmdb", series_id, season), episodes
+                ).get((season, number))
+                episode_title = _episode_title(episode)
+            except Exception as exc:
+                warnings.append(f"TMDB episode lookup failed: {exc}")
+        return series_id, show_name, episode_title
+
+    async def _lookup_omdb_show(
+        self, media_file: MediaFile, title: str, warnings: list[str]
+    ) -> tuple[Any, str, str | None] | None:
+        """Resolve ``(series_id, show_name, episode_title)`` via OMDb."""
+        omdb = self.omdb
+        if not omdb:
+            return None
+        search_results = await self._cached(
+            ("omdb", "search_series", _query_key(title)),
+            _SEARCH_TTL,
+            lambda: omdb.search_series(title, limit=5),
+        )
+        if not search_results or len(search_results) != 1:
+            return None
 
-                return PlanItem(
-                    src_path=media_file.path,
-                    dst_path=dst_path,
-                    reason=f"Matched TV show '{show_name}' with TMDB (fallback)",
-                    confidence=0.85,
-                    sources=[SourceRef(provider="tmdb", id=str(series_id))],
-                    warnings=warnings,
-                )
-        except Exception as e:
-            warnings.append(f"TMDB fallback failed: {str(e)}")
+        series = search_results[0]
+        series_id = series["id"]
 
-        # Try OMDb fallback if available
-        if self.omdb:
+        episode_title = None
+        season, number = media_file.parsed_season, media_file.parsed_episode
+        if season and number:
             try:
-                search_results = await self.omdb.search_series(
-                    media_file.parsed_title, limit=5
+                episode_info = await self._cached(
+                    ("omdb", "get_episode", series_id, season, number),
+                    _DETAILS_TTL,
+                    lambda: omdb.get_episode(series_id, season, number),
                 )
+                if episode_info:
+                    episode_title = episode_info.get("Title")
+            except Exception as exc:
+                warnings.append(f"OMDb episode lookup failed: {exc}")
 
-                if search_results and len(search_results) == 1:
-                    series = search_results[0]
-                    series_id = series["id"]
-
-                    # Get episode details
-                    episode_title = None
-                    if media_file.parsed_season and media_file.parsed_episode:
-                        try:
-                            episode_info = await self.omdb.get_episode(
-                                series_id,
-                                media_file.parsed_season,
-                                media_file.parsed_episode,
-                            )
-                            if episode_info:
-                                episode_title = episode_info.get("Title")
-                        except Exception as exc:
-                            warnings.append(f"OMDb episode lookup failed: {exc}")
-
-                    show_name = str(
-                        series.get("title")
-                        or media_file.parsed_title
-                        or "Unknown Series"
-                    )
-                    dst_path = self._build_tv_path(
-                        show_name,
-                        media_file.parsed_season,
-                        media_file.parsed_episode,
-                        episode_title,
-                    )
+        show_name = _pick_name(
+            series.get("title"), media_file.parsed_title, default="Unknown Series"
+        )
+        return series_id, show_name, episode_title
+
+    async def _lookup_tvmaze_show(
+        self, media_file: MediaFile, title: str, warnings: list[str]
+    ) -> tuple[Any, str, str | None] | None:
+        """Resolve ``(series_id, show_name, episode_title)`` via TVMaze."""
+        search_results = await self._cached(
+            ("tvmaze", "search_series", _query_key(title)),
+            _SEARCH_TTL,
+            lambda: self.tvmaze.search_series(title),
+        )
+        if not search_results:
+            return None
 
-                    return PlanItem(
-                        src_path=media_file.path,
-                        dst_path=dst_path,
-                        reason=f"Matched TV show '{show_name}' with OMDb (fallback)",
-                        confidence=0.7,  # Lower confidence for OMDb fallback
-                        sources=[SourceRef(provider="omdb", id=series_id)],
-                        warnings=warnings,
-                    )
-            except Exception as e:
-                warnings.append(f"OMDb fallback failed: {str(e)}")
+        preferred = None
+        if media_file.parsed_year:
+            for candidate in search_results:
+                candidate_year = self._extract_year(
+                    candidate.get("premiered") or candidate.get("ended")
+                )
+                if candidate_year == media_file.parsed_year:
+                    preferred = candidate
+                    break
+        preferred = preferred or search_results[0]
 
-        # Final fallback: TVMaze (free, no auth)
-        try:
-            search_results = await self.tvmaze.search_series(media_file.parsed_title)
-
-            if search_results:
-                preferred = None
-                if media_file.parsed_year:
-                    for candidate in search_results:
-                        candidate_year = self._extract_year(
-                            candidate.get("premiered") or candidate.get("ended")
-                        )
-                        if candidate_year == media_file.parsed_year:
-                            preferred = candidate
-                            break
-                preferred = preferred or search_results[0]
-
-                series_id = preferred.get("id")
-                if series_id is not None:
-                    episode_title = None
-                    if media_file.parsed_season and media_file.parsed_episode:
-                        try:
-                            episode_data = await self.tvmaze.get_episode(
-                                series_id,
-                                media_file.parsed_season,
-                                media_file.parsed_episode,
-                            )
-                            if episode_data:
-                                episode_title = episode_data.get("name")
-                        except Exception as exc:
-                            warnings.append(f"TVMaze episode lookup failed: {exc}")
-
-                    show_name = str(
-                        preferred.get("name")
-                        or media_file.parsed_title
-                        or "Unknown Series"
-                    )
-                    dst_path = self._build_tv_path(
-                        show_name,
-                        media_file.parsed_season,
-                        media_file.parsed_episode,
-                        episode_title,
-                    )
+        series_id = preferred.get("id")
+        if series_id is None:
+            return None
 
-                    return PlanItem(
-                        src_path=media_file.path,
-                        dst_path=dst_path,
-                        reason=f"Matched TV show '{show_name}' with TVMaze (fallback)",
-                        confidence=0.6,
-                        sources=[SourceRef(provider="tvmaze", id=str(series_id))],
-                        warnings=warnings,
-                    )
-        except Exception as e:
-            warnings.append(f"TVMaze fallback failed: {str(e)}")
+        episode_title = None
+        season, number = media_file.parsed_season, media_file.parsed_episode
+        if season and number:
+            try:
+                episode_data = await self._cached(
+                    ("tvmaze", "get_episode", series_id, season, number),
+                    _DETAILS_TTL,
+                    lambda: self.tvmaze.get_episode(series_id, season, number),
+                )
+                if episode_data:
+                    episode_title = episode_data.get("name")
+            except Exception as exc:
+                warnings.append(f"TVMaze episode lookup failed: {exc}")
 
-        return None
+        show_name = _pick_name(
+            preferred.get("name"), media_file.parsed_title, default="Unknown Series"
+        )
+        return series_id, show_name, episode_title
 
     async def _map_movie(self, media_file: MediaFile) -> PlanItem | None:
         """Map movie to TMDB entity with OMDb fallback."""
-        if not media_file.parsed_title:
+        if not media_file.parsed_title or not _lnrm(media_file.parsed_title):
             return None
 
         warnings: list[str] = []
 
         # Try TMDB first
         try:
-            search_results = await self.tmdb.search_movie(
-                media_file.parsed_title, year=media_file.parsed_year
+            movie_key = (media_file.parsed_title, media_file.parsed_year)
+            title_key = _lnrm(media_file.parsed_title)
+            search_results = await self._search_lnrm(
+                "tmdb",
+                (title_key, media_file.parsed_year) if title_key else None,
+                self._movie_lnrm_keys,
+                lambda: self._cached(
+                    ("tmdb", "search_movie", _query_key(movie_key[0]), movie_key[1]),
+                    _SEARCH_TTL,
+                    lambda: self.tmdb.search_movie(movie_key[0], year=movie_key[1]),
+                ),
             )
 
-            if search_results and len(search_results) == 1:
-                movie = search_results[0]
+            selected = (
+                _select_match(
+                    f"{media_file.parsed_title} {media_file.parsed_year or ''}",
+                    search_results,
+                    lambda result: (
+                        f"{result.get('title') or ''} "
+                        f"{self._extract_year(result.get('release_date')) or ''}"
+                    ),
+                    "TMDB",
+                    warnings,
+                )
+                if search_results
+                else None
+            )
+            if selected is not None:
+                movie, confidence = selected
                 movie_id = movie["id"]
 
-                # Get detailed movie information
-                movie_details = await self.tmdb.get_movie_details(movie_id)
+                # Search results already carry the title; only fetch details
+                # (a second round trip) when the result lacks one.
+                movie_details = (
+                    movie
+                    if movie.get("title")
+                    else await self._cached(
+                        ("tmdb", "get_movie_details", movie_id),
+                        _DETAILS_TTL,
+                        lambda: self.tmdb.get_movie_details(movie_id),
+                    )
+                )
                 if movie_details:
                     movie_title = movie_details["title"]
                     movie_year = media_file.parsed_year or "Unknown"
@@ -315,8 +1249,8 @@ class DeterministicMapper:
                         src_path=media_file.path,
                         dst_path=dst_path,
                         reason=f"Matched movie '{movie_title}' with TMDB",
-                        confidence=1.0,  # High confidence for exact matches
-                        sources=[SourceRef(provider="tmdb", id=str(movie_id))],
+                        confidence=confidence,
+                        sources=[_source_ref("tmdb", str(movie_id))],
                         warnings=warnings,
                     )
         except Exception as e:
@@ -325,16 +1259,30 @@ class DeterministicMapper:
         # TVDB doesn't have movie methods, skip to OMDb
 
         # Try OMDb fallback if available
-        if self.omdb:
+        omdb = self.omdb
+        if omdb:
             try:
-                search_results = await self.omdb.search_movie(media_file.parsed_title)
+                title = media_file.parsed_title
+                search_results = await self._cached(
+                    ("omdb", "search_movie", _query_key(title)),
+                    _SEARCH_TTL,
+                    lambda: omdb.search_movie(title),
+                )
 
                 if search_results and len(search_results) == 1:
                     movie = search_results[0]
                     movie_id = movie["id"]
 
-                    # Get movie details
-                    movie_details = await self.omdb.get_movie_details(movie_id)
+                    # Only fetch details when the search result has no title
+                    movie_details = (
+                        movie
+                        if movie.get("title")
+                        else await self._cached(
+                            ("omdb", "get_movie_details", movie_id),
+                            _DETAILS_TTL,
+                            lambda: omdb.get_movie_details(movie_id),
+                        )
+                    )
                     if movie_details:
                         movie_title = movie_details["title"]
                         movie_year = media_file.parsed_year or "Unknown"
@@ -345,7 +1293,7 @@ class DeterministicMapper:
                         dst_path=dst_path,
                         reason=(f"Matched movie '{movie_title}' with OMDb (fallback)"),
                         confidence=0.7,  # Lower confidence for OMDb fallback
-                        sources=[SourceRef(provider="omdb", id=str(movie_id))],
+                        sources=[_source_ref("omdb", str(movie_id))],
                         warnings=warnings,
                     )
             except Exception as e:
@@ -357,24 +1305,51 @@ class DeterministicMapper:
         """Map music to MusicBrainz entity with Last.fm fallback."""
         if not media_file.parsed_title or not media_file.parsed_artist:
             return None
+        if not _is_searchable(media_file.parsed_title, media_file.parsed_artist):
+            # Junk like "01" by "VA" only burns MusicBrainz's 1 req/s budget
+            return None
 
         warnings: list[str] = []
 
         # Try MusicBrainz first
         try:
             # Search for recording by title and artist
-            query = f"{media_file.parsed_title} AND artist:{media_file.parsed_artist}"
-            search_results = await self.musicbrainz.search_recording(query)
+            query = (
+                f'recording:"{_lucene_escape(media_file.parsed_title)}"'
+                f' AND artist:"{_lucene_escape(media_file.parsed_artist)}"'
+            )
+            recording_key = (
+                _lnrm(media_file.parsed_title),
+                _lnrm(media_file.parsed_artist),
+            )
+            search_results = await self._search_lnrm(
+                "musicbrainz",
+                recording_key if all(recording_key) else None,
+                _recording_lnrm_keys,
+                lambda: self._cached(
+                    ("musicbrainz", "search_recording", _query_key(query)),
+                    _SEARCH_TTL,
+                    lambda: self.musicbrainz.search_recording(
+                        query, limit=_MUSICBRAINZ_SEARCH_LIMIT
+                    ),
+                ),
+            )
 
-            if search_results and len(search_results) == 1:
-                recording = search_results[0]
+            selected = (
+                _select_match(
+                    f"{media_file.parsed_title} {media_file.parsed_artist}",
+                    search_results,
+                    _recording_label,
+                    "MusicBrainz",
+                    warnings,
+                )
+                if search_results
+                else None
+            )
+            if selected is not None:
+                recording, confidence = selected
                 recording_id = recording["id"]
 
-                # Get release group information if available
-                if recording.get("releases"):
-                    release_id = recording["releases"][0]["id"]
-                    await self.musicbrainz.get_release_group(release_id)
-
                 # Build destination path
                 artist_name = media_file.parsed_artist
                 track_title = media_file.parsed_title
@@ -392,8 +1367,8 @@ class DeterministicMapper:
                         f"Matched music '{track_title}' by '{artist_name}' with"
                         " MusicBrainz"
                     ),
-                    confidence=1.0,  # High confidence for exact matches
-                    sources=[SourceRef(provider="musicbrainz", id=recording_id)],
+                    confidence=confidence,
+                    sources=[_source_ref("musicbrainz", recording_id)],
                     warnings=warnings,
                 )
         except Exception as e:
@@ -402,16 +1377,28 @@ class DeterministicMapper:
         # Try TheAudioDB fallback for music
         try:
             # Search for track by title and artist
-            search_results = await self.theaudiodb.search_track(
-                media_file.parsed_title, media_file.parsed_artist
+            title, artist = media_file.parsed_title, media_file.parsed_artist
+            search_results = await self._cached(
+                ("theaudiodb", "search_track", _query_key(title), _query_key(artist)),
+                _SEARCH_TTL,
+                lambda: self.theaudiodb.search_track(title, artist),
             )
 
             if search_results and len(search_results) == 1:
                 track = search_results[0]
                 track_id = track["idTrack"]
 
-                # Get detailed track information
-                track_details = await self.theaudiodb.get_track_details(track_id)
+                # The path comes from parsed fields; the details call only
+                # confirms a search hit that lacks its track and artist names
+                track_details = (
+                    track
+                    if track.get("strTrack") and track.get("strArtist")
+                    else await self._cached(
+                        ("theaudiodb", "get_track_details", track_id),
+                        _DETAILS_TTL,
+                        lambda: self.theaudiodb.get_track_details(track_id),
+                    )
+                )
                 if track_details:
                     # Build destination path
                     artist_name = media_file.parsed_artist
@@ -431,7 +1418,7 @@ class DeterministicMapper:
                             " TheAudioDB (fallback)"
                         ),
                         confidence=0.8,  # Lower confidence for fallback
-                        sources=[SourceRef(provider="theaudiodb", id=track_id)],
+                        sources=[_source_ref("theaudiodb", track_id)],
                         warnings=warnings,
                     )
         except Exception as e:
@@ -474,18 +1461,50 @@ class DeterministicMapper:
 
     async def _lookup_tvdb_series(self, title: str) -> list[dict[str, Any]] | None:
         try:
-            return await self.tvdb.search_series(title)
+            return await self._search_tvdb_series(title)
         except Exception:
             return None
 
+    async def _search_tvdb_series(self, title: str) -> list[dict[str, Any]] | None:
+        """Search TVDB for a series once per scan.
+
+        Episode and anthology mapping share this lookup: results are cached
+        by normalised query, so a spelling of a title already searched in
+        either path is answered without another request.
+        """
+        return await self._search_lnrm(
+            "tvdb",
+            _lnrm(title),
+            _series_lnrm_keys,
+            lambda: self._cached(
+                ("tvdb", "search_series", _query_key(title)),
+                _SEARCH_TTL,
+                lambda: self.tvdb.search_series(title),
+            ),
+        )
+
     async def _fetch_tvdb_episodes(self, series_id: Any) -> list[dict[str, Any]]:
         if series_id is None:
             return []
         try:
-            return await self.tvdb.get_series_episodes(series_id)
+            return await self._tvdb_episodes(series_id)
         except Exception:
             return []
 
+    async def _tvdb_episodes(self, series_id: Any) -> list[dict[str, Any]]:
+        """Load a TVDB series' episode list once per scan.
+
+        Regular and anthology mapping share this loader, so concurrent files
+        of one series wait on a single in-flight request and later files are
+        answered from the cache.
+        """
+        episodes = await self._cached(
+            ("tvdb", "get_series_episodes", series_id),
+            _DETAILS_TTL,
+            lambda: self.tvdb.get_series_episodes(series_id),
+        )
+        return cast(list[dict[str, Any]], episodes)
+
     def _build_anthology_plan_items(
         self,
         *,
@@ -500,32 +1519,15 @@ class DeterministicMapper:
         if season is None:
             return []
 
-        show_name = str(
-            series.get("name")
-            or series.get("seriesName")
-            or media_file.parsed_title
-            or "Unknown Series"
+        show_name = _pick_name(
+            series.get("name"),
+            series.get("seriesName"),
+            media_file.parsed_title,
+            default="Unknown Series",
         )
 
         series_id = series.get("id")
-        episode_lookup: dict[int, dict[str, Any]] = {}
-        for episode in episodes:
-            season_number = (
-                episode.get("seasonNumber")
-                or episode.get("SeasonNumber")
-                or episode.get("airedSeason")
-                or episode.get("season")
-            )
-            number = (
-                episode.get("number")
-                or episode.get("episodeNumber")
-                or episode.get("airedEpisodeNumber")
-            )
-            if season_number is None or number is None:
-                continue
-            if int(season_number) != season:
-                continue
-            episode_lookup[int(number)] = episode
+        episode_lookup = self._episode_index(("tvdb", series_id), episodes)
 
         plan_items: list[PlanItem] = []
         for segment in segments:
@@ -537,16 +1539,9 @@ class DeterministicMapper:
             episode_numbers = list(range(start, end + 1))
             titles: list[str] = []
             for number in episode_numbers:
-                episode_data = episode_lookup.get(number)
-                if not episode_data:
-                    continue
-                title = (
-                    episode_data.get("name")
-                    or episode_data.get("episodeName")
-                    or episode_data.get("title")
-                )
+                title = _episode_title(episode_lookup.get((season, number)))
                 if title:
-                    titles.append(str(title))
+                    titles.append(title)
 
             combined_title = " & ".join(titles) if titles else None
             dst_path = self._build_tv_path(
@@ -567,14 +1562,17 @@ class DeterministicMapper:
                     dst_path=dst_path,
                     reason=reason,
                     confidence=confidence,
-                    sources=[SourceRef(provider="tvdb", id=str(series_id))],
-                    warnings=list(warnings),
+                    sources=[_source_ref("tvdb", str(series_id))],
+                    warnings=warnings,  # validation already copies the list
                 )
             )
 
         return plan_items
 
+    # Paths are immutable and re-planning a library rebuilds the same ones, so
+    # the builders memoise their results instead of re-parsing each string.
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _build_tv_path(
         show_name: str,
         season: int | None,
@@ -582,34 +1580,37 @@ class DeterministicMapper:
         episode_title: str | None,
         episode_end: int | None = None,
     ) -> Path:
-        season_value = season or 1
         start_value = episode_start or 1
         end_value = episode_end or start_value
-        season_num = f"{season_value:02d}"
-        start_num = f"{start_value:02d}"
-        end_num = f"{end_value:02d}"
-        season_dir = Path("/tv") / show_name / f"Season {season_num}"
-        code = f"S{season_num}E{start_num}"
-        if end_value != start_value:
-            code = f"{code}-E{end_num}"
-        if episode_title:
-            filename = f"{show_name} - {code} - {episode_title}.mkv"
-        else:
-            filename = f"{show_name} - {code}.mkv"
-        return season_dir / filename
+        season_value = season or 1
+        season_dir, show = _tv_season_dir(show_name, season_value)
+        template = _TV_PATH_WITH_TITLE if episode_title else _TV_PATH
+        code_template = _TV_SPAN_CODE if end_value != start_value else _TV_CODE
+        return Path(
+            template.format(
+                season_dir=season_dir,
+                show=show,
+                code=code_template.format(
+                    season=season_value, start=start_value, end=end_value
+                ),
+                title=_safe(episode_title) if episode_title else None,
+            )
+        )
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _build_movie_path(title: str, year: str | int) -> Path:
-        year_label = str(year)
-        movie_dir = Path("/movies") / f"{title} ({year_label})"
-        filename = f"{title} ({year_label}).mkv"
-        return movie_dir / filename
+        return Path(_MOVIE_PATH.format(title=_safe(title), year=year))
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _build_music_path(
         artist: str, album: str, track_number: int, track_title: str
     ) -> Path:
-        track_label = f"{track_number:02d}"
-        base_dir = Path("/music") / artist / album
-        filename = f"{track_label} - {track_title}.flac"
-        return base_dir / filename
+        return Path(
+            _MUSIC_PATH.format(
+                album_dir=_music_album_dir(artist, album),
+                track=track_number,
+                title=_safe(track_title),
+            )
+        )
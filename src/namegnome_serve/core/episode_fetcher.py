@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, field
 from typing import Any
 
+from namegnome_serve.core.constants import CACHE_TTL_BY_TYPE
+from namegnome_serve.core.ttl_cache import CoalescingTTLCache
 from namegnome_serve.routes.schemas import MediaFile
 
+# Leading year of "2019", "2019-04-01" and similar provider date fields
+_LEADING_YEAR_RE = re.compile(r"\s*(\d{4})")
+
 
 def _extract_year(value: Any) -> int | None:
     """Best-effort extraction of a four-digit year from provider fields."""
@@ -17,14 +23,8 @@ def _extract_year(value: Any) -> int | None:
     if isinstance(value, int):
         return value
 
-    text = str(value).strip()
-    if not text:
-        return None
-
-    digits = "".join(ch for ch in text[:4] if ch.isdigit())
-    if len(digits) == 4:
-        return int(digits)
-    return None
+    match = _LEADING_YEAR_RE.match(value if isinstance(value, str) else str(value))
+    return int(match.group(1)) if match else None
 
 
 def _coerce_int(value: Any) -> int | None:
@@ -47,6 +47,19 @@ class EpisodeCandidateFetcher:
     """Fetch TV episode candidates from a provider for LLM planning."""
 
     tvdb: Any
+    # (endpoint, argument) -> provider result, shared by concurrent callers
+    _cache: CoalescingTTLCache = field(
+        default_factory=CoalescingTTLCache, init=False, repr=False
+    )
+    # series_id -> (episode list it was built from, ordered, by season)
+    _season_indexes: dict[
+        Any,
+        tuple[
+            list[dict[str, Any]],
+            list[dict[str, Any]],
+            dict[int, list[dict[str, Any]]],
+        ],
+    ] = field(default_factory=dict, init=False, repr=False)
 
     async def fetch(self, media_file: MediaFile) -> list[dict[str, Any]]:
         """Fetch and normalize potential episode matches for the given media file."""
@@ -54,7 +67,7 @@ class EpisodeCandidateFetcher:
         if not self.tvdb or not media_file.parsed_title:
             return []
 
-        series_candidates = await self.tvdb.search_series(media_file.parsed_title)
+        series_candidates = await self._search_series_cached(media_file.parsed_title)
         if not series_candidates:
             return []
 
@@ -66,22 +79,61 @@ class EpisodeCandidateFetcher:
         if series_id is None:
             return []
 
-        episodes = await self.tvdb.get_series_episodes(series_id)
-        normalized: list[dict[str, Any]] = []
+        episodes = await self._get_episodes_coalesced(series_id)
+        ordered, by_season = self._season_index(series_id, episodes)
+        if media_file.parsed_season:
+            return list(by_season.get(media_file.parsed_season, ()))
+        return list(ordered)
+
+    def _season_index(
+        self, series_id: Any, episodes: list[dict[str, Any]]
+    ) -> tuple[list[dict[str, Any]], dict[int, list[dict[str, Any]]]]:
+        """Normalized episodes in order, plus the same grouped by season.
+
+        Built once per fetched episode list, so planning many files of one
+        show neither re-normalizes nor re-sorts its episodes.
+        """
+
+        memo = self._season_indexes.get(series_id)
+        if memo is not None and memo[0] is episodes:
+            return memo[1], memo[2]
+
+        ordered: list[dict[str, Any]] = []
         for raw_episode in episodes:
             normalized_ep = self._normalize_episode(raw_episode)
             if normalized_ep is not None:
-                normalized.append(normalized_ep)
+                ordered.append(normalized_ep)
+        ordered.sort(key=lambda ep: (ep["seasonNumber"], ep["number"]))
 
-        if media_file.parsed_season:
-            normalized = [
-                ep
-                for ep in normalized
-                if ep["seasonNumber"] == media_file.parsed_season
-            ]
-
-        normalized.sort(key=lambda ep: (ep["seasonNumber"], ep["number"]))
-        return normalized
+        by_season: dict[int, list[dict[str, Any]]] = {}
+        for episode in ordered:
+            by_season.setdefault(episode["seasonNumber"], []).append(episode)
+
+        self._season_indexes[series_id] = (episodes, ordered, by_season)
+        return ordered, by_season
+
+    async def _search_series_cached(self, title: str) -> Any:
+        """Search TVDB for a series, reusing results for ``CACHE_TTL_BY_TYPE``."""
+
+        return await self._cache.get_or_fetch(
+            ("search_series", title),
+            CACHE_TTL_BY_TYPE["series"],
+            lambda: self.tvdb.search_series(title),
+        )
+
+    async def _get_episodes_coalesced(self, series_id: Any) -> Any:
+        """Fetch a series' episodes, sharing one request among concurrent callers.
+
+        Files of one show planned in parallel all ask for the same series;
+        only the first issues the provider call and the rest await its result,
+        which is then reused until it expires.
+        """
+
+        return await self._cache.get_or_fetch(
+            ("get_series_episodes", series_id),
+            CACHE_TTL_BY_TYPE["episode"],
+            lambda: self.tvdb.get_series_episodes(series_id),
+        )
 
     def _select_series(
         self, candidates: list[dict[str, Any]], media_file: MediaFile
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import Any, Literal, Protocol, cast
 
@@ -11,6 +13,11 @@ from langchain.schema.runnable import RunnableLambda
 
 from namegnome_serve.core.deterministic_mapper import DeterministicMapper
 from namegnome_serve.routes.schemas import MediaFile, PlanItem, SourceRef
+from namegnome_serve.utils.json_codec import dumps
+
+#: Confidence for a unique exact (season, episode) candidate; not 1.0 because
+#: the series itself was picked without disambiguation
+_EXACT_MATCH_CONFIDENCE = 0.95
 
 
 class RunnableProtocol(Protocol):
@@ -37,19 +44,31 @@ class _Assignment:
 class FuzzyLLMMapper:
     """Use an LLM to resolve ambiguous TV mappings and anthology episodes."""
 
-    def __init__(self, llm: RunnableProtocol) -> None:
+    def __init__(self, llm: RunnableProtocol, cache_size: int = 256) -> None:
+        """Wrap ``llm``; up to ``cache_size`` responses are reused by payload."""
         self._llm = llm
+        self._cache_size = cache_size
+        # blake2b digest of the canonical prompt payload -> LLM response
+        self._cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
 
     def generate_tv_plan(
         self,
         media_file: MediaFile,
         provider_candidates: list[dict[str, Any]],
     ) -> list[PlanItem]:
-        """Produce plan items for ambiguous television inputs via LLM guidance."""
+        """Produce plan items for ambiguous television inputs via LLM guidance.
+
+        A non-anthology file whose season/episode matches exactly one
+        candidate is planned directly without calling the LLM.
+        """
 
         if not media_file.parsed_title:
             return []
 
+        exact = self._exact_plan_item(media_file, provider_candidates)
+        if exact is not None:
+            return [exact]
+
         prompt_payload = {
             "media": {
                 "title": media_file.parsed_title,
@@ -64,7 +83,7 @@ class FuzzyLLMMapper:
             str(candidate.get("id")): candidate for candidate in provider_candidates
         }
 
-        response = self._llm.invoke(prompt_payload)
+        response = self._invoke_cached(prompt_payload)
         assignments = (
             response.get("assignments") if isinstance(response, dict) else None
         )
@@ -210,6 +229,85 @@ class FuzzyLLMMapper:
         ordered.sort(key=lambda entry: (entry[0], entry[1]))
         return [plan for _, _, plan in ordered]
 
+    def _invoke_cached(self, payload: dict[str, Any]) -> Any:
+        """Call the LLM, reusing the response for an identical payload.
+
+        Rescans re-plan the same files with the same candidates, so a
+        repeated payload is answered from memory instead of another LLM call.
+        Only well-formed responses are cached.
+        """
+
+        try:
+            key = hashlib.blake2b(dumps(payload, sort_keys=True)).hexdigest()
+        except (TypeError, ValueError):
+            # Not canonically serialisable; skip caching rather than fail
+            return self._llm.invoke(payload)
+
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
+
+        response = self._llm.invoke(payload)
+        if isinstance(response, dict) and isinstance(response.get("assignments"), list):
+            self._cache[key] = response
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return response
+
+    @staticmethod
+    def _exact_plan_item(
+        media_file: MediaFile, provider_candidates: list[dict[str, Any]]
+    ) -> PlanItem | None:
+        """Plan a single-episode file whose numbering matches one candidate.
+
+        Anthology files may span several episodes and always go to the LLM.
+        """
+
+        season, episode = media_file.parsed_season, media_file.parsed_episode
+        if (
+            media_file.anthology_candidate
+            or media_file.parsed_title is None
+            or season is None
+            or episode is None
+        ):
+            return None
+
+        matches = [
+            candidate
+            for candidate in provider_candidates
+            if candidate.get("seasonNumber") == season
+            and candidate.get("number") == episode
+        ]
+        if len(matches) != 1:
+            return None
+
+        candidate = matches[0]
+        episode_title = candidate.get("name") or None
+        dst_path = DeterministicMapper._build_tv_path(
+            media_file.parsed_title,
+            season,
+            episode,
+            str(episode_title) if episode_title is not None else None,
+        )
+        identifier = candidate.get("id")
+        sources = (
+            [SourceRef(provider="tvdb", id=str(identifier))]
+            if identifier is not None
+            else []
+        )
+        return PlanItem(
+            src_path=media_file.path,
+            dst_path=dst_path,
+            reason=(
+                f"Exact provider match for '{media_file.parsed_title}' "
+                f"S{season:02d}E{episode:02d}"
+            ),
+            confidence=_EXACT_MATCH_CONFIDENCE,
+            sources=sources,
+            warnings=[],
+        )
+
     @staticmethod
     def _normalize_assignments(assignments: list[_Assignment]) -> None:
         """Ensure episode ranges are contiguous and non-overlapping."""
@@ -28,6 +28,18 @@ class PlanEngine:
             else (EpisodeCandidateFetcher(tvdb) if tvdb is not None else None)
         )
 
+    async def warmup(self) -> None:
+        """Let the deterministic mapper authenticate its providers early."""
+        warmup = getattr(self._deterministic, "warmup", None)
+        if callable(warmup):
+            await warmup()
+
+    async def aclose(self) -> None:
+        """Release the deterministic mapper's pooled HTTP connections."""
+        aclose = getattr(self._deterministic, "aclose", None)
+        if callable(aclose):
+            await aclose()
+
     async def generate_plan(
         self,
         media_file: MediaFile,
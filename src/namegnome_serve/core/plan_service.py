@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 from collections.abc import Sequence
 from datetime import datetime
 from typing import Any
 
+from namegnome_serve.cache.provider_cache import ProviderCache
 from namegnome_serve.chains.fuzzy import create_fuzzy_tv_mapper
-from namegnome_serve.core.deterministic_mapper import DeterministicMapper
+from namegnome_serve.core.deterministic_mapper import (
+    DeterministicMapper,
+    resolve_map_concurrency,
+)
 from namegnome_serve.core.episode_fetcher import EpisodeCandidateFetcher
 from namegnome_serve.core.llm_mapper import FuzzyLLMMapper, RunnableProtocol
 from namegnome_serve.core.plan_engine import PlanEngine
@@ -18,6 +23,10 @@ from namegnome_serve.core.plan_review import (
     build_plan_review,
 )
 from namegnome_serve.routes.schemas import MediaFile, ScanResult
+from namegnome_serve.utils.json_codec import dumps, dumps_indented
+
+#: Media files planned at the same time; provider lookups are network-bound
+DEFAULT_PLAN_CONCURRENCY = 16
 
 
 def create_plan_engine(
@@ -25,10 +34,17 @@ def create_plan_engine(
     deterministic: DeterministicMapper | None = None,
     fuzzy: FuzzyLLMMapper | None = None,
     llm: RunnableProtocol | None = None,
+    provider_cache: ProviderCache | None = None,
 ) -> PlanEngine:
-    """Build a plan engine with deterministic + fuzzy strategies wired together."""
+    """Build a plan engine with deterministic + fuzzy strategies wired together.
 
-    deterministic_mapper = deterministic or DeterministicMapper()
+    Pass ``provider_cache`` (the CLI opens the on-disk one) to persist every
+    provider lookup, fallbacks included, so later runs start warm.
+    """
+
+    deterministic_mapper = deterministic or DeterministicMapper(
+        provider_cache=provider_cache
+    )
 
     fuzzy_mapper = fuzzy or create_fuzzy_tv_mapper(llm=llm)
 
@@ -51,22 +67,39 @@ async def build_plan_review_payload(
     scan_id: str | None = None,
     source_fingerprint: str | None = None,
     generated_at: datetime | None = None,
+    concurrency: int | None = None,
 ) -> dict[str, Any]:
-    """Assemble a PlanReview payload for a batch of media files."""
+    """Assemble a PlanReview payload for a batch of media files.
 
-    sources: list[PlanReviewSourceInput] = []
-    for media_file, raw_candidates in items:
+    Up to ``concurrency`` files are planned at once so provider round trips
+    overlap; sources keep the order of ``items``. When omitted it comes from
+    ``NAMEGNOME_MAP_CONCURRENCY``, else ``DEFAULT_PLAN_CONCURRENCY``.
+    """
+
+    if concurrency is None:
+        concurrency = resolve_map_concurrency(DEFAULT_PLAN_CONCURRENCY)
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def _plan_one(
+        media_file: MediaFile, raw_candidates: Sequence[dict[str, Any]] | None
+    ) -> PlanReviewSourceInput:
         prepared_candidates = (
             [dict(candidate) for candidate in raw_candidates]
             if raw_candidates
             else None
         )
-        inputs = await engine.generate_plan_inputs(
-            media_file,
-            media_type,
-            provider_candidates=prepared_candidates,
+        async with semaphore:
+            return await engine.generate_plan_inputs(
+                media_file,
+                media_type,
+                provider_candidates=prepared_candidates,
+            )
+
+    sources: list[PlanReviewSourceInput] = list(
+        await asyncio.gather(
+            *(_plan_one(media_file, candidates) for media_file, candidates in items)
         )
-        sources.append(inputs)
+    )
 
     return build_plan_review(
         media_type=media_type,
@@ -138,6 +171,18 @@ async def plan_scan_result_json(
         generated_at=generated_at,
     )
 
+    # The common layouts go through json_codec (orjson when installed), whose
+    # output matches json.dumps byte for byte only while it is pure ASCII.
+    # Anything else is re-encoded below so non-ASCII text keeps its \u
+    # escapes and this public output stays unchanged.
+    if indent is None or indent == 2:
+        encode = dumps if indent is None else dumps_indented
+        try:
+            payload = encode(review, sort_keys=sort_keys)
+        except TypeError:
+            payload = b""
+        if payload and payload.isascii():
+            return payload.decode("ascii")
     return json.dumps(
         review,
         indent=indent,
@@ -9,9 +9,9 @@ from pathlib import Path
 from typing import Any, Literal
 
 from namegnome_serve.core.constants import (
-    MOVIE_EXTENSIONS,
-    MUSIC_EXTENSIONS,
-    TV_EXTENSIONS,
+    MOVIE_EXTENSIONS_SET,
+    MUSIC_EXTENSIONS_SET,
+    TV_EXTENSIONS_SET,
 )
 from namegnome_serve.core.parser import parse_filename
 from namegnome_serve.routes.schemas import MediaFile, ScanResult
@@ -38,11 +38,11 @@ def scan(
     """
     # Determine which extensions to look for based on media type
     if media_type == "tv":
-        extensions = set(TV_EXTENSIONS)
+        extensions = TV_EXTENSIONS_SET
     elif media_type == "movie":
-        extensions = set(MOVIE_EXTENSIONS)
+        extensions = MOVIE_EXTENSIONS_SET
     elif media_type == "music":
-        extensions = set(MUSIC_EXTENSIONS)
+        extensions = MUSIC_EXTENSIONS_SET
     else:
         raise ValueError(f"Invalid media_type: {media_type}")
 
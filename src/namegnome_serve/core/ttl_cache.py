@@ -0,0 +1,100 @@
+"""In-memory TTL cache for provider lookups with request coalescing.
+
+Shared by the deterministic mapper and the episode candidate fetcher: a
+lookup repeated across files is answered from memory until it expires, and
+concurrent misses for one key await a single provider call.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+#: Empty provider results are retried sooner in case the provider catches up
+NEGATIVE_TTL = 60 * 60
+
+
+def result_lifetime(value: Any, ttl: float) -> float:
+    """Seconds a provider result stays fresh; empty results expire sooner."""
+    return ttl if value else min(ttl, NEGATIVE_TTL)
+
+
+class CoalescingTTLCache:
+    """Provider results keyed by lookup, expiring on the monotonic clock.
+
+    With ``maxsize``, the least recently used entries are evicted beyond that
+    many, so a long-lived owner does not grow without bound.
+    """
+
+    def __init__(self, maxsize: int | None = None) -> None:
+        self.maxsize = maxsize
+        # key -> (expires_at, value), least recently used first
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        # key -> fetch shared by every concurrent miss
+        self._inflight: dict[Hashable, asyncio.Future[Any]] = {}
+
+    def fresh(self, key: Hashable) -> tuple[float, Any] | None:
+        """Return ``(expires_at, value)`` for ``key`` unless it has expired."""
+        hit = self._entries.get(key)
+        if hit is None:
+            return None
+        if hit[0] <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return hit
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        """Remember ``value`` for ``ttl`` seconds (less if it is empty)."""
+        self._entries[key] = (time.monotonic() + result_lifetime(value, ttl), value)
+        self._entries.move_to_end(key)
+        if self.maxsize is not None:
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    async def get_or_fetch(
+        self,
+        key: Hashable,
+        ttl: float,
+        fetch: Callable[[], Awaitable[Any]],
+        *,
+        store: bool = True,
+    ) -> Any:
+        """Return a fresh cached value, or fetch it once for all waiters.
+
+        Exceptions are not cached. With ``store=False`` the fetch is still
+        shared, but caching its result is left to ``fetch`` (via ``set``).
+
+        Args:
+            key: Hashable identifier of the lookup
+            ttl: Seconds a non-empty result stays fresh
+            fetch: Callable producing the provider coroutine
+            store: Whether to cache the fetched result
+
+        Returns:
+            The cached or fetched value
+        """
+        hit = self.fresh(key)
+        if hit is not None:
+            return hit[1]
+
+        pending = self._inflight.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(fetch())
+            self._inflight[key] = pending
+            pending.add_done_callback(
+                lambda done: self._settle(key, ttl if store else None, done)
+            )
+        # Shield so one cancelled caller does not cancel the shared fetch
+        return await asyncio.shield(pending)
+
+    def _settle(
+        self, key: Hashable, ttl: float | None, done: asyncio.Future[Any]
+    ) -> None:
+        self._inflight.pop(key, None)
+        if ttl is None or done.cancelled() or done.exception() is not None:
+            return
+        self.set(key, done.result(), ttl)
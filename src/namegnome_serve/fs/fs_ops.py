@@ -8,6 +8,8 @@ import json
 import os
 import shutil
 import uuid
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
@@ -79,8 +81,9 @@ def rename_with_rollback(
     src = normalize_path(src)
     dst = normalize_path(dst)
 
-    # Get pre-operation stats
-    pre_stats = get_file_stats(src) if src.exists() else {}
+    # Get pre-operation stats; the single stat also tells us whether src exists
+    pre_stats = get_file_stats(src)
+    src_exists = bool(pre_stats)
 
     # Handle dry run
     if dry_run:
@@ -104,7 +107,7 @@ def rename_with_rollback(
         )
 
     # Check for source existence
-    if not src.exists():
+    if not src_exists:
         entry = {
             "ts": datetime.now(UTC).isoformat(),
             "op": "rename",
@@ -212,11 +215,12 @@ def rename_with_rollback(
             pre=pre_stats,
         )
 
-    # Handle case-insensitive filesystem case changes
+    # Handle case-insensitive filesystem case changes. The filesystem probe
+    # creates and removes files, so only run it for case-only renames.
     if (
-        is_case_insensitive_fs(src)
+        src != dst
         and str(src).lower() == str(dst).lower()
-        and src != dst
+        and is_case_insensitive_fs(src)
     ):
         temp_path = get_temp_path_for_case_change(dst)
         try:
@@ -305,8 +309,8 @@ def rename_with_rollback(
                     pre=pre_stats,
                 )
 
-    # Get post-operation stats
-    post_stats = get_file_stats(dst) if dst.exists() else {}
+    # Get post-operation stats (empty if dst is missing)
+    post_stats = get_file_stats(dst)
 
     # Record successful operation
     entry = {
@@ -343,24 +347,36 @@ def apply_plan_items(
     plan_id: str,
     mode: Literal["transactional", "continue_on_error", "dry_run"] = "transactional",
     on_collision: Literal["backup", "overwrite", "skip"] = "backup",
+    report_id: str | None = None,
+    max_workers: int | None = None,
 ) -> ApplyReport:
     """Apply a list of plan items with rollback manifest.
 
+    In ``continue_on_error`` mode, items are renamed on a thread pool, one
+    worker per destination directory at a time, unless one item's source is
+    another item's destination (then order matters and items run serially).
+    The manifest is fsynced once per batch of renames into one directory,
+    and before any rename that moves an earlier rename's destination.
+
     Args:
         items: List of plan items to apply
         root: Root directory for the apply operation
         plan_id: Plan identifier
         mode: Apply mode (transactional, continue_on_error, dry_run)
         on_collision: Collision handling strategy
+        report_id: Optional report identifier; generated when omitted
+        max_workers: Thread pool size for ``continue_on_error`` mode
+            (default ``min(32, cpu_count * 4)``; ``1`` forces serial apply)
 
     Returns:
         ApplyReport with operation summary
     """
-    report_id = str(uuid.uuid4())
+    report_id = report_id or str(uuid.uuid4())
     applied_count = 0
     skipped_count = 0
     failed_count = 0
     errors: list[str] = []
+    dry_run = mode == "dry_run"
 
     with RollbackWriter(
         report_id=report_id,
@@ -369,38 +385,32 @@ def apply_plan_items(
         collision_strategy=on_collision,
         plan_id=plan_id,
     ) as manifest:
-        for item in items:
-            try:
-                outcome = rename_with_rollback(
-                    src=item.src_path,
-                    dst=item.dst_path,
-                    manifest=manifest,
-                    on_collision=on_collision,
-                    dry_run=(mode == "dry_run"),
-                )
+        groups = (
+            _group_independent_items(items)
+            if mode == "continue_on_error" and max_workers != 1
+            else None
+        )
+        if groups is not None and len(groups) > 1:
+            results = _apply_groups_parallel(
+                groups,
+                manifest,
+                on_collision,
+                max_workers or min(32, (os.cpu_count() or 1) * 4),
+            )
+        else:
+            results = _apply_serial(
+                items, manifest, on_collision, dry_run, mode == "transactional"
+            )
 
-                if outcome.status == "applied":
-                    applied_count += 1
-                elif outcome.status == "skipped_collision":
-                    skipped_count += 1
-                elif outcome.status == "failed":
-                    failed_count += 1
-                    if outcome.reason:
-                        errors.append(f"{item.src_path}: {outcome.reason}")
-
-                    # Stop on first failure in transactional mode
-                    if mode == "transactional":
-                        break
-
-            except Exception as e:
-                failed_count += 1
-                error_msg = f"{item.src_path}: unexpected error: {e}"
-                errors.append(error_msg)
-                debug(f"Unexpected error in apply_plan_items: {e}")
-
-                # Stop on first failure in transactional mode
-                if mode == "transactional":
-                    break
+    for status, error in results:
+        if status == "applied":
+            applied_count += 1
+        elif status == "skipped_collision":
+            skipped_count += 1
+        elif status == "failed":
+            failed_count += 1
+        if error:
+            errors.append(error)
 
     return ApplyReport(
         total_items=len(items),
@@ -411,3 +421,111 @@ def apply_plan_items(
         manifest_path=root / ".namegnome" / "rollbacks" / f"{report_id}.jsonl",
         errors=errors if errors else None,
     )
+
+
+def _apply_item(
+    item: PlanItem,
+    manifest: RollbackWriter,
+    on_collision: Literal["backup", "overwrite", "skip"],
+    dry_run: bool,
+) -> tuple[str, str | None]:
+    """Apply one plan item, returning its status and an optional error line."""
+    try:
+        outcome = rename_with_rollback(
+            src=item.src_path,
+            dst=item.dst_path,
+            manifest=manifest,
+            on_collision=on_collision,
+            dry_run=dry_run,
+        )
+    except Exception as e:
+        debug(f"Unexpected error in apply_plan_items: {e}")
+        return "failed", f"{item.src_path}: unexpected error: {e}"
+
+    if outcome.status == "failed" and outcome.reason:
+        return outcome.status, f"{item.src_path}: {outcome.reason}"
+    return outcome.status, None
+
+
+def _apply_serial(
+    items: list[PlanItem],
+    manifest: RollbackWriter,
+    on_collision: Literal["backup", "overwrite", "skip"],
+    dry_run: bool,
+    stop_on_failure: bool,
+) -> list[tuple[str, str | None]]:
+    """Apply items in plan order, flushing the manifest between batches.
+
+    A batch is a run of items renamed into one directory; it also ends
+    before an item whose source is a destination not yet flushed, so a
+    rename never builds on one whose record could still be lost.
+    """
+    results: list[tuple[str, str | None]] = []
+    directory: str | None = None
+    unflushed: set[str] = set()
+    for item in items:
+        parent = str(item.dst_path.parent).lower()
+        if parent != directory or str(item.src_path).lower() in unflushed:
+            manifest.flush()
+            directory = parent
+            unflushed.clear()
+
+        status, error = _apply_item(item, manifest, on_collision, dry_run)
+        results.append((status, error))
+        unflushed.add(str(item.dst_path).lower())
+
+        # Stop on first failure in transactional mode
+        if status == "failed" and stop_on_failure:
+            break
+    return results
+
+
+def _group_independent_items(
+    items: list[PlanItem],
+) -> list[list[tuple[int, PlanItem]]] | None:
+    """Group items by destination directory for parallel apply.
+
+    Returns None when an item's source is another item's destination, since
+    such chains must run in plan order. Keys are lowercased so directories
+    that only differ by case share a group on case-insensitive filesystems.
+    """
+    sources = {str(item.src_path).lower() for item in items}
+    if any(str(item.dst_path).lower() in sources for item in items):
+        return None
+
+    groups: defaultdict[str, list[tuple[int, PlanItem]]] = defaultdict(list)
+    for index, item in enumerate(items):
+        groups[str(item.dst_path.parent).lower()].append((index, item))
+    return list(groups.values())
+
+
+def _apply_groups_parallel(
+    groups: list[list[tuple[int, PlanItem]]],
+    manifest: RollbackWriter,
+    on_collision: Literal["backup", "overwrite", "skip"],
+    max_workers: int,
+) -> list[tuple[str, str | None]]:
+    """Apply each group serially on its own worker; results keep plan order.
+
+    Each group flushes the manifest once its renames are done, so one fsync
+    covers the whole group.
+    """
+
+    def run_group(
+        group: list[tuple[int, PlanItem]],
+    ) -> list[tuple[int, tuple[str, str | None]]]:
+        try:
+            return [
+                (index, _apply_item(item, manifest, on_collision, dry_run=False))
+                for index, item in group
+            ]
+        finally:
+            manifest.flush()
+
+    indexed: list[tuple[int, tuple[str, str | None]]] = []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(groups))) as executor:
+        for group_results in executor.map(run_group, groups):
+            indexed.extend(group_results)
+
+    indexed.sort(key=lambda pair: pair[0])
+    return [result for _, result in indexed]
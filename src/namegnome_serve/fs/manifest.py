@@ -4,15 +4,16 @@ This module provides functionality to write rollback manifests in JSONL format,
 capturing all filesystem operations for potential rollback.
 """
 
-import json
 import os
 import platform
+import threading
 import uuid
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
 from namegnome_serve.utils.debug import debug
+from namegnome_serve.utils.json_codec import dumps
 
 
 class RollbackWriter:
@@ -21,8 +22,19 @@ class RollbackWriter:
     Each manifest file contains:
     - Header line with metadata (type: "header")
     - One JSON object per operation (rename, skip, etc.)
+
+    Lines are buffered in memory and written with a single ``os.writev``
+    call (followed by one ``fsync``) once the buffer reaches ``FLUSH_BYTES``
+    or ``FLUSH_LINES``, or when ``flush()``/``close()`` is called. Callers
+    applying a batch of renames flush at the end of the batch, so one fsync
+    makes all of its records durable.
     """
 
+    #: Buffered bytes that trigger a flush
+    FLUSH_BYTES = 64 * 1024
+    #: Buffered lines that trigger a flush; stays well below IOV_MAX (1024)
+    FLUSH_LINES = 512
+
     def __init__(
         self,
         report_id: str,
@@ -46,8 +58,13 @@ class RollbackWriter:
         self.collision_strategy = collision_strategy
         self.plan_id = plan_id
         self._manifest_path: Path | None = None
-        self._manifest_file: Any = None
+        self._fd: int | None = None
+        self._buffer: list[bytes] = []
+        self._buffered_bytes = 0
         self._header_written = False
+        # Guards the buffer and header so items applied from worker threads
+        # can share one writer; re-entrant because append() writes the header.
+        self._lock = threading.RLock()
 
         # Ensure rollback directory exists and is writable
         self._ensure_rollback_directory()
@@ -75,60 +92,92 @@ class RollbackWriter:
 
     def write_header(self) -> None:
         """Write manifest header with session metadata."""
-        if self._header_written:
-            return
-
-        header = {
-            "type": "header",
-            "schema_version": "1.0",
-            "report_id": self.report_id,
-            "plan_id": self.plan_id,
-            "generated_at": datetime.now(UTC).isoformat(),
-            "root": str(self.root),
-            "mode": self.mode,
-            "collision_strategy": self.collision_strategy,
-            "system": {
-                "os": platform.system(),
-                "fs_case_insensitive": self._is_case_insensitive_fs(),
-            },
-        }
-
-        self._write_line(header)
-        self._header_written = True
+        with self._lock:
+            if self._header_written:
+                return
+
+            header = {
+                "type": "header",
+                "schema_version": "1.0",
+                "report_id": self.report_id,
+                "plan_id": self.plan_id,
+                "generated_at": datetime.now(UTC).isoformat(),
+                "root": str(self.root),
+                "mode": self.mode,
+                "collision_strategy": self.collision_strategy,
+                "system": {
+                    "os": platform.system(),
+                    "fs_case_insensitive": self._is_case_insensitive_fs(),
+                },
+            }
+
+            self._write_line(header)
+            self._header_written = True
         debug(f"Wrote manifest header for report {self.report_id}")
 
     def append(self, entry: dict[str, Any]) -> None:
         """Append an operation entry to the manifest.
 
+        The entry may stay buffered until the next flush.
+
         Args:
             entry: Operation data to append
         """
-        if not self._header_written:
-            self.write_header()
-
-        self._write_line(entry)
+        with self._lock:
+            if not self._header_written:
+                self.write_header()
+            self._write_line(entry)
         debug(
             f"Appended manifest entry: {entry.get('op', 'unknown')} - "
             f"{entry.get('status', 'unknown')}"
         )
 
     def _write_line(self, data: dict[str, Any]) -> None:
-        """Write a JSON line to the manifest file."""
-        if self._manifest_file is None:
-            if self._manifest_path is None:
-                raise RuntimeError("Manifest path not set")
-            self._manifest_file = open(self._manifest_path, "w", encoding="utf-8")
-
-        json_line = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
-        self._manifest_file.write(json_line + "\n")
-        self._manifest_file.flush()
-        os.fsync(self._manifest_file.fileno())
+        """Buffer a JSON line, flushing once a threshold is reached."""
+        line = dumps(data) + b"\n"
+        self._buffer.append(line)
+        self._buffered_bytes += len(line)
+        if (
+            self._buffered_bytes >= self.FLUSH_BYTES
+            or len(self._buffer) >= self.FLUSH_LINES
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """Write buffered lines to disk and fsync the manifest."""
+        with self._lock:
+            if not self._buffer:
+                return
+
+            if self._fd is None:
+                if self._manifest_path is None:
+                    raise RuntimeError("Manifest path not set")
+                self._fd = os.open(
+                    self._manifest_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644
+                )
+
+            written = 0
+            if hasattr(os, "writev"):
+                written = os.writev(self._fd, self._buffer)
+            if written < self._buffered_bytes:
+                # Short write (or no writev on Windows): finish with plain writes
+                pending = memoryview(b"".join(self._buffer))[written:]
+                while pending:
+                    pending = pending[os.write(self._fd, pending) :]
+            os.fsync(self._fd)
+
+            self._buffer.clear()
+            self._buffered_bytes = 0
 
     def close(self) -> None:
-        """Close the manifest file."""
-        if self._manifest_file is not None:
-            self._manifest_file.close()
-            self._manifest_file = None
+        """Flush buffered lines and close the manifest file."""
+        with self._lock:
+            try:
+                self.flush()
+            finally:
+                if self._fd is not None:
+                    os.close(self._fd)
+                    self._fd = None
         debug(f"Closed manifest file: {self._manifest_path}")
 
     def _is_case_insensitive_fs(self) -> bool:
@@ -10,6 +10,7 @@ from namegnome_serve.metadata.providers.base import (
     ProviderError,
     ProviderUnavailableError,
     RateLimitError,
+    create_http_client,
 )
 from namegnome_serve.metadata.providers.fanarttv import FanartTVProvider
 from namegnome_serve.metadata.providers.musicbrainz import MusicBrainzProvider
@@ -32,4 +33,5 @@ __all__ = [
     "AniDBProvider",
     "TheAudioDBProvider",
     "TVMazeProvider",
+    "create_http_client",
 ]
@@ -18,7 +18,11 @@ from typing import Any
 
 import httpx
 
-from namegnome_serve.metadata.providers.base import BaseProvider, ProviderError
+from namegnome_serve.metadata.providers.base import (
+    BaseProvider,
+    ProviderError,
+    decode_json,
+)
 
 
 class FanartTVProvider(BaseProvider):
@@ -91,7 +95,7 @@ class FanartTVProvider(BaseProvider):
                 params={"api_key": self._api_key},
             )
             response.raise_for_status()
-            data: dict[str, Any] = response.json()
+            data: dict[str, Any] = decode_json(response)
             return data
 
         except httpx.HTTPStatusError as e:
@@ -116,7 +120,7 @@ class FanartTVProvider(BaseProvider):
                 f"{self.BASE_URL}/tv/{tvdb_id}", params={"api_key": self._api_key}
             )
             response.raise_for_status()
-            data: dict[str, Any] = response.json()
+            data: dict[str, Any] = decode_json(response)
             return data
 
         except httpx.HTTPStatusError as e:
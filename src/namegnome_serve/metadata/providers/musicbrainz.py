@@ -17,7 +17,11 @@ from typing import Any
 
 import httpx
 
-from namegnome_serve.metadata.providers.base import BaseProvider, ProviderError
+from namegnome_serve.metadata.providers.base import (
+    BaseProvider,
+    ProviderError,
+    decode_json,
+)
 
 
 class MusicBrainzProvider(BaseProvider):
@@ -28,8 +32,13 @@ class MusicBrainzProvider(BaseProvider):
         "NameGnomeServe/1.0 (https://github.com/DouglasMacKrell/namegnome-serve)"
     )
 
-    def __init__(self) -> None:
-        """Initialize MusicBrainz provider (no API key needed)."""
+    def __init__(self, http_client: httpx.AsyncClient | None = None) -> None:
+        """Initialize MusicBrainz provider (no API key needed).
+
+        Args:
+            http_client: Optional shared client; when omitted the provider
+                creates and owns its own.
+        """
         super().__init__(
             provider_name="MusicBrainz",
             api_key_env_var="",  # No API key required!
@@ -38,7 +47,8 @@ class MusicBrainzProvider(BaseProvider):
         )
 
         # httpx async client
-        self._client: httpx.AsyncClient = httpx.AsyncClient(timeout=10.0)
+        self._owns_client = http_client is None
+        self._client: httpx.AsyncClient = http_client or httpx.AsyncClient(timeout=10.0)
 
     def _get_headers(self) -> dict[str, str]:
         """Get headers with required User-Agent.
@@ -102,7 +112,7 @@ class MusicBrainzProvider(BaseProvider):
                 params={"query": query, "limit": limit, "fmt": "json"},
             )
             response.raise_for_status()
-            data: dict[str, Any] = response.json()
+            data: dict[str, Any] = decode_json(response)
             results: list[dict[str, Any]] = data.get("recordings", [])
             return results
 
@@ -122,7 +132,7 @@ class MusicBrainzProvider(BaseProvider):
                     params={"query": query, "limit": limit, "fmt": "json"},
                 )
                 response.raise_for_status()
-                retry_data = response.json()
+                retry_data = decode_json(response)
                 retry_results: list[dict[str, Any]] = retry_data.get("recordings", [])
                 return retry_results
 
@@ -148,7 +158,7 @@ class MusicBrainzProvider(BaseProvider):
                 params={"query": name, "limit": limit, "fmt": "json"},
             )
             response.raise_for_status()
-            data: dict[str, Any] = response.json()
+            data: dict[str, Any] = decode_json(response)
             results: list[dict[str, Any]] = data.get("artists", [])
             return results
 
@@ -168,7 +178,7 @@ class MusicBrainzProvider(BaseProvider):
                     params={"query": name, "limit": limit, "fmt": "json"},
                 )
                 response.raise_for_status()
-                retry_data = response.json()
+                retry_data = decode_json(response)
                 retry_results: list[dict[str, Any]] = retry_data.get("artists", [])
                 return retry_results
 
@@ -193,7 +203,7 @@ class MusicBrainzProvider(BaseProvider):
                 params={"fmt": "json"},
             )
             response.raise_for_status()
-            data: dict[str, Any] = response.json()
+            data: dict[str, Any] = decode_json(response)
             return data
 
         except httpx.HTTPStatusError as e:
@@ -229,5 +239,6 @@ class MusicBrainzProvider(BaseProvider):
         return self
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        """Async context manager exit - close client."""
-        await self._client.aclose()
+        """Async context manager exit - close client unless it is shared."""
+        if self._owns_client:
+            await self._client.aclose()
@@ -17,7 +17,11 @@ from typing import Any, cast
 
 import httpx
 
-from namegnome_serve.metadata.providers.base import BaseProvider, ProviderError
+from namegnome_serve.metadata.providers.base import (
+    BaseProvider,
+    ProviderError,
+    decode_json,
+)
 
 
 class OMDbProvider(BaseProvider):
@@ -25,8 +29,13 @@ class OMDbProvider(BaseProvider):
 
     BASE_URL = "http://www.omdbapi.com/"
 
-    def __init__(self) -> None:
-        """Initialize OMDb provider."""
+    def __init__(self, http_client: httpx.AsyncClient | None = None) -> None:
+        """Initialize OMDb provider.
+
+        Args:
+            http_client: Optional shared client; when omitted the provider
+                creates and owns its own.
+        """
         super().__init__(
             provider_name="OMDb",
             api_key_env_var="OMDB_API_KEY",
@@ -35,7 +44,8 @@ class OMDbProvider(BaseProvider):
         )
 
         # httpx async client
-        self._client: httpx.AsyncClient = httpx.AsyncClient(timeout=10.0)
+        self._owns_client = http_client is None
+        self._client: httpx.AsyncClient = http_client or httpx.AsyncClient(timeout=10.0)
 
     async def search(self, query: str, **kwargs: Any) -> list[dict[str, Any]]:
         """Search for movies by title.
@@ -93,7 +103,7 @@ class OMDbProvider(BaseProvider):
         try:
             response = await self._client.get(self.BASE_URL, params=params)
             response.raise_for_status()
-            data = cast(dict[str, Any], response.json())
+            data = cast(dict[str, Any], decode_json(response))
 
             # OMDb returns "Response": "True" or "False"
             if data.get("Response") == "True":
@@ -127,7 +137,7 @@ class OMDbProvider(BaseProvider):
         try:
             response = await self._client.get(self.BASE_URL, params=params)
             response.raise_for_status()
-            data = cast(dict[str, Any], response.json())
+            data = cast(dict[str, Any], decode_json(response))
 
             # OMDb returns "Response": "True" or "False"
             if data.get("Response") == "True":
@@ -160,7 +170,7 @@ class OMDbProvider(BaseProvider):
         try:
             response = await self._client.get(self.BASE_URL, params=params)
             response.raise_for_status()
-            data = cast(dict[str, Any], response.json())
+            data = cast(dict[str, Any], decode_json(response))
 
             if data.get("Response") == "True":
                 results = cast(list[dict[str, Any]], data.get("Search", []))
@@ -191,7 +201,7 @@ class OMDbProvider(BaseProvider):
         try:
             response = await self._client.get(self.BASE_URL, params=params)
             response.raise_for_status()
-            data = cast(dict[str, Any], response.json())
+            data = cast(dict[str, Any], decode_json(response))
 
             if data.get("Response") == "True":
                 return data
@@ -227,5 +237,6 @@ class OMDbProvider(BaseProvider):
         return self
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        """Async context manager exit - close client."""
-        await self._client.aclose()
+        """Async context manager exit - close client if we own it."""
+        if self._owns_client:
+            await self._client.aclose()
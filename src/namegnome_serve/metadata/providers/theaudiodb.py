@@ -16,7 +16,7 @@ from typing import Any, cast
 
 import httpx
 
-from namegnome_serve.metadata.providers.base import BaseProvider
+from namegnome_serve.metadata.providers.base import BaseProvider, decode_json
 
 
 class TheAudioDBProvider(BaseProvider):
@@ -25,8 +25,13 @@ class TheAudioDBProvider(BaseProvider):
     BASE_URL = "https://www.theaudiodb.com/api/v1/json"
     USER_AGENT = "NameGnome/1.0 (https://github.com/namegnome/namegnome-serve)"
 
-    def __init__(self) -> None:
-        """Initialize TheAudioDB provider."""
+    def __init__(self, http_client: httpx.AsyncClient | None = None) -> None:
+        """Initialize TheAudioDB provider.
+
+        Args:
+            http_client: Optional shared client; when omitted the provider
+                creates and owns its own.
+        """
         super().__init__(
             provider_name="TheAudioDB",
             api_key_env_var="THEAUDIODB_API_KEY",  # API key required
@@ -34,9 +39,12 @@ class TheAudioDBProvider(BaseProvider):
             max_retries=3,
         )
 
-        # httpx async client (context managed per request)
-        self._client: httpx.AsyncClient = httpx.AsyncClient(
-            timeout=10.0, headers={"User-Agent": self.USER_AGENT}
+        # httpx async client; a shared one lacks our User-Agent, so every
+        # request also sends it explicitly
+        self._owns_client = http_client is None
+        self._headers = {"User-Agent": self.USER_AGENT}
+        self._client: httpx.AsyncClient = http_client or httpx.AsyncClient(
+            timeout=10.0, headers=self._headers
         )
 
     async def search(self, query: str, **kwargs: Any) -> list[dict[str, Any]]:
@@ -83,10 +91,10 @@ class TheAudioDBProvider(BaseProvider):
             url = f"{self.BASE_URL}/{self.api_key}/search.php"
             params = {"s": artist_name}
 
-            response = await self._client.get(url, params=params)
+            response = await self._client.get(url, params=params, headers=self._headers)
             response.raise_for_status()
 
-            data = cast(dict[str, Any], response.json())
+            data = cast(dict[str, Any], decode_json(response))
             artists = cast(list[dict[str, Any]] | None, data.get("artists"))
             if artists:
                 return artists
@@ -108,10 +116,10 @@ class TheAudioDBProvider(BaseProvider):
             url = f"{self.BASE_URL}/{self.api_key}/artist.php"
             params = {"i": artist_id}
 
-            response = await self._client.get(url, params=params)
+            response = await self._client.get(url, params=params, headers=self._headers)
             response.raise_for_status()
 
-            data = cast(dict[str, Any], response.json())
+            data = cast(dict[str, Any], decode_json(response))
             artists = cast(list[dict[str, Any]] | None, data.get("artists"))
             if artists and len(artists) > 0:
                 return artists[0]
@@ -143,10 +151,10 @@ class TheAudioDBProvider(BaseProvider):
             if "s" not in params:
                 params["s"] = album_name
 
-            response = await self._client.get(url, params=params)
+            response = await self._client.get(url, params=params, headers=self._headers)
             response.raise_for_status()
 
-            data = cast(dict[str, Any], response.json())
+            data = cast(dict[str, Any], decode_json(response))
             albums = cast(list[dict[str, Any]] | None, data.get("album"))
             if albums:
                 return albums
@@ -168,10 +176,10 @@ class TheAudioDBProvider(BaseProvider):
             url = f"{self.BASE_URL}/{self.api_key}/album.php"
             params = {"m": album_id}
 
-            response = await self._client.get(url, params=params)
+            response = await self._client.get(url, params=params, headers=self._headers)
             response.raise_for_status()
 
-            data = cast(dict[str, Any], response.json())
+            data = cast(dict[str, Any], decode_json(response))
             albums = cast(list[dict[str, Any]] | None, data.get("album"))
             if albums and len(albums) > 0:
                 return albums[0]
@@ -200,10 +208,10 @@ class TheAudioDBProvider(BaseProvider):
             else:
                 params.setdefault("s", track_name)
 
-            response = await self._client.get(url, params=params)
+            response = await self._client.get(url, params=params, headers=self._headers)
             response.raise_for_status()
 
-            data = cast(dict[str, Any], response.json())
+            data = cast(dict[str, Any], decode_json(response))
             tracks = cast(list[dict[str, Any]] | None, data.get("track"))
             if tracks:
                 return tracks
@@ -225,10 +233,10 @@ class TheAudioDBProvider(BaseProvider):
             url = f"{self.BASE_URL}/{self.api_key}/track.php"
             params = {"h": track_id}
 
-            response = await self._client.get(url, params=params)
+            response = await self._client.get(url, params=params, headers=self._headers)
             response.raise_for_status()
 
-            data = cast(dict[str, Any], response.json())
+            data = cast(dict[str, Any], decode_json(response))
             tracks = cast(list[dict[str, Any]] | None, data.get("track"))
             if tracks and len(tracks) > 0:
                 return tracks[0]
@@ -250,10 +258,10 @@ class TheAudioDBProvider(BaseProvider):
             url = f"{self.BASE_URL}/{self.api_key}/artist.php"
             params = {"i": artist_id}
 
-            response = await self._client.get(url, params=params)
+            response = await self._client.get(url, params=params, headers=self._headers)
             response.raise_for_status()
 
-            data = cast(dict[str, Any], response.json())
+            data = cast(dict[str, Any], decode_json(response))
             artists = cast(list[dict[str, Any]] | None, data.get("artists"))
             if artists and len(artists) > 0:
                 artist = artists[0]
@@ -281,10 +289,10 @@ class TheAudioDBProvider(BaseProvider):
             url = f"{self.BASE_URL}/{self.api_key}/album.php"
             params = {"m": album_id}
 
-            response = await self._client.get(url, params=params)
+            response = await self._client.get(url, params=params, headers=self._headers)
             response.raise_for_status()
 
-            data = response.json()
+            data = decode_json(response)
             if data.get("album") and len(data["album"]) > 0:
                 album = data["album"][0]
                 return {
@@ -301,4 +309,5 @@ class TheAudioDBProvider(BaseProvider):
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         """Async context manager exit."""
-        await self._client.aclose()
+        if self._owns_client:
+            await self._client.aclose()
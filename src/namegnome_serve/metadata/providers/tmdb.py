@@ -15,7 +15,11 @@ from typing import Any
 
 import httpx
 
-from namegnome_serve.metadata.providers.base import BaseProvider, ProviderError
+from namegnome_serve.metadata.providers.base import (
+    BaseProvider,
+    ProviderError,
+    decode_json,
+)
 
 
 class TMDBProvider(BaseProvider):
@@ -24,8 +28,13 @@ class TMDBProvider(BaseProvider):
     BASE_URL = "https://api.themoviedb.org/3"
     IMAGE_BASE = "https://image.tmdb.org/t/p/original"
 
-    def __init__(self) -> None:
-        """Initialize TMDB provider with auto-detected auth method."""
+    def __init__(self, http_client: httpx.AsyncClient | None = None) -> None:
+        """Initialize TMDB provider with auto-detected auth method.
+
+        Args:
+            http_client: Optional shared client; when omitted the provider
+                creates and owns its own.
+        """
         super().__init__(
             provider_name="TMDB",
             api_key_env_var="TMDB_API_KEY",
@@ -34,7 +43,8 @@ class TMDBProvider(BaseProvider):
         )
 
         # httpx async client (context managed per request)
-        self._client: httpx.AsyncClient = httpx.AsyncClient(timeout=10.0)
+        self._owns_client = http_client is None
+        self._client: httpx.AsyncClient = http_client or httpx.AsyncClient(timeout=10.0)
 
     def _get_auth(self) -> tuple[dict[str, str], dict[str, Any]]:
         """Get auth headers and params based on key format.
@@ -127,7 +137,7 @@ class TMDBProvider(BaseProvider):
                     f"{self.BASE_URL}/search/movie", headers=headers, params=params
                 )
                 response.raise_for_status()
-                data: dict[str, Any] = response.json()
+                data: dict[str, Any] = decode_json(response)
                 results: list[dict[str, Any]] = data.get("results", [])
                 return results
             except httpx.HTTPStatusError as e:
@@ -166,7 +176,7 @@ class TMDBProvider(BaseProvider):
                     f"{self.BASE_URL}/search/tv", headers=headers, params=params
                 )
                 response.raise_for_status()
-                data: dict[str, Any] = response.json()
+                data: dict[str, Any] = decode_json(response)
                 results = data.get("results", [])
                 if not isinstance(results, list):
                     return []
@@ -201,7 +211,7 @@ class TMDBProvider(BaseProvider):
                     params=params,
                 )
                 response.raise_for_status()
-                payload: dict[str, Any] = response.json()
+                payload: dict[str, Any] = decode_json(response)
                 episodes = payload.get("episodes", [])
                 if not isinstance(episodes, list):
                     return []
@@ -222,7 +232,7 @@ class TMDBProvider(BaseProvider):
                 f"{self.BASE_URL}/tv/{series_id}", headers=headers, params=params
             )
             response.raise_for_status()
-            details_raw = response.json()
+            details_raw = decode_json(response)
             return dict(details_raw)
 
         details: dict[str, Any] = await self._execute_with_retry(
@@ -258,28 +268,20 @@ class TMDBProvider(BaseProvider):
 
         async def _do_get_details() -> dict[str, Any] | None:
             try:
-                # Get movie details
-                response = await self._client.get(
-                    f"{self.BASE_URL}/movie/{movie_id}", headers=headers, params=params
-                )
-                response.raise_for_status()
-                details: dict[str, Any] = response.json()
-
-                # Get images
-                if not self.check_rate_limit():
-                    raise ProviderError(f"{self.provider_name} rate limit exceeded")
-
-                img_params = params.copy()
-                if "api_key" in img_params:
-                    img_params["include_image_language"] = "en,en-US,null"
+                # One request: details with images appended
+                details_params = params.copy()
+                details_params["append_to_response"] = "images"
+                if "api_key" in details_params:
+                    details_params["include_image_language"] = "en,en-US,null"
 
-                img_response = await self._client.get(
-                    f"{self.BASE_URL}/movie/{movie_id}/images",
+                response = await self._client.get(
+                    f"{self.BASE_URL}/movie/{movie_id}",
                     headers=headers,
-                    params=img_params,
+                    params=details_params,
                 )
-                img_response.raise_for_status()
-                images: dict[str, Any] = img_response.json()
+                response.raise_for_status()
+                details: dict[str, Any] = decode_json(response)
+                images: dict[str, Any] = details.pop("images", None) or {}
 
                 # Add best poster
                 if images.get("posters"):
@@ -336,5 +338,6 @@ class TMDBProvider(BaseProvider):
         return self
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        """Async context manager exit - close client."""
-        await self._client.aclose()
+        """Async context manager exit - close client unless it is shared."""
+        if self._owns_client:
+            await self._client.aclose()
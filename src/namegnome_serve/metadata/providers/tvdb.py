@@ -18,7 +18,11 @@ from typing import Any
 
 import httpx
 
-from namegnome_serve.metadata.providers.base import BaseProvider, ProviderError
+from namegnome_serve.metadata.providers.base import (
+    BaseProvider,
+    ProviderError,
+    decode_json,
+)
 
 
 class TVDBProvider(BaseProvider):
@@ -26,8 +30,13 @@ class TVDBProvider(BaseProvider):
 
     BASE_URL = "https://api.thetvdb.com"
 
-    def __init__(self) -> None:
-        """Initialize TVDB v3 provider with JWT auth."""
+    def __init__(self, http_client: httpx.AsyncClient | None = None) -> None:
+        """Initialize TVDB v3 provider with JWT auth.
+
+        Args:
+            http_client: Optional shared client; when omitted the provider
+                creates and owns its own.
+        """
         super().__init__(
             provider_name="TVDB",
             api_key_env_var="TVDB_API_KEY",
@@ -36,7 +45,8 @@ class TVDBProvider(BaseProvider):
         )
 
         # httpx async client
-        self._client: httpx.AsyncClient = httpx.AsyncClient(timeout=10.0)
+        self._owns_client = http_client is None
+        self._client: httpx.AsyncClient = http_client or httpx.AsyncClient(timeout=10.0)
 
         # JWT token cache (in-memory)
         self._auth_token: str | None = None
@@ -66,7 +76,7 @@ class TVDBProvider(BaseProvider):
                 f"{self.BASE_URL}/login", json={"apikey": self.api_key}
             )
             response.raise_for_status()
-            data = response.json()
+            data = decode_json(response)
             if inspect.isawaitable(data):
                 data = await data
             data = dict(data)
@@ -79,6 +89,14 @@ class TVDBProvider(BaseProvider):
         except httpx.HTTPStatusError as e:
             raise ProviderError(f"TVDB authentication failed: {e}") from e
 
+    async def authenticate(self) -> None:
+        """Log in ahead of the first request so it skips the handshake.
+
+        Raises:
+            ProviderError: On authentication failure
+        """
+        await self._get_auth_token()
+
     async def _get_auth_headers(self) -> dict[str, str]:
         """Get headers with Bearer token for API requests.
 
@@ -119,7 +137,7 @@ class TVDBProvider(BaseProvider):
                 raise ValueError(f"Unsupported HTTP method: {method}")
 
             response.raise_for_status()
-            data = response.json()
+            data = decode_json(response)
             if inspect.isawaitable(data):
                 data = await data
             data = dict(data)
@@ -138,7 +156,7 @@ class TVDBProvider(BaseProvider):
                     response = await self._client.post(url, **kwargs)
 
                 response.raise_for_status()
-                result = response.json()
+                result = decode_json(response)
                 if inspect.isawaitable(result):
                     result = await result
                 result = dict(result)
@@ -264,5 +282,6 @@ class TVDBProvider(BaseProvider):
         return self
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        """Async context manager exit - close client."""
-        await self._client.aclose()
+        """Async context manager exit - close client unless it is shared."""
+        if self._owns_client:
+            await self._client.aclose()
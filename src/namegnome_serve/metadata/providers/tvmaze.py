@@ -6,7 +6,11 @@ from typing import Any
 
 import httpx
 
-from namegnome_serve.metadata.providers.base import BaseProvider, ProviderError
+from namegnome_serve.metadata.providers.base import (
+    BaseProvider,
+    ProviderError,
+    decode_json,
+)
 
 
 class TVMazeProvider(BaseProvider):
@@ -14,14 +18,15 @@ class TVMazeProvider(BaseProvider):
 
     BASE_URL = "https://api.tvmaze.com"
 
-    def __init__(self) -> None:
+    def __init__(self, http_client: httpx.AsyncClient | None = None) -> None:
         super().__init__(
             provider_name="TVMaze",
             api_key_env_var=None,
             rate_limit_per_minute=40,
             max_retries=3,
         )
-        self._client: httpx.AsyncClient = httpx.AsyncClient(timeout=10.0)
+        self._owns_client = http_client is None
+        self._client: httpx.AsyncClient = http_client or httpx.AsyncClient(timeout=10.0)
 
     async def search_series(self, name: str) -> list[dict[str, Any]]:
         """Search for a TV series by name."""
@@ -36,7 +41,7 @@ class TVMazeProvider(BaseProvider):
                     params={"q": name},
                 )
                 response.raise_for_status()
-                data = response.json()
+                data = decode_json(response)
                 return [entry.get("show", {}) for entry in data if entry.get("show")]
             except httpx.HTTPStatusError as exc:
                 if exc.response.status_code == 404:
@@ -68,7 +73,7 @@ class TVMazeProvider(BaseProvider):
                     params={"season": season, "number": episode},
                 )
                 response.raise_for_status()
-                data: dict[str, Any] = response.json()
+                data: dict[str, Any] = decode_json(response)
                 return data
             except httpx.HTTPStatusError as exc:
                 if exc.response.status_code == 404:
@@ -81,4 +86,5 @@ class TVMazeProvider(BaseProvider):
         return self
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        await self._client.aclose()
+        if self._owns_client:
+            await self._client.aclose()
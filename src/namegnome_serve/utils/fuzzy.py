@@ -0,0 +1,98 @@
+"""Fuzzy string scoring that uses rapidfuzz when it is installed.
+
+rapidfuzz is an optional speedup (``pip install namegnome-serve[speedups]``).
+Without it ``token_set_ratio`` falls back to a pure-Python port of the same
+algorithm: the normalised Indel similarity (``2 * LCS / total length``) of
+the sorted token sets, so both backends return identical scores.
+
+Usage:
+    from namegnome_serve.utils.fuzzy import token_set_ratio
+
+    token_set_ratio("The Office US", "The Office")  # 100.0
+"""
+
+import importlib
+from types import ModuleType
+
+_fuzz: ModuleType | None
+try:
+    _fuzz = importlib.import_module("rapidfuzz.fuzz")
+except ImportError:  # pragma: no cover - depends on installed extras
+    _fuzz = None
+
+__all__ = ["HAS_RAPIDFUZZ", "token_set_ratio"]
+
+HAS_RAPIDFUZZ = _fuzz is not None
+
+
+def _lcs_length(left: str, right: str) -> int:
+    """Length of the longest common subsequence (bit-parallel, Hyyrö 2004)."""
+    if not left or not right:
+        return 0
+    masks: dict[str, int] = {}
+    for position, char in enumerate(left):
+        masks[char] = masks.get(char, 0) | (1 << position)
+    full = (1 << len(left)) - 1
+    row = full
+    for char in right:
+        matches = row & masks.get(char, 0)
+        row = ((row + matches) | (row - matches)) & full
+    return len(left) - row.bit_count()
+
+
+def _indel_distance(left: str, right: str) -> int:
+    return len(left) + len(right) - 2 * _lcs_length(left, right)
+
+
+def _norm_similarity(distance: int, length_sum: int) -> float:
+    if not length_sum:
+        return 100.0
+    return 100 - 100 * distance / length_sum
+
+
+def token_set_ratio(left: str, right: str) -> float:
+    """Score two strings 0-100 by comparing their sets of words.
+
+    Word order and repeated words are ignored, and a string whose words are
+    all contained in the other scores 100.
+
+    Args:
+        left: First string
+        right: Second string
+
+    Returns:
+        Similarity score between 0 and 100
+    """
+    if _fuzz is not None:
+        return float(_fuzz.token_set_ratio(left, right, processor=str.lower))
+
+    left_tokens = set(left.lower().split())
+    right_tokens = set(right.lower().split())
+    if not left_tokens or not right_tokens:
+        return 0.0
+
+    common = left_tokens & right_tokens
+    left_only = " ".join(sorted(left_tokens - common))
+    right_only = " ".join(sorted(right_tokens - common))
+    if common and (not left_only or not right_only):
+        return 100.0
+
+    # "<common> <left_only>" vs "<common> <right_only>" share their prefix,
+    # so their Indel distance is that of the differing tails alone.
+    common_len = len(" ".join(common))
+    separator = 1 if common_len else 0
+    left_len = common_len + separator + len(left_only)
+    right_len = common_len + separator + len(right_only)
+    score = _norm_similarity(
+        _indel_distance(left_only, right_only), left_len + right_len
+    )
+    if not common_len:
+        return score
+
+    # Each joined string against the common words alone differs only by its
+    # tail, so the distance follows from the lengths.
+    return max(
+        score,
+        _norm_similarity(separator + len(left_only), common_len + left_len),
+        _norm_similarity(separator + len(right_only), common_len + right_len),
+    )
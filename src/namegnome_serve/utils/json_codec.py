@@ -0,0 +1,85 @@
+"""JSON helpers that use orjson when it is installed.
+
+orjson is an optional speedup (``pip install namegnome-serve[speedups]``).
+Without it these helpers fall back to the standard library using the same
+layout: compact separators, UTF-8 bytes, non-ASCII characters preserved.
+
+The two backends are not interchangeable for every input. orjson rejects
+dict keys that are not strings and integers outside the 64-bit range (both
+raise ``TypeError``), and it writes NaN/Infinity as ``null``. Callers that
+need ``json.dumps`` output exactly must fall back to it themselves.
+
+Usage:
+    from namegnome_serve.utils.json_codec import dumps, loads
+
+    line = dumps({"op": "rename"}) + b"\\n"
+    entry = loads(line)
+"""
+
+import json
+from types import ModuleType
+from typing import Any, cast
+
+_orjson: ModuleType | None
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - depends on installed extras
+    _orjson = None
+
+__all__ = ["HAS_ORJSON", "dumps", "dumps_indented", "loads"]
+
+HAS_ORJSON = _orjson is not None
+
+
+def loads(data: bytes | bytearray | memoryview | str) -> Any:
+    """Decode a JSON document from bytes or text.
+
+    Args:
+        data: Encoded JSON document
+
+    Returns:
+        Decoded Python object
+    """
+    if _orjson is not None:
+        return _orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def dumps(obj: Any, *, sort_keys: bool = False) -> bytes:
+    """Encode an object as compact UTF-8 JSON bytes.
+
+    Args:
+        obj: JSON-serialisable object
+        sort_keys: Whether to emit object keys in sorted order
+
+    Returns:
+        Encoded JSON document
+    """
+    if _orjson is not None:
+        option = _orjson.OPT_SORT_KEYS if sort_keys else 0
+        return cast(bytes, _orjson.dumps(obj, option=option))
+    return json.dumps(
+        obj, ensure_ascii=False, separators=(",", ":"), sort_keys=sort_keys
+    ).encode("utf-8")
+
+
+def dumps_indented(obj: Any, *, sort_keys: bool = False) -> bytes:
+    """Encode an object as UTF-8 JSON bytes indented by two spaces.
+
+    Args:
+        obj: JSON-serialisable object
+        sort_keys: Whether to emit object keys in sorted order
+
+    Returns:
+        Encoded JSON document
+    """
+    if _orjson is not None:
+        option = _orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= _orjson.OPT_SORT_KEYS
+        return cast(bytes, _orjson.dumps(obj, option=option))
+    return json.dumps(obj, ensure_ascii=False, indent=2, sort_keys=sort_keys).encode(
+        "utf-8"
+    )
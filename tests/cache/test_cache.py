@@ -213,3 +213,219 @@ async def test_cache_default_ttl():
         # Should still be available (default TTL not expired)
         result = await cache.get("provider", "key")
         assert result is not None
+
+
+@pytest.mark.asyncio
+async def test_cache_lookup_uses_an_index():
+    """The lookup query ProviderCache.get runs is an index search, not a scan."""
+    from namegnome_serve.cache.provider_cache import _SELECT_ENTRY_SQL, ProviderCache
+
+    async with ProviderCache(":memory:") as cache:
+        db = await cache._get_connection()
+        rows = db.execute(
+            f"EXPLAIN QUERY PLAN {_SELECT_ENTRY_SQL}",
+            ("key", "provider", time.time()),
+        ).fetchall()
+        plan = " ".join(row[-1] for row in rows)
+
+        assert "SEARCH cache_entries USING" in plan
+        assert "SCAN cache_entries" not in plan
+
+
+@pytest.mark.asyncio
+async def test_cache_lookup_index_excludes_payload():
+    """The lookup index must not copy cached payloads into its b-tree."""
+    from namegnome_serve.cache.provider_cache import ProviderCache
+
+    async with ProviderCache(":memory:") as cache:
+        db = await cache._get_connection()
+        columns = [
+            row[2]
+            for row in db.execute(
+                "PRAGMA index_info(idx_cache_entries_lookup)"
+            ).fetchall()
+        ]
+
+        assert columns == ["cache_key", "provider", "expires_at"]
+
+
+@pytest.mark.asyncio
+async def test_cache_set_many_stores_all_entries():
+    """Test that set_many stores a batch of entries with per-entry TTLs."""
+    from namegnome_serve.cache.provider_cache import ProviderCache
+
+    async with ProviderCache(":memory:") as cache:
+        await cache.set_many(
+            [
+                ("tmdb", "key1", {"data": "one"}, None),
+                ("tvdb", "key2", {"data": "two"}, 60),
+                ("tvdb", "key3", {"data": "three"}, 1),
+            ]
+        )
+
+        assert await cache.get("tmdb", "key1") == {"data": "one"}
+        assert await cache.get("tvdb", "key2") == {"data": "two"}
+
+        time.sleep(1.1)
+        assert await cache.get("tvdb", "key3") is None
+
+
+@pytest.mark.asyncio
+async def test_cache_cleanup_expired_handles_multiple_batches(monkeypatch):
+    """Test that cleanup_expired keeps deleting until no expired rows remain."""
+    from namegnome_serve.cache.provider_cache import ProviderCache
+
+    monkeypatch.setattr(ProviderCache, "_CLEANUP_BATCH_SIZE", 2)
+
+    async with ProviderCache(":memory:") as cache:
+        await cache.set_many(
+            [("provider", f"stale{i}", {"i": i}, -1) for i in range(5)]
+        )
+        await cache.set("provider", "fresh", {"data": "fresh"})
+
+        await cache.cleanup_expired()
+
+        db = await cache._get_connection()
+        remaining = [
+            row[0] for row in db.execute("SELECT cache_key FROM cache_entries")
+        ]
+
+        assert remaining == ["fresh"]
+
+
+@pytest.mark.asyncio
+async def test_cache_serves_hot_entries_from_memory():
+    """Test that repeated reads are served from the in-process tier."""
+    from namegnome_serve.cache.provider_cache import ProviderCache
+
+    async with ProviderCache(":memory:") as cache:
+        await cache.set("provider", "key", {"data": "hot"})
+
+        db = await cache._get_connection()
+        db.execute("DELETE FROM cache_entries")
+
+        assert await cache.get("provider", "key") == {"data": "hot"}
+        assert cache.get_stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_memory_tier_evicts_least_recently_used():
+    """Test that the in-process tier is bounded and falls back to SQLite."""
+    from namegnome_serve.cache.provider_cache import ProviderCache
+
+    async with ProviderCache(":memory:", memory_size=2) as cache:
+        await cache.set("provider", "key1", {"data": 1})
+        await cache.set("provider", "key2", {"data": 2})
+        await cache.get("provider", "key1")
+        await cache.set("provider", "key3", {"data": 3})
+
+        assert set(cache._memory) == {("provider", "key1"), ("provider", "key3")}
+        assert await cache.get("provider", "key2") == {"data": 2}
+
+
+@pytest.mark.asyncio
+async def test_cache_memory_hits_are_isolated_from_callers():
+    """Test that mutating a stored or returned payload leaves later hits intact."""
+    from namegnome_serve.cache.provider_cache import ProviderCache
+
+    async with ProviderCache(":memory:") as cache:
+        stored = {"data": "hot"}
+        await cache.set("provider", "key", stored)
+        stored["data"] = "changed"
+
+        first = await cache.get("provider", "key")
+        assert first is not None
+        first["data"] = "mutated"
+        first["extra"] = True
+
+        assert await cache.get("provider", "key") == {"data": "hot"}
+
+
+@pytest.mark.asyncio
+async def test_cache_reads_legacy_json_text_payloads():
+    """Test that rows stored as plain JSON text are still decoded."""
+    from namegnome_serve.cache.provider_cache import ProviderCache
+
+    async with ProviderCache(":memory:", memory_size=0) as cache:
+        db = await cache._get_connection()
+        db.execute(
+            """
+            INSERT INTO cache_entries
+            (cache_key, provider, data, expires_at, created_at)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            ("legacy", "provider", '{"data": "legacy"}', time.time() + 60, 0.0),
+        )
+        await cache.set("provider", "tagged", {"title": "Amélie"})
+
+        assert await cache.get("provider", "legacy") == {"data": "legacy"}
+        assert await cache.get("provider", "tagged") == {"title": "Amélie"}
+
+        (stored_type,) = db.execute(
+            "SELECT typeof(data) FROM cache_entries WHERE cache_key = 'tagged'"
+        ).fetchone()
+        assert stored_type == "blob"
+
+
+@pytest.mark.asyncio
+async def test_cache_serialises_concurrent_access():
+    """Test that concurrent coroutines can share the single connection."""
+    import asyncio
+
+    from namegnome_serve.cache.provider_cache import ProviderCache
+
+    async with ProviderCache(":memory:", memory_size=0) as cache:
+        await asyncio.gather(
+            *(cache.set("provider", f"key{i}", {"i": i}) for i in range(20))
+        )
+        results = await asyncio.gather(
+            *(cache.get("provider", f"key{i}") for i in range(20))
+        )
+
+        assert results == [{"i": i} for i in range(20)]
+
+
+@pytest.mark.asyncio
+async def test_cache_warms_hot_entries_from_previous_session(tmp_path: Path):
+    """Test that frequently hit entries are preloaded into memory on entry."""
+    from namegnome_serve.cache.provider_cache import ProviderCache
+
+    db_path = tmp_path / "cache.db"
+
+    async with ProviderCache(db_path) as cache:
+        await cache.set("provider", "hot", {"data": "hot"})
+        await cache.set("provider", "cold", {"data": "cold"})
+        for _ in range(3):
+            await cache.get("provider", "hot")
+
+    async with ProviderCache(db_path, warm_size=1) as cache:
+        assert cache._warm_task is not None
+        await cache._warm_task
+
+        assert list(cache._memory) == [("provider", "hot")]
+        assert await cache.get("provider", "hot") == {"data": "hot"}
+
+
+@pytest.mark.asyncio
+async def test_cache_runs_periodic_optimize_on_writes(monkeypatch):
+    """Test that sustained writes trigger PRAGMA optimize once per interval."""
+    from namegnome_serve.cache.provider_cache import ProviderCache
+
+    async with ProviderCache(":memory:") as cache:
+        statements: list[str] = []
+        original_run = cache._run
+
+        async def recording_run(func, *args):
+            if args and isinstance(args[0], str):
+                statements.append(args[0])
+            return await original_run(func, *args)
+
+        monkeypatch.setattr(cache, "_run", recording_run)
+
+        await cache.set("provider", "key1", {"data": 1})
+        assert "PRAGMA optimize" not in statements
+
+        cache._last_optimize -= ProviderCache._OPTIMIZE_INTERVAL
+        await cache.set("provider", "key2", {"data": 2})
+        await cache.set("provider", "key3", {"data": 3})
+        assert statements.count("PRAGMA optimize") == 1
@@ -53,3 +53,78 @@ async def test_migrations_are_idempotent(tmp_path: Path) -> None:
         cursor = await db.execute("SELECT COUNT(*) FROM migrations")
         (count,) = await cursor.fetchone()
         assert count == len(get_migration_files())
+
+
+@pytest.mark.asyncio
+async def test_failed_migration_batch_is_rolled_back(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A failing migration should leave no partially applied batch behind."""
+    import namegnome_serve.cache.migrations as migrations
+
+    bundled = get_migration_files()
+    broken = migrations.MigrationFile(name="9999_broken.sql", sql="NOT VALID SQL;")
+    monkeypatch.setattr(migrations, "get_migration_files", lambda: [*bundled, broken])
+    db_path = tmp_path / "namegnome.db"
+
+    with pytest.raises(aiosqlite.OperationalError):
+        await migrations.apply_migrations(db_path)
+
+    async with aiosqlite.connect(db_path) as db:
+        cursor = await db.execute("SELECT COUNT(*) FROM migrations")
+        (count,) = await cursor.fetchone()
+        assert count == 0
+
+        cursor = await db.execute(
+            "SELECT name FROM sqlite_master WHERE type='table' AND name='kv'"
+        )
+        assert await cursor.fetchone() is None
+
+
+def test_migration_files_are_loaded_once() -> None:
+    """Bundled migrations should be read once and shared across callers."""
+    first = get_migration_files()
+    second = get_migration_files()
+
+    assert first is second
+    assert [migration.name for migration in first] == sorted(
+        migration.name for migration in first
+    )
+
+
+@pytest.mark.asyncio
+async def test_migrated_connection_uses_wal(tmp_path: Path) -> None:
+    """File-backed cache databases should be switched to WAL journaling."""
+    db_path = tmp_path / "namegnome.db"
+
+    await apply_migrations(db_path)
+
+    async with aiosqlite.connect(db_path) as db:
+        cursor = await db.execute("PRAGMA journal_mode")
+        (mode,) = await cursor.fetchone()
+        assert mode == "wal"
+
+
+@pytest.mark.asyncio
+async def test_migrations_record_schema_version(tmp_path: Path) -> None:
+    """Migrated databases should report the current schema version."""
+    from namegnome_serve.cache.migrations import (
+        CURRENT_SCHEMA_VERSION,
+        schema_is_current,
+    )
+
+    files = get_migration_files()
+    assert CURRENT_SCHEMA_VERSION == len(files)
+    assert CURRENT_SCHEMA_VERSION == int(files[-1].name.split("_", 1)[0])
+
+    db_path = tmp_path / "namegnome.db"
+    assert schema_is_current(db_path) is False
+
+    await apply_migrations(db_path)
+
+    assert schema_is_current(db_path) is True
+    async with aiosqlite.connect(db_path) as db:
+        cursor = await db.execute("PRAGMA user_version")
+        row = await cursor.fetchone()
+    assert row is not None
+    assert row[0] == CURRENT_SCHEMA_VERSION
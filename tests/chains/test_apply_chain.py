@@ -1,5 +1,6 @@
 """Tests for apply chain orchestration (T4-02)."""
 
+import asyncio
 import json
 from pathlib import Path
 from unittest.mock import Mock, patch
@@ -176,6 +177,53 @@ class TestApplyChain:
         assert (tmp_path / "good_renamed.mp4").exists()  # Applied
         assert (tmp_path / "bad_renamed.mp4").exists()  # Applied
 
+    def test_rollback_from_manifest_restores_files(self, tmp_path: Path) -> None:
+        """Test that a manifest rollback undoes applied renames in reverse."""
+        sources = [tmp_path / f"episode{i}.mp4" for i in range(3)]
+        for src in sources:
+            src.write_text(src.name)
+
+        plan_items = [
+            PlanItem(
+                src_path=src,
+                dst_path=tmp_path / "renamed" / f"S01E0{i}.mp4",
+                reason="Rename",
+                confidence=1.0,
+                sources=[],
+            )
+            for i, src in enumerate(sources)
+        ]
+        opts = ApplyOptions(root=str(tmp_path), plan_id="test_plan")
+
+        chain = ApplyChain()
+        result = chain.apply(plan_items, opts)
+        assert result.applied_count == 3
+        assert result.manifest_path is not None
+
+        asyncio.run(chain._rollback_from_manifest(result.manifest_path))
+
+        for src in sources:
+            assert src.read_text() == src.name
+        assert not any((tmp_path / "renamed").iterdir())
+
+    def test_manifest_entries_are_read_in_reverse(self, tmp_path: Path) -> None:
+        """Test reverse iteration skips the header and blank lines."""
+        from namegnome_serve.chains.apply_chain import _iter_manifest_reverse
+
+        manifest_path = tmp_path / "manifest.jsonl"
+        manifest_path.write_bytes(
+            b'{"type":"header"}\n{"n":1}\n\n{"n":2}\n{"n":3}'  # no final newline
+        )
+
+        assert [entry["n"] for entry in _iter_manifest_reverse(manifest_path)] == [
+            3,
+            2,
+            1,
+        ]
+
+        manifest_path.write_bytes(b'{"type":"header"}\n')
+        assert list(_iter_manifest_reverse(manifest_path)) == []
+
     def test_continue_on_error(self, tmp_path: Path) -> None:
         """Test continue-on-error mode."""
         # Create test files
@@ -318,6 +366,8 @@ class TestApplyChain:
         item_call = mock_bound_logger.info.call_args
         assert item_call[0][0] == "apply.summary"
         assert "report_id" in item_call[1]
+        # The bound context and the manifest share one report ID
+        assert item_call[1]["report_id"] == bind_args["report_id"]
         assert "total_items" in item_call[1]
         assert "applied_count" in item_call[1]
 
@@ -44,13 +44,13 @@ def test_create_fuzzy_tv_mapper_uses_supplied_llm() -> None:
     stub_model = StubChatModel()
     mapper = create_fuzzy_tv_mapper(llm=stub_model)
 
+    # No parsed episode number, so the exact-match shortcut cannot apply
     media_file = MediaFile(
-        path=Path("/tv/Show/S01E01.mkv"),
+        path=Path("/tv/Show/Show - Pilot.mkv"),
         size=1,
         mtime=0,
         parsed_title="Show",
         parsed_season=1,
-        parsed_episode=1,
     )
     provider_candidates = [
         {"id": "ep1", "name": "Pilot", "seasonNumber": 1, "number": 1},
@@ -18,3 +18,13 @@ def test_cache_migrate_creates_database(tmp_path: Path) -> None:
     assert result.exit_code == 0
     assert "Migrations applied" in result.stdout
     assert db_path.exists()
+
+
+def test_cache_migrate_skips_current_database(tmp_path: Path) -> None:
+    db_path = tmp_path / "cache" / "custom.db"
+    runner.invoke(app, ["--db-path", str(db_path)])
+
+    result = runner.invoke(app, ["--db-path", str(db_path)])
+
+    assert result.exit_code == 0
+    assert "already up-to-date" in result.stdout
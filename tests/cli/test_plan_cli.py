@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 from typer.testing import CliRunner
@@ -72,7 +73,9 @@ def stub_chain(monkeypatch: pytest.MonkeyPatch) -> StubChain:
 
 @pytest.fixture()
 def stub_engine(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setattr("namegnome_serve.cli.plan.create_plan_engine", lambda: object())
+    monkeypatch.setattr(
+        "namegnome_serve.cli.plan.create_plan_engine", lambda **_: object()
+    )
 
 
 def test_cli_generate_plan_json(
@@ -105,7 +108,7 @@ def test_cli_reports_engine_errors(
 
     monkeypatch.setattr(
         "namegnome_serve.cli.plan.create_plan_engine",
-        lambda: (_ for _ in ()).throw(ValueError("API key missing")),
+        lambda **_: (_ for _ in ()).throw(ValueError("API key missing")),
     )
 
     result = runner.invoke(
@@ -115,3 +118,119 @@ def test_cli_reports_engine_errors(
 
     assert result.exit_code == 1
     assert "API key missing" in result.output
+
+
+def test_cli_closes_engine_when_planning_fails(
+    tmp_path: Path, stub_scan: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from namegnome_serve.cli.plan import app
+
+    closed: list[bool] = []
+
+    class ClosingEngine:
+        async def aclose(self) -> None:
+            closed.append(True)
+
+    class FailingChain:
+        def __init__(self, _engine: object) -> None:
+            pass
+
+        async def plan(self, **_: object) -> dict[str, object]:
+            raise RuntimeError("provider exploded")
+
+    monkeypatch.setattr(
+        "namegnome_serve.cli.plan.create_plan_engine", lambda **_: ClosingEngine()
+    )
+    monkeypatch.setattr("namegnome_serve.cli.plan.PlanChain", FailingChain)
+
+    result = runner.invoke(app, ["--media-type", "tv", "--root", str(tmp_path)])
+
+    assert isinstance(result.exception, RuntimeError)
+    assert closed == [True]
+
+
+def test_cli_cancels_warmup_when_scan_fails(
+    tmp_path: Path, stub_chain: StubChain, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import asyncio
+
+    from namegnome_serve.cli.plan import app
+
+    warmup_cancelled: list[bool] = []
+
+    class SlowWarmupEngine:
+        async def warmup(self) -> None:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                warmup_cancelled.append(True)
+                raise
+
+    def failing_scan(paths: list[Path], media_type: str) -> ScanResult:
+        raise OSError("unreadable root")
+
+    monkeypatch.setattr(
+        "namegnome_serve.cli.plan.create_plan_engine", lambda **_: SlowWarmupEngine()
+    )
+    monkeypatch.setattr("namegnome_serve.cli.plan.scan", failing_scan)
+
+    result = runner.invoke(app, ["--media-type", "tv", "--root", str(tmp_path)])
+
+    assert isinstance(result.exception, OSError)
+    assert warmup_cancelled == [True]
+    assert stub_chain.calls == []
+
+
+def test_cli_second_run_is_served_from_provider_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from namegnome_serve.cache.provider_cache import ProviderCache
+    from namegnome_serve.cli.plan import app
+    from namegnome_serve.core.deterministic_mapper import DeterministicMapper
+    from namegnome_serve.core.plan_service import create_plan_engine
+
+    def fake_scan(paths: list[Path], media_type: str) -> ScanResult:
+        return ScanResult(
+            root_path=paths[0],
+            media_type=media_type,
+            files=[
+                MediaFile(
+                    path=paths[0] / "Lost" / "S01E01.mkv",
+                    size=1,
+                    mtime=0,
+                    parsed_title="Lost",
+                    parsed_season=1,
+                    parsed_episode=1,
+                )
+            ],
+            total_size=1,
+            file_count=1,
+        )
+
+    tvdb_clients: list[AsyncMock] = []
+
+    def engine_factory(*, provider_cache: ProviderCache) -> object:
+        tvdb = AsyncMock()
+        tvdb.search_series.return_value = [{"id": "1", "name": "Lost"}]
+        tvdb.get_series_episodes.return_value = [
+            {"id": "e1", "name": "Pilot", "seasonNumber": 1, "number": 1}
+        ]
+        tvdb_clients.append(tvdb)
+        mapper = DeterministicMapper(
+            tmdb=Mock(), tvdb=tvdb, musicbrainz=Mock(), provider_cache=provider_cache
+        )
+        return create_plan_engine(deterministic=mapper, fuzzy=Mock())
+
+    monkeypatch.setattr("namegnome_serve.cli.plan.scan", fake_scan)
+    monkeypatch.setattr("namegnome_serve.cli.plan.create_plan_engine", engine_factory)
+
+    args = ["--media-type", "tv", "--root", str(tmp_path), "--json"]
+    first = runner.invoke(app, args)
+    second = runner.invoke(app, args)
+
+    assert first.exit_code == 0, first.output
+    assert second.exit_code == 0, second.output
+    assert "Pilot" in second.output
+    tvdb_clients[0].search_series.assert_awaited_once()
+    tvdb_clients[1].search_series.assert_not_awaited()
+    tvdb_clients[1].get_series_episodes.assert_not_awaited()
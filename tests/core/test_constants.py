@@ -72,8 +72,8 @@ def test_all_media_extensions() -> None:
         TV_EXTENSIONS,
     )
 
-    # Should be a set of all extensions
-    assert isinstance(ALL_MEDIA_EXTENSIONS, set)
+    # Should be an immutable set of all extensions
+    assert isinstance(ALL_MEDIA_EXTENSIONS, frozenset)
 
     # Should contain extensions from all categories
     assert ".mkv" in ALL_MEDIA_EXTENSIONS  # TV/Movie
@@ -85,6 +85,26 @@ def test_all_media_extensions() -> None:
     assert ALL_MEDIA_EXTENSIONS == expected_all
 
 
+def test_extension_sets_match_tuples() -> None:
+    """Test that the frozenset views mirror the extension tuples."""
+    from namegnome_serve.core.constants import (
+        ALL_MEDIA_EXTENSIONS,
+        ALL_MEDIA_EXTENSIONS_NODOT,
+        MOVIE_EXTENSIONS,
+        MOVIE_EXTENSIONS_SET,
+        MUSIC_EXTENSIONS,
+        MUSIC_EXTENSIONS_SET,
+        TV_EXTENSIONS,
+        TV_EXTENSIONS_SET,
+    )
+
+    assert frozenset(TV_EXTENSIONS) == TV_EXTENSIONS_SET
+    assert frozenset(MOVIE_EXTENSIONS) == MOVIE_EXTENSIONS_SET
+    assert frozenset(MUSIC_EXTENSIONS) == MUSIC_EXTENSIONS_SET
+    assert "mkv" in ALL_MEDIA_EXTENSIONS_NODOT
+    assert {f".{ext}" for ext in ALL_MEDIA_EXTENSIONS_NODOT} == ALL_MEDIA_EXTENSIONS
+
+
 def test_supported_providers() -> None:
     """Test that supported metadata providers are defined."""
     from namegnome_serve.core.constants import SUPPORTED_PROVIDERS
@@ -1,5 +1,6 @@
 """Tests for the deterministic mapper that maps scan fields to provider entities."""
 
+import time
 from unittest.mock import AsyncMock, Mock
 
 import pytest
@@ -159,6 +160,8 @@ class TestDeterministicMapper:
         assert str(result.dst_path) == "/movies/The Matrix (1999)/The Matrix (1999).mkv"
         assert result.sources[0].id == "12345"
         assert result.sources[0].provider == "tmdb"
+        # The search result already names the movie: no details round trip
+        mock_tmdb.get_movie_details.assert_not_awaited()
 
     @pytest.mark.asyncio
     async def test_map_music_exact_match(self):
@@ -202,6 +205,7 @@ class TestDeterministicMapper:
         )
         assert result.sources[0].id == "rec-123"
         assert result.sources[0].provider == "musicbrainz"
+        mock_mb.get_release_group.assert_not_awaited()
 
     @pytest.mark.asyncio
     async def test_map_tv_show_ambiguous_match(self):
@@ -331,3 +335,914 @@ class TestDeterministicMapper:
         # Album and artist should be in the destination path
         assert "A Night at the Opera" in str(result.dst_path)
         assert "Queen" in str(result.dst_path)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_tv_lookups_share_one_search(self):
+        """Files mapped concurrently with the same title hit TVDB once."""
+        import asyncio
+
+        mock_tvdb = AsyncMock()
+        mock_tvdb.search_series.return_value = [{"id": "1", "name": "Lost"}]
+
+        async def slow_episodes(series_id: str) -> list[dict[str, object]]:
+            await asyncio.sleep(0.01)
+            return []
+
+        mock_tvdb.get_series_episodes.side_effect = slow_episodes
+
+        mapper = DeterministicMapper(tmdb=Mock(), tvdb=mock_tvdb, musicbrainz=Mock())
+        files = [
+            MediaFile(
+                path=f"/tv/Lost/S01E0{episode}.mkv",
+                size=1024,
+                mtime=1234567890,
+                parsed_title="Lost",
+                parsed_season=1,
+                parsed_episode=episode,
+            )
+            for episode in range(1, 4)
+        ]
+
+        results = await asyncio.gather(
+            *(mapper.map_media_file(media_file, "tv") for media_file in files)
+        )
+
+        assert all(result is not None for result in results)
+        mock_tvdb.search_series.assert_awaited_once_with("Lost")
+        mock_tvdb.get_series_episodes.assert_awaited_once_with("1")
+
+    @pytest.mark.asyncio
+    async def test_duplicate_files_reuse_one_mapping(self):
+        """Files with identical parsed fields are mapped once per scan."""
+        import asyncio
+        from unittest.mock import patch
+
+        mock_tvdb = AsyncMock()
+        mock_tvdb.search_series.return_value = [{"id": "1", "name": "Lost"}]
+        mock_tvdb.get_series_episodes.return_value = []
+
+        mapper = DeterministicMapper(tmdb=Mock(), tvdb=mock_tvdb, musicbrainz=Mock())
+        files = [
+            MediaFile(
+                path=path,
+                size=1024,
+                mtime=1234567890,
+                parsed_title="Lost",
+                parsed_season=1,
+                parsed_episode=1,
+            )
+            for path in (
+                "/tv/Lost.S01E01.mkv",
+                "/tv/Lost.S01E01.1080p.mkv",
+                "/tv/Lost.S01E01.720p.mkv",
+            )
+        ]
+
+        with patch.object(
+            mapper, "_map_tv_show", wraps=mapper._map_tv_show
+        ) as map_tv_show:
+            results = await asyncio.gather(
+                *(mapper.map_media_file(media_file, "tv") for media_file in files[:2])
+            )
+            results.append(await mapper.map_media_file(files[2], "tv"))
+
+        map_tv_show.assert_awaited_once()
+        assert [result.src_path for result in results if result] == [
+            media_file.path for media_file in files
+        ]
+        assert len({result.dst_path for result in results if result}) == 1
+
+    @pytest.mark.asyncio
+    async def test_mapping_memos_are_bounded(self, monkeypatch):
+        """Memoised mappings and episode indexes evict their oldest entries."""
+        from namegnome_serve.core import deterministic_mapper as module
+
+        monkeypatch.setattr(module, "_EPISODE_INDEX_CACHE_SIZE", 2)
+        mock_tvdb = AsyncMock()
+        mock_tvdb.search_series.side_effect = lambda title: [
+            {"id": title, "name": title}
+        ]
+        mock_tvdb.get_series_episodes.side_effect = lambda series_id: [
+            {"id": f"{series_id}-1", "name": "Pilot", "seasonNumber": 1, "number": 1}
+        ]
+        mapper = DeterministicMapper(tmdb=Mock(), tvdb=mock_tvdb, musicbrainz=Mock())
+        mapper._mapped.maxsize = 2
+
+        for title in ("Lost", "Fringe", "Alias"):
+            media_file = MediaFile(
+                path=f"/tv/{title}.S01E01.mkv",
+                size=1024,
+                mtime=1234567890,
+                parsed_title=title,
+                parsed_season=1,
+                parsed_episode=1,
+            )
+            assert await mapper.map_media_file(media_file, "tv") is not None
+
+        assert len(mapper._mapped._entries) == 2
+        assert len(mapper._episode_indexes) == 2
+
+    @pytest.mark.asyncio
+    async def test_malformed_files_skip_provider_calls(self):
+        """Files failing the pre-flight checks never reach a provider."""
+        mock_tvdb = AsyncMock()
+        mock_mb = AsyncMock()
+        mapper = DeterministicMapper(tmdb=Mock(), tvdb=mock_tvdb, musicbrainz=mock_mb)
+
+        specials_without_episode = MediaFile(
+            path="/tv/Lost/Specials/extra.mkv",
+            size=1024,
+            mtime=1234567890,
+            parsed_title="Lost",
+            parsed_season=0,
+        )
+        track_without_artist = MediaFile(
+            path="/music/01 - Intro.flac",
+            size=512,
+            mtime=1234567890,
+            parsed_title="Intro",
+            parsed_track=1,
+        )
+
+        assert await mapper.map_media_file(specials_without_episode, "tv") is None
+        assert await mapper.map_media_file(track_without_artist, "music") is None
+        mock_tvdb.search_series.assert_not_awaited()
+        mock_mb.search_recording.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_title_year_and_extension_are_cleaned_before_search(self):
+        """A trailing "(year)" and file extension are stripped from titles."""
+        mock_tmdb = AsyncMock()
+        mock_tmdb.search_movie.return_value = [
+            {"id": 949, "title": "Heat", "release_date": "1995-12-15"}
+        ]
+        mapper = DeterministicMapper(tmdb=mock_tmdb, tvdb=Mock(), musicbrainz=Mock())
+        media_file = MediaFile(
+            path="/movies/Heat (1995).mkv",
+            size=1024,
+            mtime=1234567890,
+            parsed_title="Heat (1995).mkv",
+        )
+
+        result = await mapper.map_media_file(media_file, "movie")
+
+        assert result is not None
+        assert result.src_path == media_file.path
+        mock_tmdb.search_movie.assert_awaited_once_with("Heat", year=1995)
+
+    @pytest.mark.asyncio
+    async def test_anthology_and_episode_mapping_share_one_episode_fetch(self):
+        """A season mixing anthology and regular files loads episodes once."""
+        import asyncio
+
+        async def slow_episodes(series_id: str) -> list[dict]:
+            await asyncio.sleep(0.01)
+            return [
+                {"id": "ep1", "name": "Segment One", "seasonNumber": 1, "number": 1}
+            ]
+
+        mock_tvdb = AsyncMock()
+        mock_tvdb.search_series.return_value = [{"id": "7", "name": "Anthology Show"}]
+        mock_tvdb.get_series_episodes.side_effect = slow_episodes
+        mapper = DeterministicMapper(tmdb=Mock(), tvdb=mock_tvdb, musicbrainz=Mock())
+
+        regular = MediaFile(
+            path="/tv/Anthology Show/S01E01.mkv",
+            size=1,
+            mtime=0,
+            parsed_title="Anthology Show",
+            parsed_season=1,
+            parsed_episode=1,
+        )
+        anthology = MediaFile(
+            path="/tv/Anthology Show - S01E01.mkv",
+            size=1,
+            mtime=0,
+            parsed_title="Anthology Show",
+            parsed_season=1,
+            parsed_episode=1,
+            anthology_candidate=True,
+            segments=[
+                {
+                    "start": 1,
+                    "end": 1,
+                    "title_tokens": ["segment", "one"],
+                    "raw_span": "E01",
+                    "source": "filename",
+                }
+            ],
+        )
+
+        result, plans = await asyncio.gather(
+            mapper.map_media_file(regular, "tv"),
+            mapper.map_anthology_segments(anthology),
+        )
+
+        assert result is not None
+        assert len(plans) == 1
+        mock_tvdb.get_series_episodes.assert_awaited_once_with("7")
+
+    @pytest.mark.asyncio
+    async def test_anthology_reuses_series_seen_by_episode_mapping(self):
+        """Anthology lookups reuse the series search made by _map_tv_show."""
+        mock_tvdb = AsyncMock()
+        mock_tvdb.search_series.return_value = [{"id": "9", "name": "Mr. Robot"}]
+        mock_tvdb.get_series_episodes.return_value = [
+            {"id": "ep1", "name": "Pilot", "seasonNumber": 1, "number": 1}
+        ]
+        mapper = DeterministicMapper(tmdb=Mock(), tvdb=mock_tvdb, musicbrainz=Mock())
+
+        regular = MediaFile(
+            path="/tv/Mr. Robot/S01E01.mkv",
+            size=1,
+            mtime=0,
+            parsed_title="Mr. Robot",
+            parsed_season=1,
+            parsed_episode=1,
+        )
+        anthology = MediaFile(
+            path="/tv/Mr Robot - S01E01.mkv",
+            size=1,
+            mtime=0,
+            parsed_title="Mr Robot",
+            parsed_season=1,
+            parsed_episode=1,
+            anthology_candidate=True,
+            segments=[
+                {
+                    "start": 1,
+                    "end": 1,
+                    "title_tokens": ["pilot"],
+                    "raw_span": "E01",
+                    "source": "filename",
+                }
+            ],
+        )
+
+        assert await mapper.map_media_file(regular, "tv") is not None
+        plans = await mapper.map_anthology_segments(anthology)
+
+        assert len(plans) == 1
+        mock_tvdb.search_series.assert_awaited_once_with("Mr. Robot")
+        mock_tvdb.get_series_episodes.assert_awaited_once_with("9")
+
+    @pytest.mark.asyncio
+    async def test_sequential_tv_lookups_reuse_cached_results(self):
+        """Later files of the same show reuse cached search and episode lists."""
+        mock_tvdb = AsyncMock()
+        mock_tvdb.search_series.return_value = [{"id": "1", "name": "Lost"}]
+        mock_tvdb.get_series_episodes.return_value = [
+            {"name": "Pilot", "seasonNumber": 1, "number": 1},
+            {"name": "Tabula Rasa", "seasonNumber": 1, "number": 2},
+        ]
+
+        mapper = DeterministicMapper(tmdb=Mock(), tvdb=mock_tvdb, musicbrainz=Mock())
+        titles = []
+        for episode in (1, 2):
+            media_file = MediaFile(
+                path=f"/tv/Lost/S01E0{episode}.mkv",
+                size=1024,
+                mtime=1234567890,
+                parsed_title="Lost",
+                parsed_season=1,
+                parsed_episode=episode,
+            )
+            result = await mapper.map_media_file(media_file, "tv")
+            assert result is not None
+            titles.append(str(result.dst_path))
+
+        assert titles[1].endswith("Tabula Rasa.mkv")
+        mock_tvdb.search_series.assert_awaited_once()
+        mock_tvdb.get_series_episodes.assert_awaited_once_with("1")
+
+    @pytest.mark.asyncio
+    async def test_fallback_lookups_are_cached_by_normalised_title(self):
+        """Fallback searches share one cached result across spellings."""
+        mock_tvdb = AsyncMock()
+        mock_tvdb.search_series.return_value = []
+        mock_tmdb = AsyncMock()
+        mock_tmdb.search_tv.return_value = []
+        mock_tvmaze = AsyncMock()
+        mock_tvmaze.search_series.return_value = [{"id": 526, "name": "The Office"}]
+        mock_tvmaze.get_episode.return_value = {"name": "Pilot"}
+        mapper = DeterministicMapper(
+            tmdb=mock_tmdb, tvdb=mock_tvdb, musicbrainz=Mock(), tvmaze=mock_tvmaze
+        )
+
+        for title in ("The Office", "the  office"):
+            media_file = MediaFile(
+                path=f"/tv/{title}/S01E01.mkv",
+                size=1024,
+                mtime=1234567890,
+                parsed_title=title,
+                parsed_season=1,
+                parsed_episode=1,
+            )
+            result = await mapper.map_media_file(media_file, "tv")
+            assert result is not None
+            assert result.sources[0].provider == "tvmaze"
+
+        mock_tvdb.search_series.assert_awaited_once_with("The Office")
+        mock_tmdb.search_tv.assert_awaited_once()
+        mock_tvmaze.search_series.assert_awaited_once_with("The Office")
+        mock_tvmaze.get_episode.assert_awaited_once_with(526, 1, 1)
+
+    @pytest.mark.asyncio
+    async def test_empty_search_results_expire_sooner(self):
+        """Misses are cached with the shorter negative TTL."""
+        from namegnome_serve.core import deterministic_mapper as module
+
+        mock_tmdb = AsyncMock()
+        mock_tmdb.search_movie.return_value = []
+        mapper = DeterministicMapper(tmdb=mock_tmdb, tvdb=Mock(), musicbrainz=Mock())
+
+        value = await mapper._cached(
+            ("tmdb", "search_movie", "Nope", None),
+            module._SEARCH_TTL,
+            lambda: mock_tmdb.search_movie("Nope", year=None),
+        )
+        await mapper._cached(
+            ("tmdb", "search_movie", "Nope", None),
+            module._SEARCH_TTL,
+            lambda: mock_tmdb.search_movie("Nope", year=None),
+        )
+
+        assert value == []
+        mock_tmdb.search_movie.assert_awaited_once()
+        hit = mapper._cache.fresh(("tmdb", "search_movie", "Nope", None))
+        assert hit is not None
+        assert hit[0] - time.monotonic() <= module.NEGATIVE_TTL
+
+    @pytest.mark.asyncio
+    async def test_persisted_lookups_warm_a_new_mapper(self):
+        """A second mapper sharing the provider cache skips the network."""
+        from namegnome_serve.cache.provider_cache import ProviderCache
+
+        media_file = MediaFile(
+            path="/tv/Lost/S01E01.mkv",
+            size=1024,
+            mtime=1234567890,
+            parsed_title="Lost",
+            parsed_season=1,
+            parsed_episode=1,
+        )
+
+        async with ProviderCache(":memory:") as cache:
+            first_tvdb = AsyncMock()
+            first_tvdb.search_series.return_value = [{"id": "1", "name": "Lost"}]
+            first_tvdb.get_series_episodes.return_value = [
+                {"name": "Pilot", "seasonNumber": 1, "number": 1}
+            ]
+            first = DeterministicMapper(
+                tmdb=Mock(), tvdb=first_tvdb, musicbrainz=Mock(), provider_cache=cache
+            )
+            assert await first.map_media_file(media_file, "tv") is not None
+
+            second_tvdb = AsyncMock()
+            second = DeterministicMapper(
+                tmdb=Mock(), tvdb=second_tvdb, musicbrainz=Mock(), provider_cache=cache
+            )
+            result = await second.map_media_file(media_file, "tv")
+
+        assert result is not None
+        assert str(result.dst_path).endswith("S01E01 - Pilot.mkv")
+        second_tvdb.search_series.assert_not_awaited()
+        second_tvdb.get_series_episodes.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_persisted_fallback_lookups_warm_a_new_mapper(self):
+        """Fallback provider results persist too, not just TVDB's."""
+        from namegnome_serve.cache.provider_cache import ProviderCache
+
+        media_file = MediaFile(
+            path="/tv/The Office/S01E01.mkv",
+            size=1024,
+            mtime=1234567890,
+            parsed_title="The Office",
+            parsed_season=1,
+            parsed_episode=1,
+        )
+
+        def providers() -> dict[str, AsyncMock]:
+            tvdb = AsyncMock()
+            tvdb.search_series.return_value = []
+            tmdb = AsyncMock()
+            tmdb.search_tv.return_value = []
+            tvmaze = AsyncMock()
+            tvmaze.search_series.return_value = [{"id": 526, "name": "The Office"}]
+            tvmaze.get_episode.return_value = {"name": "Pilot"}
+            return {"tvdb": tvdb, "tmdb": tmdb, "tvmaze": tvmaze}
+
+        async with ProviderCache(":memory:") as cache:
+            first = providers()
+            first_mapper = DeterministicMapper(
+                musicbrainz=Mock(), provider_cache=cache, **first
+            )
+            assert await first_mapper.map_media_file(media_file, "tv") is not None
+
+            second = providers()
+            second_mapper = DeterministicMapper(
+                musicbrainz=Mock(), provider_cache=cache, **second
+            )
+            result = await second_mapper.map_media_file(media_file, "tv")
+
+        assert result is not None
+        assert result.sources[0].provider == "tvmaze"
+        first["tvmaze"].get_episode.assert_awaited_once()
+        for provider in second.values():
+            for method in ("search_series", "search_tv", "get_episode"):
+                getattr(provider, method).assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_stale_persisted_lookup_is_served_and_refreshed(self):
+        """Stale rows are returned immediately and refreshed in the background."""
+        import asyncio
+
+        from namegnome_serve.cache.provider_cache import ProviderCache
+        from namegnome_serve.core import deterministic_mapper as module
+
+        async with ProviderCache(":memory:") as cache:
+            await cache.set(
+                "tvdb",
+                'search_series:["Lost"]',
+                {
+                    "synced_at": time.time() - module._SEARCH_TTL - 1,
+                    "value": [{"id": "1", "name": "Lost (old)"}],
+                },
+            )
+            mock_tvdb = AsyncMock()
+            mock_tvdb.search_series.return_value = [{"id": "1", "name": "Lost"}]
+            mapper = DeterministicMapper(
+                tmdb=Mock(), tvdb=mock_tvdb, musicbrainz=Mock(), provider_cache=cache
+            )
+
+            value = await mapper._cached(
+                ("tvdb", "search_series", "Lost"),
+                module._SEARCH_TTL,
+                lambda: mock_tvdb.search_series("Lost"),
+            )
+            assert value == [{"id": "1", "name": "Lost (old)"}]
+
+            await asyncio.gather(*mapper._refreshing.values())
+            row = await cache.get("tvdb", 'search_series:["Lost"]')
+
+        mock_tvdb.search_series.assert_awaited_once_with("Lost")
+        assert row is not None
+        assert row["value"] == [{"id": "1", "name": "Lost"}]
+
+    def test_episode_index_is_memoized_per_episode_list(self):
+        """The episode index is reused until the cached list changes."""
+        mapper = DeterministicMapper(tmdb=Mock(), tvdb=Mock(), musicbrainz=Mock())
+        episodes = [
+            {"name": "Pilot", "seasonNumber": 1, "number": 1},
+            {"name": "Pilot (Alt)", "seasonNumber": 1, "number": 1},
+            {"name": "Tabula Rasa", "seasonNumber": 1, "number": 2},
+        ]
+
+        index = mapper._episode_index(("tvdb", "1"), episodes)
+
+        assert index[(1, 1)]["name"] == "Pilot"
+        assert index[(1, 2)]["name"] == "Tabula Rasa"
+        assert mapper._episode_index(("tvdb", "1"), episodes) is index
+        assert mapper._episode_index(("tvdb", "1"), list(episodes)) is not index
+
+    def test_episode_index_reads_provider_field_variants(self):
+        """TVDB v3/v4 and TMDB field names index alike, specials included."""
+        from namegnome_serve.core.deterministic_mapper import _index_episodes
+
+        index = _index_episodes(
+            [
+                {"name": "Special", "seasonNumber": 0, "number": 1},
+                {"name": "v3", "airedSeason": "2", "airedEpisodeNumber": "3"},
+                {"name": "tmdb", "season_number": 4, "episode_number": 5},
+                {"name": "unnumbered", "seasonNumber": 1},
+            ]
+        )
+
+        assert {key: episode["name"] for key, episode in index.items()} == {
+            (0, 1): "Special",
+            (2, 3): "v3",
+            (4, 5): "tmdb",
+        }
+
+    def test_extract_year_handles_provider_date_shapes(self):
+        """Years come from ints, dates and the first four-digit run in text."""
+        from datetime import date, datetime
+
+        extract = DeterministicMapper._extract_year
+
+        assert extract("2021-05-03") == 2021
+        assert extract(2008) == 2008
+        assert extract(date(1999, 3, 31)) == 1999
+        assert extract(datetime(2001, 9, 1, 20, 0)) == 2001
+        assert extract("12345-2020") == 2020
+        assert extract("") is None
+        assert extract(None) is None
+
+    def test_lnrm_ascii_fast_path_matches_unicode_path(self):
+        """ASCII titles normalise exactly as the NFKD path would."""
+        from namegnome_serve.core.deterministic_mapper import _lnrm
+
+        assert _lnrm("Mr. Robot") == _lnrm("Mr Robot") == "mrrobot"
+        assert _lnrm("The Office (US) 2005") == "theofficeus2005"
+        assert _lnrm("WALL·E") == _lnrm("Wall-E") == "walle"
+        assert _lnrm("Amélie") == "amelie"
+
+    def test_query_keys_are_normalised_and_shared(self):
+        """Equivalent search strings map to one interned cache key."""
+        from namegnome_serve.core.deterministic_mapper import _query_key
+
+        key = _query_key("The  Office")
+
+        assert key == "the office"
+        assert _query_key("ＴＨＥ office ") is key
+
+    def test_episode_title_skips_empty_fields(self):
+        """Episode titles fall back across provider field names."""
+        from namegnome_serve.core.deterministic_mapper import _episode_title
+
+        assert _episode_title({"name": "", "episodeName": "Pilot"}) == "Pilot"
+        assert _episode_title({"title": "Segment"}) == "Segment"
+        assert _episode_title({"name": None}) is None
+        assert _episode_title(None) is None
+
+    @pytest.mark.asyncio
+    async def test_default_providers_share_one_http_client(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Providers built by the mapper share a client closed by aclose()."""
+        monkeypatch.setenv("THEAUDIODB_API_KEY", "test_key")
+        mapper = DeterministicMapper(tmdb=Mock(), tvdb=Mock())
+        musicbrainz = mapper.musicbrainz
+        client = mapper.http_client
+
+        assert client is not None
+        assert musicbrainz._client is client
+        assert mapper.tvmaze._client is client
+        assert mapper.theaudiodb._client is client
+
+        await mapper.aclose()
+        assert client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_warmup_authenticates_providers_and_ignores_failures(self):
+        """warmup() logs providers in concurrently; a failed login is not fatal."""
+        mock_tvdb = AsyncMock()
+        mock_omdb = AsyncMock()
+        mock_omdb.authenticate.side_effect = Exception("OMDb down")
+        mapper = DeterministicMapper(
+            tmdb=Mock(spec=[]), tvdb=mock_tvdb, musicbrainz=Mock(), omdb=mock_omdb
+        )
+
+        await mapper.warmup()
+
+        mock_tvdb.authenticate.assert_awaited_once()
+        mock_omdb.authenticate.assert_awaited_once()
+
+    def test_path_templates_render_expected_layout(self):
+        """Destination path templates keep the established naming layout."""
+        span = DeterministicMapper._build_tv_path("Bluey", 2, 3, "Hammerbarn", 4)
+        bare = DeterministicMapper._build_tv_path("Bluey", None, None, None)
+        movie = DeterministicMapper._build_movie_path("Heat", 1995)
+        track = DeterministicMapper._build_music_path("Queen", "Jazz", 7, "Mustapha")
+
+        assert str(span) == "/tv/Bluey/Season 02/Bluey - S02E03-E04 - Hammerbarn.mkv"
+        assert str(bare) == "/tv/Bluey/Season 01/Bluey - S01E01.mkv"
+        assert str(movie) == "/movies/Heat (1995)/Heat (1995).mkv"
+        assert str(track) == "/music/Queen/Jazz/07 - Mustapha.flac"
+
+    @pytest.mark.asyncio
+    async def test_normalised_title_reuses_earlier_search(self):
+        """Punctuation/case variants of a seen title skip the provider search."""
+        mock_tvdb = AsyncMock()
+        mock_tvdb.search_series.return_value = [{"id": "7", "name": "Mr. Robot"}]
+        mock_tvdb.get_series_episodes.return_value = []
+        mapper = DeterministicMapper(tmdb=Mock(), tvdb=mock_tvdb, musicbrainz=Mock())
+
+        for index, title in enumerate(("Mr. Robot", "mr robot")):
+            media_file = MediaFile(
+                path=f"/tv/{title}/S01E0{index + 1}.mkv",
+                size=1024,
+                mtime=1234567890,
+                parsed_title=title,
+                parsed_season=1,
+                parsed_episode=index + 1,
+            )
+            result = await mapper.map_media_file(media_file, "tv")
+            assert result is not None
+            assert result.sources[0].id == "7"
+
+        mock_tvdb.search_series.assert_awaited_once_with("Mr. Robot")
+
+    @pytest.mark.asyncio
+    async def test_longer_query_does_not_answer_for_shorter_title(self):
+        """Results of "Doctor Who 1963" never stand in for "Doctor Who"."""
+        both = [
+            {"id": "76107", "name": "Doctor Who", "year": "1963"},
+            {"id": "78804", "name": "Doctor Who", "year": "2005"},
+        ]
+
+        async def search_series(title: str) -> list[dict]:
+            return both[:1] if title == "Doctor Who 1963" else both
+
+        mock_tvdb = AsyncMock()
+        mock_tvdb.search_series.side_effect = search_series
+        mapper = DeterministicMapper(tmdb=Mock(), tvdb=mock_tvdb, musicbrainz=Mock())
+
+        first = await mapper._search_tvdb_series("Doctor Who 1963")
+        second = await mapper._search_tvdb_series("Doctor Who")
+
+        assert first == both[:1]
+        assert second == both
+        assert mock_tvdb.search_series.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_normalised_title_narrows_multiple_results(self):
+        """One exact normalised match among several results is accepted."""
+        mock_tmdb = AsyncMock()
+        mock_tmdb.search_movie.return_value = [
+            {"id": 1, "title": "WALL·E", "release_date": "2008-06-22"},
+            {"id": 2, "title": "Wallace", "release_date": "2008-01-01"},
+        ]
+        mock_tmdb.get_movie_details.return_value = {"id": 1, "title": "WALL·E"}
+        mapper = DeterministicMapper(tmdb=mock_tmdb, tvdb=Mock(), musicbrainz=Mock())
+
+        media_file = MediaFile(
+            path="/movies/Wall-E (2008).mkv",
+            size=2048,
+            mtime=1234567890,
+            parsed_title="Wall-E",
+            parsed_year=2008,
+        )
+        result = await mapper.map_media_file(media_file, "movie")
+
+        assert result is not None
+        assert result.sources[0].id == "1"
+
+    @pytest.mark.asyncio
+    async def test_map_tv_show_picks_clear_fuzzy_winner(self):
+        """A clear closest match among several results is mapped, less confident."""
+        mock_tvdb = AsyncMock()
+        mock_tvdb.search_series.return_value = [
+            {"id": "81189", "name": "Breaking Bad"},
+            {"id": "99999", "name": "Breaking Point"},
+        ]
+        mock_tvdb.get_series_episodes.return_value = []
+        mapper = DeterministicMapper(tmdb=Mock(), tvdb=mock_tvdb, musicbrainz=Mock())
+
+        media_file = MediaFile(
+            path="/tv/Braking Bad/S01E01.mkv",
+            size=1024,
+            mtime=1234567890,
+            parsed_title="Braking Bad",
+            parsed_season=1,
+            parsed_episode=1,
+        )
+        result = await mapper.map_media_file(media_file, "tv")
+
+        assert result is not None
+        assert result.sources[0].id == "81189"
+        assert result.confidence < 1.0
+        assert any("picked the closest" in warning for warning in result.warnings)
+
+    @pytest.mark.asyncio
+    async def test_parsed_year_breaks_tie_between_same_named_series(self):
+        """With a parsed year, the series premiering that year wins."""
+        mock_tvdb = AsyncMock()
+        mock_tvdb.search_series.return_value = [
+            {"id": "76107", "name": "Doctor Who", "year": "1963"},
+            {"id": "78804", "name": "Doctor Who", "firstAired": "2005-03-26"},
+        ]
+        mock_tvdb.get_series_episodes.return_value = []
+        mapper = DeterministicMapper(tmdb=Mock(), tvdb=mock_tvdb, musicbrainz=Mock())
+
+        media_file = MediaFile(
+            path="/tv/Doctor Who (2005)/S01E01.mkv",
+            size=1024,
+            mtime=1234567890,
+            parsed_title="Doctor Who",
+            parsed_year=2005,
+            parsed_season=1,
+            parsed_episode=1,
+        )
+        result = await mapper.map_media_file(media_file, "tv")
+
+        assert result is not None
+        assert result.sources[0].id == "78804"
+
+    @pytest.mark.asyncio
+    async def test_series_without_year_does_not_beat_parsed_year(self):
+        """A same-named series with no reported year loses to the right year."""
+        mock_tvdb = AsyncMock()
+        mock_tvdb.search_series.return_value = [
+            {"id": "00001", "name": "Doctor Who"},
+            {"id": "76107", "name": "Doctor Who", "year": "1963"},
+            {"id": "78804", "name": "Doctor Who", "firstAired": "2005-03-26"},
+        ]
+        mock_tvdb.get_series_episodes.return_value = []
+        mapper = DeterministicMapper(tmdb=Mock(), tvdb=mock_tvdb, musicbrainz=Mock())
+
+        media_file = MediaFile(
+            path="/tv/Doctor Who (2005)/S01E01.mkv",
+            size=1024,
+            mtime=1234567890,
+            parsed_title="Doctor Who",
+            parsed_year=2005,
+            parsed_season=1,
+            parsed_episode=1,
+        )
+        result = await mapper.map_media_file(media_file, "tv")
+
+        assert result is not None
+        assert result.sources[0].id == "78804"
+
+    @pytest.mark.asyncio
+    async def test_map_many_bounds_concurrency_and_keeps_order(self):
+        """map_many maps files concurrently, capped, and preserves input order."""
+        import asyncio
+
+        active = 0
+        peak = 0
+
+        async def slow_search(query: str, year: int | None = None) -> list[dict]:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return [{"id": query, "title": query}]
+
+        mock_tmdb = AsyncMock()
+        mock_tmdb.search_movie.side_effect = slow_search
+        mock_tmdb.get_movie_details.side_effect = lambda movie_id: {"title": movie_id}
+        mapper = DeterministicMapper(tmdb=mock_tmdb, tvdb=Mock(), musicbrainz=Mock())
+
+        files = [
+            MediaFile(
+                path=f"/movies/Movie {index}.mkv",
+                size=2048,
+                mtime=1234567890,
+                parsed_title=f"Movie {index}",
+                parsed_year=2000 + index,
+            )
+            for index in range(6)
+        ]
+        results = await mapper.map_many(files, "movie", concurrency=2)
+
+        assert [result.sources[0].id for result in results if result] == [
+            f"Movie {index}" for index in range(6)
+        ]
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_map_many_dispatches_grouped_by_show(self):
+        """Files are mapped grouped by show/season but returned in input order."""
+        calls: list[str] = []
+
+        async def search(title: str) -> list[dict]:
+            calls.append(title)
+            return [{"id": title, "name": title}]
+
+        mock_tvdb = AsyncMock()
+        mock_tvdb.search_series.side_effect = search
+        mock_tvdb.get_series_episodes.return_value = []
+        mapper = DeterministicMapper(tmdb=Mock(), tvdb=mock_tvdb, musicbrainz=Mock())
+
+        def tv_file(title: str, episode: int) -> MediaFile:
+            return MediaFile(
+                path=f"/tv/{title}/S01E0{episode}.mkv",
+                size=1024,
+                mtime=1234567890,
+                parsed_title=title,
+                parsed_season=1,
+                parsed_episode=episode,
+            )
+
+        files = [tv_file("Lost", 2), tv_file("Bluey", 1), tv_file("Lost", 1)]
+        results = await mapper.map_many(files, "tv", concurrency=1)
+
+        assert [result.sources[0].id for result in results if result] == [
+            "Lost",
+            "Bluey",
+            "Lost",
+        ]
+        assert calls == ["Bluey", "Lost"]
+
+    def test_path_builders_sanitise_unsafe_characters(self):
+        """Provider titles cannot add directories or illegal characters."""
+        tv = DeterministicMapper._build_tv_path("Law/Order", 1, 1, 'What? "Now"')
+        movie = DeterministicMapper._build_movie_path("Star Wars: A New Hope", 1977)
+        track = DeterministicMapper._build_music_path("AC/DC", "T.N.T.", 1, "It's <A>")
+
+        assert str(tv) == (
+            "/tv/Law-Order/Season 01/Law-Order - S01E01 - What 'Now'.mkv"
+        )
+        assert movie.name == "Star Wars - A New Hope (1977).mkv"
+        assert str(track) == "/music/AC-DC/T.N.T./01 - It's A.flac"
+
+    def test_providers_are_constructed_on_first_use(self, monkeypatch):
+        """A mapper only builds the providers its media type needs."""
+        from namegnome_serve.core import deterministic_mapper as module
+
+        built: list[str] = []
+
+        def fake_provider(name: str):
+            def factory(**kwargs):
+                built.append(name)
+                return Mock(name=name)
+
+            return factory
+
+        monkeypatch.setattr(module, "TMDBProvider", fake_provider("tmdb"))
+        monkeypatch.setattr(module, "TVDBProvider", fake_provider("tvdb"))
+        monkeypatch.setattr(module, "MusicBrainzProvider", fake_provider("mb"))
+
+        mapper = DeterministicMapper()
+        assert built == []
+        assert mapper.http_client is None
+
+        assert mapper.musicbrainz is mapper.musicbrainz
+        assert built == ["mb"]
+
+    @pytest.mark.asyncio
+    async def test_unsearchable_music_skips_provider(self):
+        """Track numbers or punctuation-only titles never reach MusicBrainz."""
+        mock_mb = AsyncMock()
+        mock_theaudiodb = AsyncMock()
+        mapper = DeterministicMapper(
+            tmdb=Mock(), tvdb=Mock(), musicbrainz=mock_mb, theaudiodb=mock_theaudiodb
+        )
+        media_file = MediaFile(
+            path="/music/VA/01.flac",
+            size=512,
+            mtime=1234567890,
+            parsed_title="01",
+            parsed_artist="VA",
+        )
+
+        assert await mapper.map_media_file(media_file, "music") is None
+        mock_mb.search_recording.assert_not_awaited()
+        mock_theaudiodb.search_track.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_music_query_escapes_lucene_syntax(self):
+        """Titles and artists are sent as escaped Lucene phrase queries."""
+        mock_mb = AsyncMock()
+        mock_mb.search_recording.return_value = []
+        mapper = DeterministicMapper(
+            tmdb=Mock(), tvdb=Mock(), musicbrainz=mock_mb, theaudiodb=AsyncMock()
+        )
+        media_file = MediaFile(
+            path="/music/AC-DC/01 - T.N.T. (Live).flac",
+            size=512,
+            mtime=1234567890,
+            parsed_title="T.N.T. (Live)",
+            parsed_artist="AC/DC",
+        )
+
+        await mapper.map_media_file(media_file, "music")
+
+        mock_mb.search_recording.assert_awaited_once_with(
+            'recording:"T.N.T. \\(Live\\)" AND artist:"AC\\/DC"', limit=5
+        )
+
+    def test_path_builders_reuse_built_paths(self):
+        """Rebuilding the same destination returns the memoised Path."""
+        first = DeterministicMapper._build_tv_path("Lost", 1, 1, "Pilot")
+        again = DeterministicMapper._build_tv_path("Lost", 1, 1, "Pilot")
+
+        assert again is first
+        assert DeterministicMapper._build_movie_path("Heat", 1995) is (
+            DeterministicMapper._build_movie_path("Heat", 1995)
+        )
+
+    def test_anthology_items_share_source_refs(self):
+        """Plan items for one series reuse a single frozen SourceRef."""
+        from namegnome_serve.routes.schemas import EpisodeSegment
+
+        mapper = DeterministicMapper(tmdb=Mock(), tvdb=Mock(), musicbrainz=Mock())
+        media_file = MediaFile(
+            path="/tv/Bluey/S01E01-E02.mkv",
+            size=1024,
+            mtime=1234567890,
+            parsed_title="Bluey",
+            parsed_season=1,
+        )
+        segments = [
+            EpisodeSegment(start=1, end=1, raw_span="E01"),
+            EpisodeSegment(start=2, end=2, raw_span="E02"),
+        ]
+        warnings = ["shared"]
+
+        items = mapper._build_anthology_plan_items(
+            media_file=media_file,
+            series={"id": 1, "name": "Bluey"},
+            episodes=[],
+            confidence=0.95,
+            warnings=warnings,
+            segments=segments,
+        )
+
+        assert items[0].sources[0] is items[1].sources[0]
+        items[0].warnings.append("only first")
+        assert items[1].warnings == ["shared"]
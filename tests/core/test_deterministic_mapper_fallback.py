@@ -38,8 +38,17 @@ class TestDeterministicMapperFallback:
             }
         ]
 
+        # Lower-priority fallbacks also match but must not win
         mock_omdb = AsyncMock()
+        mock_omdb.search_series.return_value = [
+            {"id": "tt0903747", "title": "Breaking Bad"}
+        ]
+        mock_omdb.get_episode.return_value = None
         mock_tvmaze = AsyncMock()
+        mock_tvmaze.search_series.return_value = [
+            {"id": 169, "name": "Breaking Bad", "premiered": "2008-01-20"}
+        ]
+        mock_tvmaze.get_episode.return_value = None
 
         mapper = DeterministicMapper(
             tmdb=mock_tmdb,
@@ -64,10 +73,138 @@ class TestDeterministicMapperFallback:
         assert result is not None
         assert result.sources[0].provider == "tmdb"
         assert result.sources[0].id == "101"
+        assert result.warnings == ["TVDB failed: TVDB API error"]
         mock_tmdb.search_tv.assert_awaited_once_with("Breaking Bad", year=2008)
         mock_tmdb.get_tv_episodes.assert_awaited_once_with(101, season=1)
-        mock_omdb.search_series.assert_not_called()
-        mock_tvmaze.search_series.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_tv_show_fallbacks_run_concurrently(self):
+        """TV fallbacks overlap in time but are still chosen by priority."""
+        import asyncio
+
+        mock_tvdb = AsyncMock()
+        mock_tvdb.search_series.return_value = []
+
+        started: list[str] = []
+        all_started = asyncio.Event()
+
+        def slow_search(name: str, results: list[dict]):
+            async def search(*args: object, **kwargs: object) -> list[dict]:
+                started.append(name)
+                if len(started) == 3:
+                    all_started.set()
+                # Only returns once every fallback search is in flight, so a
+                # sequential chain would time out here instead
+                await asyncio.wait_for(all_started.wait(), timeout=1)
+                return results
+
+            return search
+
+        mock_tmdb = AsyncMock()
+        mock_tmdb.search_tv.side_effect = slow_search("tmdb", [])
+        mock_omdb = AsyncMock()
+        mock_omdb.search_series.side_effect = slow_search(
+            "omdb", [{"id": "tt0903747", "title": "Breaking Bad"}]
+        )
+        mock_tvmaze = AsyncMock()
+        mock_tvmaze.search_series.side_effect = slow_search(
+            "tvmaze", [{"id": 169, "name": "Breaking Bad"}]
+        )
+
+        mapper = DeterministicMapper(
+            tmdb=mock_tmdb,
+            tvdb=mock_tvdb,
+            musicbrainz=Mock(),
+            omdb=mock_omdb,
+            tvmaze=mock_tvmaze,
+        )
+
+        media_file = MediaFile(
+            path="/tv/Breaking Bad/Breaking Bad.mkv",
+            size=1024,
+            mtime=1234567890,
+            parsed_title="Breaking Bad",
+        )
+
+        result = await mapper.map_media_file(media_file, "tv")
+
+        assert result is not None
+        assert result.sources[0].provider == "omdb"
+        assert sorted(started) == ["omdb", "tmdb", "tvmaze"]
+
+    @pytest.mark.asyncio
+    async def test_slow_tvdb_overlaps_with_fallbacks(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        """A TVDB miss that outlasts the hedge delay overlaps the fallbacks."""
+        import asyncio
+
+        from namegnome_serve.core import deterministic_mapper as module
+
+        monkeypatch.setattr(module, "_TV_HEDGE_DELAY", 0.01)
+
+        events: list[str] = []
+        tmdb_started = asyncio.Event()
+
+        async def slow_tvdb(*args: object, **kwargs: object) -> list[dict]:
+            events.append("tvdb started")
+            # Still pending until the hedged fallback has been launched
+            await asyncio.wait_for(tmdb_started.wait(), timeout=1)
+            events.append("tvdb finished")
+            return []
+
+        async def slow_tmdb(*args: object, **kwargs: object) -> list[dict]:
+            events.append("tmdb started")
+            tmdb_started.set()
+            return [{"id": 101, "name": "Breaking Bad"}]
+
+        mock_tvdb = AsyncMock()
+        mock_tvdb.search_series.side_effect = slow_tvdb
+        mock_tmdb = AsyncMock()
+        mock_tmdb.search_tv.side_effect = slow_tmdb
+        mock_tvmaze = AsyncMock()
+        mock_tvmaze.search_series.return_value = []
+
+        mapper = DeterministicMapper(
+            tmdb=mock_tmdb, tvdb=mock_tvdb, musicbrainz=Mock(), tvmaze=mock_tvmaze
+        )
+        media_file = MediaFile(
+            path="/tv/Breaking Bad/Breaking Bad.mkv",
+            size=1024,
+            mtime=1234567890,
+            parsed_title="Breaking Bad",
+        )
+
+        result = await mapper.map_media_file(media_file, "tv")
+
+        assert result is not None
+        assert result.sources[0].provider == "tmdb"
+        assert events == ["tvdb started", "tmdb started", "tvdb finished"]
+
+    @pytest.mark.asyncio
+    async def test_fast_tvdb_match_skips_fallbacks(self):
+        """Fallbacks are never queried when TVDB settles within the hedge."""
+        mock_tvdb = AsyncMock()
+        mock_tvdb.search_series.return_value = [{"id": 81189, "name": "Breaking Bad"}]
+        mock_tmdb = AsyncMock()
+        mock_tvmaze = AsyncMock()
+
+        mapper = DeterministicMapper(
+            tmdb=mock_tmdb, tvdb=mock_tvdb, musicbrainz=Mock(), tvmaze=mock_tvmaze
+        )
+        media_file = MediaFile(
+            path="/tv/Breaking Bad/Breaking Bad.mkv",
+            size=1024,
+            mtime=1234567890,
+            parsed_title="Breaking Bad",
+        )
+
+        result = await mapper.map_media_file(media_file, "tv")
+
+        assert result is not None
+        assert result.sources[0].provider == "tvdb"
+        mock_tmdb.search_tv.assert_not_awaited()
+        mock_tvmaze.search_series.assert_not_awaited()
 
     @pytest.mark.asyncio
     async def test_tv_show_tvmaze_fallback(self):
@@ -160,6 +297,7 @@ class TestDeterministicMapperFallback:
         assert result is not None
         assert result.sources[0].provider == "omdb"
         assert result.sources[0].id == "tt0133093"
+        mock_omdb.get_movie_details.assert_not_awaited()
 
     @pytest.mark.asyncio
     async def test_music_fallback_chain(self):
@@ -204,6 +342,7 @@ class TestDeterministicMapperFallback:
         assert result is not None
         assert result.sources[0].provider == "theaudiodb"
         assert result.sources[0].id == "11111"
+        mock_tadb.get_track_details.assert_not_awaited()
 
     @pytest.mark.asyncio
     async def test_all_providers_fail(self):
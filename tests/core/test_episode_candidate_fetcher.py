@@ -134,6 +134,63 @@ async def test_fetcher_uses_first_aired_year_when_available() -> None:
     assert result[0]["id"] == "ep"
 
 
+@pytest.mark.asyncio
+async def test_fetcher_coalesces_concurrent_episode_fetches() -> None:
+    """Concurrent fetches for one series share a single episode request."""
+
+    import asyncio
+
+    async def slow_episodes(series_id: int) -> list[dict[str, object]]:
+        await asyncio.sleep(0.01)
+        return [{"id": "ep", "name": "Pilot", "seasonNumber": 1, "number": 1}]
+
+    tvdb = AsyncMock()
+    tvdb.search_series.return_value = [{"id": 5, "seriesName": "Show"}]
+    tvdb.get_series_episodes.side_effect = slow_episodes
+
+    fetcher = EpisodeCandidateFetcher(tvdb)
+    files = [
+        MediaFile(
+            path=Path(f"/tv/Show/S01E0{n}.mkv"),
+            size=1,
+            mtime=0,
+            parsed_title="Show",
+            parsed_season=1,
+            parsed_episode=n,
+        )
+        for n in (1, 2, 3)
+    ]
+
+    results = await asyncio.gather(*(fetcher.fetch(f) for f in files))
+
+    tvdb.get_series_episodes.assert_awaited_once_with(5)
+    assert all(result[0]["id"] == "ep" for result in results)
+    assert fetcher._cache._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_fetcher_reuses_cached_lookups() -> None:
+    """Repeat fetches for one show hit the provider once per lookup."""
+
+    tvdb = AsyncMock()
+    tvdb.search_series.return_value = [{"id": 5, "seriesName": "Show"}]
+    tvdb.get_series_episodes.return_value = [
+        {"id": "ep", "name": "Pilot", "seasonNumber": 1, "number": 1}
+    ]
+
+    fetcher = EpisodeCandidateFetcher(tvdb)
+    media_file = MediaFile(
+        path=Path("/tv/Show/S01E01.mkv"), size=1, mtime=0, parsed_title="Show"
+    )
+
+    first = await fetcher.fetch(media_file)
+    second = await fetcher.fetch(media_file)
+
+    assert first == second
+    tvdb.search_series.assert_awaited_once_with("Show")
+    tvdb.get_series_episodes.assert_awaited_once_with(5)
+
+
 def test_normalize_episode_handles_missing_fields() -> None:
     """Normalization should drop invalid payloads gracefully."""
 
@@ -153,3 +210,22 @@ def test_normalize_episode_handles_missing_fields() -> None:
         "seasonNumber": 3,
         "number": 7,
     }
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("2019-04-01", 2019),
+        (" 2011", 2011),
+        (2005, 2005),
+        ("19a5", None),
+        ("", None),
+        (None, None),
+    ],
+)
+def test_extract_year_reads_leading_year(value: object, expected: int | None) -> None:
+    """Only a leading four-digit run counts as the year."""
+
+    from namegnome_serve.core.episode_fetcher import _extract_year
+
+    assert _extract_year(value) == expected
@@ -75,6 +75,28 @@ def test_interval_simplify_singleton_collapse() -> None:
     assert result.punt_to_llm is False
 
 
+def test_interval_simplify_unknown_tokens_dilute_similarity() -> None:
+    """Tokens absent from every provider title still count toward the union."""
+
+    media_file = _media_file_with_segments(
+        [
+            {
+                "start": 3,
+                "end": 4,
+                "title_tokens": ["new", "pup", "returns"],
+                "raw_span": "E03-E04",
+                "source": "filename",
+            }
+        ],
+        episode=3,
+    )
+
+    result = interval_simplify(media_file, _provider_episodes())
+
+    assert "singleton_collapse" not in result.warnings
+    assert (result.segments[0].start, result.segments[0].end) == (3, 4)
+
+
 def test_interval_simplify_overlap_boundary_resolved() -> None:
     """Boundary overlap should be trimmed deterministically."""
 
@@ -212,3 +234,133 @@ def test_interval_simplify_unresolved_overlap_sets_punt() -> None:
     assert "overlap_unresolved" in result.warnings
     assert result.punt_to_llm is True
     assert result.confidence <= 0.7
+
+
+def test_interval_simplify_gap_uses_furthest_preceding_end() -> None:
+    """A segment nested inside an earlier span must not hide a later gap."""
+
+    media_file = _media_file_with_segments(
+        [
+            {
+                "start": 1,
+                "end": 3,
+                "title_tokens": ["wide"],
+                "raw_span": "E01-E03",
+                "source": "filename",
+            },
+            {
+                "start": 2,
+                "end": 2,
+                "title_tokens": ["nested"],
+                "raw_span": "E02",
+                "source": "filename",
+            },
+            {
+                "start": 5,
+                "end": 5,
+                "title_tokens": ["later"],
+                "raw_span": "E05",
+                "source": "filename",
+            },
+        ],
+        episode=1,
+    )
+
+    result = interval_simplify(media_file, _provider_episodes())
+
+    assert "gap_unresolved" in result.warnings
+    assert "out_of_bounds" not in result.warnings
+
+
+def test_interval_simplify_returns_original_segments_when_unchanged() -> None:
+    """Clean segments should be handed back without rebuilding models."""
+
+    media_file = _media_file_with_segments(
+        [
+            {
+                "start": 1,
+                "end": 1,
+                "title_tokens": ["opening"],
+                "raw_span": "E01",
+                "source": "filename",
+            },
+            {
+                "start": 2,
+                "end": 2,
+                "title_tokens": ["mission"],
+                "raw_span": "E02",
+                "source": "filename",
+            },
+        ],
+        episode=1,
+    )
+
+    result = interval_simplify(media_file, _provider_episodes())
+
+    assert result.warnings == []
+    assert result.punt_to_llm is False
+    assert all(
+        simplified is original
+        for simplified, original in zip(
+            result.segments, media_file.segments, strict=True
+        )
+    )
+
+
+def test_interval_simplify_cached_results_are_isolated() -> None:
+    """Repeated calls reuse the cached outcome without sharing mutable state."""
+
+    def build() -> MediaFile:
+        return _media_file_with_segments(
+            [
+                {
+                    "start": 3,
+                    "end": 4,
+                    "title_tokens": ["new", "pup"],
+                    "raw_span": "E03-E04",
+                    "source": "filename",
+                }
+            ],
+            episode=3,
+        )
+
+    first = interval_simplify(build(), _provider_episodes())
+    first.segments[0].title_tokens.append("mutated")
+    first.warnings.append("mutated")
+
+    second = interval_simplify(build(), _provider_episodes())
+
+    assert second.segments[0].title_tokens == ["new", "pup"]
+    assert second.warnings == ["singleton_collapse"]
+    assert second.segments[0] is not first.segments[0]
+
+
+def test_interval_simplify_sorts_segments_by_start() -> None:
+    """Out-of-order segments should come back sorted, keeping their fields."""
+
+    media_file = _media_file_with_segments(
+        [
+            {
+                "start": 2,
+                "end": 2,
+                "title_tokens": ["mission"],
+                "raw_span": "E02",
+                "source": "filename",
+            },
+            {
+                "start": 1,
+                "end": 1,
+                "title_tokens": ["opening"],
+                "raw_span": "E01",
+                "source": "dirname",
+            },
+        ],
+        episode=1,
+    )
+
+    result = interval_simplify(media_file, _provider_episodes())
+
+    assert [
+        (segment.start, segment.title_tokens, segment.source)
+        for segment in result.segments
+    ] == [(1, ["opening"], "dirname"), (2, ["mission"], "filename")]
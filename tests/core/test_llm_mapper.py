@@ -127,6 +127,60 @@ def test_llm_mapper_validates_response_structure() -> None:
         mapper.generate_tv_plan(media_file, [])
 
 
+def test_llm_mapper_skips_llm_for_exact_candidate() -> None:
+    """A unique exact season/episode candidate is planned without the LLM."""
+
+    fake_llm = FakeRunnable({"assignments": []})
+    mapper = FuzzyLLMMapper(fake_llm)
+    media_file = MediaFile(
+        path="/tv/Show/S01E02.mkv",
+        size=10,
+        mtime=0,
+        parsed_title="Show",
+        parsed_season=1,
+        parsed_episode=2,
+    )
+    candidates = [
+        {"id": "ep1", "name": "Pilot", "seasonNumber": 1, "number": 1},
+        {"id": "ep2", "name": "Second", "seasonNumber": 1, "number": 2},
+    ]
+
+    plan_items = mapper.generate_tv_plan(media_file, candidates)
+
+    assert fake_llm.calls == []
+    assert len(plan_items) == 1
+    expected = "/tv/Show/Season 01/Show - S01E02 - Second.mkv"
+    assert str(plan_items[0].dst_path) == expected
+    assert plan_items[0].confidence == pytest.approx(0.95)
+    assert plan_items[0].sources[0].id == "ep2"
+
+    anthology = media_file.model_copy(update={"anthology_candidate": True})
+    mapper.generate_tv_plan(anthology, candidates)
+    assert len(fake_llm.calls) == 1
+
+
+def test_llm_mapper_reuses_response_for_identical_payload() -> None:
+    """Re-planning the same file with the same candidates calls the LLM once."""
+
+    fake_llm = FakeRunnable({"assignments": []})
+    mapper = FuzzyLLMMapper(fake_llm)
+    media_file = MediaFile(
+        path="/tv/Show/anthology.mkv",
+        size=10,
+        mtime=0,
+        parsed_title="Show",
+        anthology_candidate=True,
+    )
+    candidates = [{"id": "ep1", "name": "Pilot", "seasonNumber": 1, "number": 1}]
+
+    mapper.generate_tv_plan(media_file, candidates)
+    mapper.generate_tv_plan(media_file, [dict(candidates[0])])
+    assert len(fake_llm.calls) == 1
+
+    mapper.generate_tv_plan(media_file, [{**candidates[0], "name": "Renamed"}])
+    assert len(fake_llm.calls) == 2
+
+
 class FakeChatModel:
     """Minimal chat model stub that records messages and returns JSON."""
 
@@ -259,3 +259,13 @@ async def test_plan_engine_default_fetcher_end_to_end() -> None:
     assert fake_llm.calls, "LLM should receive payload"
     tvdb.search_series.assert_awaited_once()
     tvdb.get_series_episodes.assert_awaited_once_with(42)
+
+
+@pytest.mark.asyncio
+async def test_plan_engine_aclose_closes_deterministic_mapper() -> None:
+    deterministic = AsyncMock()
+    engine = PlanEngine(deterministic, Mock())
+
+    await engine.aclose()
+
+    deterministic.aclose.assert_awaited_once_with()
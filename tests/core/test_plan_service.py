@@ -164,6 +164,60 @@ async def test_build_plan_review_payload_aggregates_origins() -> None:
     }
 
 
+@pytest.mark.asyncio
+async def test_build_plan_review_payload_plans_files_concurrently() -> None:
+    """Files are planned with bounded concurrency and keep their order."""
+    import asyncio
+
+    from namegnome_serve.core.plan_service import build_plan_review_payload
+
+    active = 0
+    peak = 0
+
+    async def slow_inputs(
+        media_file: MediaFile, media_type: str, provider_candidates: object = None
+    ) -> PlanReviewSourceInput:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return PlanReviewSourceInput(media_file=media_file, deterministic=[], llm=[])
+
+    engine = Mock()
+    engine.generate_plan_inputs = AsyncMock(side_effect=slow_inputs)
+    files = [
+        MediaFile(path=Path(f"/tv/Show/S01E0{index}.mkv"), size=1, mtime=0)
+        for index in range(1, 7)
+    ]
+
+    await build_plan_review_payload(
+        engine=engine,
+        media_type="tv",
+        items=[(media_file, None) for media_file in files],
+        concurrency=3,
+    )
+
+    assert peak == 3
+    assert [call.args[0] for call in engine.generate_plan_inputs.await_args_list] == (
+        files
+    )
+
+
+def test_map_concurrency_comes_from_environment(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """NAMEGNOME_MAP_CONCURRENCY overrides the default; junk values do not."""
+    from namegnome_serve.core.deterministic_mapper import resolve_map_concurrency
+
+    monkeypatch.setenv("NAMEGNOME_MAP_CONCURRENCY", "5")
+    assert resolve_map_concurrency(16) == 5
+
+    for raw in ("", "zero", "0", "-3"):
+        monkeypatch.setenv("NAMEGNOME_MAP_CONCURRENCY", raw)
+        assert resolve_map_concurrency(16) == 16
+
+
 @pytest.mark.asyncio
 async def test_plan_scan_result_returns_plan_review() -> None:
     from namegnome_serve.core.plan_service import plan_scan_result
@@ -323,3 +377,58 @@ async def test_plan_scan_result_json_is_stable() -> None:
     assert payload_1 == payload_2
     parsed = json.loads(payload_1)
     assert parsed["plan_id"] == "pln_json"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("indent", [None, 2, 4])
+async def test_plan_scan_result_json_matches_stdlib_layout(indent: int | None) -> None:
+    from namegnome_serve.core.plan_service import plan_scan_result_json
+
+    class NoopEngine:
+        async def generate_plan_inputs(
+            self,
+            media_file: MediaFile,
+            media_type: str,
+            provider_candidates: Sequence[dict[str, object]] | None = None,
+        ) -> PlanReviewSourceInput:
+            return PlanReviewSourceInput(
+                media_file=media_file,
+                deterministic=[
+                    PlanItem(
+                        src_path=media_file.path,
+                        dst_path=media_file.path,
+                        reason="noop",
+                        confidence=1.0,
+                        sources=[SourceRef(provider="tvdb", id="noop")],
+                    )
+                ],
+                llm=[],
+            )
+
+    scan_result = ScanResult(
+        root_path=Path("/tv"),
+        media_type="tv",
+        files=[
+            MediaFile(
+                path=Path("/tv/Amélie.mkv"), size=1, mtime=0, parsed_title="Amélie"
+            )
+        ],
+        total_size=1,
+        file_count=1,
+    )
+
+    payload = await plan_scan_result_json(
+        engine=NoopEngine(),
+        scan_result=scan_result,
+        plan_id="pln_json",
+        generated_at=datetime(2025, 1, 4, tzinfo=UTC),
+        indent=indent,
+    )
+
+    assert payload == json.dumps(
+        json.loads(payload),
+        indent=indent,
+        sort_keys=True,
+        separators=(",", ":") if indent is None else None,
+    )
+    assert "\\u00e9" in payload
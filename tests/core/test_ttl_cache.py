@@ -0,0 +1,77 @@
+"""Tests for the shared provider-result TTL cache."""
+
+import asyncio
+import time
+
+import pytest
+
+from namegnome_serve.core.ttl_cache import NEGATIVE_TTL, CoalescingTTLCache
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_fetch() -> None:
+    """Concurrent callers of one key await a single fetch."""
+    calls = 0
+
+    async def fetch() -> list[str]:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return ["value"]
+
+    cache = CoalescingTTLCache()
+    results = await asyncio.gather(
+        *(cache.get_or_fetch("key", 60, fetch) for _ in range(3))
+    )
+
+    assert results == [["value"]] * 3
+    assert calls == 1
+    assert await cache.get_or_fetch("key", 60, fetch) == ["value"]
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_empty_results_expire_sooner() -> None:
+    """Empty results are only kept for NEGATIVE_TTL."""
+
+    async def fetch() -> list[str]:
+        return []
+
+    cache = CoalescingTTLCache()
+    await cache.get_or_fetch("key", 10 * NEGATIVE_TTL, fetch)
+
+    hit = cache.fresh("key")
+    assert hit is not None
+    assert hit[0] - time.monotonic() <= NEGATIVE_TTL
+
+
+@pytest.mark.asyncio
+async def test_failures_and_unstored_results_are_not_cached() -> None:
+    """Exceptions are never cached, nor results fetched with store=False."""
+
+    async def fail() -> list[str]:
+        raise RuntimeError("provider down")
+
+    async def fetch() -> list[str]:
+        return ["value"]
+
+    cache = CoalescingTTLCache()
+    with pytest.raises(RuntimeError):
+        await cache.get_or_fetch("key", 60, fail)
+    assert await cache.get_or_fetch("key", 60, fetch, store=False) == ["value"]
+
+    assert cache.fresh("key") is None
+    assert cache._inflight == {}
+
+
+def test_maxsize_evicts_least_recently_used() -> None:
+    """A bounded cache drops the entry read least recently."""
+    cache = CoalescingTTLCache(maxsize=2)
+    cache.set("a", ["a"], 60)
+    cache.set("b", ["b"], 60)
+    assert cache.fresh("a") is not None
+    cache.set("c", ["c"], 60)
+
+    assert cache.fresh("b") is None
+    assert cache.fresh("a") is not None
+    assert cache.fresh("c") is not None
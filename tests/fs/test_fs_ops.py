@@ -103,10 +103,76 @@ class TestRollbackWriter:
         assert entry_data["op"] == "rename"
         assert entry_data["status"] == "applied"
 
+    def test_buffers_entries_until_flush(self, tmp_path: Path) -> None:
+        """Test that entries are buffered and written in one batch on flush."""
+        report_id = str(uuid.uuid4())
+        writer = RollbackWriter(
+            report_id=report_id,
+            root=tmp_path,
+            mode="transactional",
+            collision_strategy="backup",
+        )
+        manifest_file = tmp_path / ".namegnome" / "rollbacks" / f"{report_id}.jsonl"
+
+        with patch("namegnome_serve.fs.manifest.os.fsync") as fsync:
+            for i in range(3):
+                writer.append({"op": "rename", "status": "skipped_collision", "n": i})
+            assert not manifest_file.exists()
+
+            writer.flush()
+            assert fsync.call_count == 1
+
+        lines = manifest_file.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 4  # header + 3 entries
+        assert [json.loads(line).get("n") for line in lines[1:]] == [0, 1, 2]
+        writer.close()
+
+    def test_flushes_when_buffer_threshold_reached(self, tmp_path: Path) -> None:
+        """Test that a full buffer is written without an explicit flush."""
+        report_id = str(uuid.uuid4())
+        writer = RollbackWriter(
+            report_id=report_id,
+            root=tmp_path,
+            mode="transactional",
+            collision_strategy="backup",
+        )
+        manifest_file = tmp_path / ".namegnome" / "rollbacks" / f"{report_id}.jsonl"
+
+        for i in range(RollbackWriter.FLUSH_LINES):
+            writer.append({"op": "noop", "status": "noop", "n": i})
+
+        # Header plus FLUSH_LINES - 1 entries fill the buffer; the last waits
+        lines = manifest_file.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == RollbackWriter.FLUSH_LINES
+
+        writer.close()
+        lines = manifest_file.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == RollbackWriter.FLUSH_LINES + 1
+
 
 class TestRenameWithRollback:
     """Test atomic rename operations with rollback manifest."""
 
+    def test_plain_rename_skips_case_sensitivity_probe(self, tmp_path: Path) -> None:
+        """Test that only case-only renames probe the filesystem."""
+        src = tmp_path / "source.mp4"
+        dst = tmp_path / "destination.mp4"
+        src.write_text("test content")
+
+        writer = RollbackWriter(
+            report_id=str(uuid.uuid4()),
+            root=tmp_path,
+            mode="transactional",
+            collision_strategy="backup",
+        )
+
+        with patch("namegnome_serve.fs.fs_ops.is_case_insensitive_fs") as probe:
+            outcome = rename_with_rollback(src, dst, writer)
+
+        writer.close()
+        assert outcome.status == "applied"
+        probe.assert_not_called()
+
     def test_happy_path_rename(self, tmp_path: Path) -> None:
         """Test successful rename operation."""
         src = tmp_path / "source.mp4"
@@ -348,6 +414,147 @@ class TestApplyPlanItems:
         assert report.failed_count == 1
         assert report.skipped_count == 0
 
+    def test_apply_plan_items_parallel_across_directories(self, tmp_path: Path) -> None:
+        """Test that continue-on-error applies directory groups concurrently."""
+        plan_items = []
+        for season in range(1, 4):
+            for episode in range(1, 4):
+                src = tmp_path / f"s{season}e{episode}.mp4"
+                src.write_text(src.name)
+                plan_items.append(
+                    PlanItem(
+                        src_path=src,
+                        dst_path=tmp_path / f"Season {season}" / f"E{episode:02d}.mp4",
+                        reason="Rename",
+                        confidence=1.0,
+                        sources=[],
+                    )
+                )
+
+        report = apply_plan_items(
+            plan_items,
+            root=tmp_path,
+            plan_id="test_plan",
+            mode="continue_on_error",
+            max_workers=3,
+        )
+
+        assert report.applied_count == 9
+        assert report.failed_count == 0
+        for item in plan_items:
+            assert item.dst_path.read_text() == item.src_path.name
+
+        assert report.manifest_path is not None
+        lines = report.manifest_path.read_text(encoding="utf-8").splitlines()
+        entries = [json.loads(line) for line in lines[1:]]
+        assert json.loads(lines[0])["type"] == "header"
+        assert sorted(entry["dst_after"] for entry in entries) == sorted(
+            str(item.dst_path) for item in plan_items
+        )
+
+    @pytest.mark.parametrize("mode", ["transactional", "continue_on_error"])
+    def test_apply_plan_items_fsyncs_once_per_directory(
+        self, tmp_path: Path, mode: str
+    ) -> None:
+        """Test that one fsync covers all renames into a directory."""
+        plan_items = []
+        for season in range(1, 3):
+            for episode in range(1, 4):
+                src = tmp_path / f"s{season}e{episode}.mp4"
+                src.write_text(src.name)
+                plan_items.append(
+                    PlanItem(
+                        src_path=src,
+                        dst_path=tmp_path / f"Season {season}" / f"E{episode:02d}.mp4",
+                        reason="Rename",
+                        confidence=1.0,
+                        sources=[],
+                    )
+                )
+
+        with patch("namegnome_serve.fs.manifest.os.fsync") as fsync:
+            report = apply_plan_items(
+                plan_items,
+                root=tmp_path,
+                plan_id="test_plan",
+                mode=mode,  # type: ignore[arg-type]
+            )
+
+        assert report.applied_count == 6
+        assert fsync.call_count == 2
+        assert report.manifest_path is not None
+        lines = report.manifest_path.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 7
+
+    def test_apply_plan_items_flushes_before_moving_a_destination(
+        self, tmp_path: Path
+    ) -> None:
+        """Test that a rename is on disk before a later item moves its file."""
+        first = tmp_path / "one.mp4"
+        first.write_text("one")
+        plan_items = [
+            PlanItem(
+                src_path=first,
+                dst_path=tmp_path / "two.mp4",
+                reason="Step 1",
+                confidence=1.0,
+                sources=[],
+            ),
+            PlanItem(
+                src_path=tmp_path / "two.mp4",
+                dst_path=tmp_path / "three.mp4",
+                reason="Step 2",
+                confidence=1.0,
+                sources=[],
+            ),
+        ]
+        # Whether the first rename's destination was still in place at each fsync
+        flushed: list[bool] = []
+
+        def fsync(fd: int) -> None:
+            flushed.append((tmp_path / "two.mp4").exists())
+
+        with patch("namegnome_serve.fs.manifest.os.fsync", side_effect=fsync):
+            report = apply_plan_items(plan_items, root=tmp_path, plan_id="test_plan")
+
+        assert report.applied_count == 2
+        assert flushed == [True, False]
+
+    def test_apply_plan_items_chained_renames_stay_serial(self, tmp_path: Path) -> None:
+        """Test that items feeding each other are applied in plan order."""
+        first = tmp_path / "a" / "one.mp4"
+        first.parent.mkdir()
+        first.write_text("one")
+
+        plan_items = [
+            PlanItem(
+                src_path=first,
+                dst_path=tmp_path / "b" / "two.mp4",
+                reason="Step 1",
+                confidence=1.0,
+                sources=[],
+            ),
+            PlanItem(
+                src_path=tmp_path / "b" / "two.mp4",
+                dst_path=tmp_path / "c" / "three.mp4",
+                reason="Step 2",
+                confidence=1.0,
+                sources=[],
+            ),
+        ]
+
+        with patch("namegnome_serve.fs.fs_ops.ThreadPoolExecutor") as executor:
+            report = apply_plan_items(
+                plan_items,
+                root=tmp_path,
+                plan_id="test_plan",
+                mode="continue_on_error",
+            )
+
+        executor.assert_not_called()
+        assert report.applied_count == 2
+        assert (tmp_path / "c" / "three.mp4").read_text() == "one"
+
 
 class TestPathNormalization:
     """Test path normalization and edge cases."""
@@ -8,6 +8,7 @@ FanartTV specifics:
 - Rate limit: Not specified, use conservative 40 req/min
 """
 
+import json
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
@@ -51,8 +52,8 @@ async def test_fanarttv_get_movie_artwork():
 
         # Mock movie artwork response
         mock_response = AsyncMock()
-        mock_response.json = Mock(
-            return_value={
+        mock_response.content = json.dumps(
+            {
                 "name": "Moana",
                 "tmdb_id": "277834",
                 "movieposter": [
@@ -63,7 +64,7 @@ async def test_fanarttv_get_movie_artwork():
                     {"url": "https://example.com/bg.jpg", "lang": "en"}
                 ],
             }
-        )
+        ).encode()
         mock_response.raise_for_status = Mock()
 
         with patch.object(provider._client, "get", return_value=mock_response):
@@ -87,15 +88,15 @@ async def test_fanarttv_get_tv_artwork():
 
         # Mock TV artwork response
         mock_response = AsyncMock()
-        mock_response.json = Mock(
-            return_value={
+        mock_response.content = json.dumps(
+            {
                 "name": "Firebuds",
                 "thetvdb_id": "414000",
                 "tvposter": [{"url": "https://example.com/poster.jpg", "lang": "en"}],
                 "clearlogo": [{"url": "https://example.com/logo.png", "lang": "en"}],
                 "showbackground": [{"url": "https://example.com/bg.jpg", "lang": "en"}],
             }
-        )
+        ).encode()
         mock_response.raise_for_status = Mock()
 
         with patch.object(provider._client, "get", return_value=mock_response):
@@ -172,7 +173,7 @@ async def test_fanarttv_search_and_get_details():
 
         # get_details() should work with movie_id
         mock_response = AsyncMock()
-        mock_response.json = Mock(return_value={"name": "Test"})
+        mock_response.content = json.dumps({"name": "Test"}).encode()
         mock_response.raise_for_status = Mock()
 
         with patch.object(provider._client, "get", return_value=mock_response):
@@ -8,6 +8,7 @@ MusicBrainz specifics:
 - Release groups for albums
 """
 
+import json
 from typing import Any
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -49,9 +50,8 @@ async def test_musicbrainz_search_recording():
 
     # Mock search response
     mock_response = AsyncMock()
-    # httpx .json() is synchronous, not async - use Mock, not AsyncMock
-    mock_response.json = Mock(
-        return_value={
+    mock_response.content = json.dumps(
+        {
             "recordings": [
                 {
                     "id": "abc-123",
@@ -61,7 +61,7 @@ async def test_musicbrainz_search_recording():
                 }
             ]
         }
-    )
+    ).encode()
     mock_response.raise_for_status = Mock()
 
     with patch.object(provider._client, "get", return_value=mock_response) as mock_get:
@@ -88,9 +88,8 @@ async def test_musicbrainz_search_artist():
 
     # Mock artist search response
     mock_response = AsyncMock()
-    # httpx .json() is synchronous, not async - use Mock, not AsyncMock
-    mock_response.json = Mock(
-        return_value={
+    mock_response.content = json.dumps(
+        {
             "artists": [
                 {
                     "id": "artist-456",
@@ -100,7 +99,7 @@ async def test_musicbrainz_search_artist():
                 }
             ]
         }
-    )
+    ).encode()
     mock_response.raise_for_status = Mock()
 
     with patch.object(provider._client, "get", return_value=mock_response):
@@ -120,15 +119,14 @@ async def test_musicbrainz_get_release_group():
 
     # Mock release group response
     mock_response = AsyncMock()
-    # httpx .json() is synchronous, not async - use Mock, not AsyncMock
-    mock_response.json = Mock(
-        return_value={
+    mock_response.content = json.dumps(
+        {
             "id": "rg-789",
             "title": "Moana Soundtrack",
             "first-release-date": "2016-11-18",
             "primary-type": "Album",
         }
-    )
+    ).encode()
     mock_response.raise_for_status = Mock()
 
     with patch.object(provider._client, "get", return_value=mock_response):
@@ -193,8 +191,7 @@ async def test_musicbrainz_handles_503_rate_limit():
 
     # Mock successful retry
     mock_success = AsyncMock()
-    # httpx .json() is synchronous, not async - use Mock, not AsyncMock
-    mock_success.json = Mock(return_value={"artists": []})
+    mock_success.content = json.dumps({"artists": []}).encode()
     mock_success.raise_for_status = Mock()
 
     call_count = 0
@@ -7,6 +7,7 @@ OMDb specifics:
 - Rate limit: 1,000 req/day on free tier
 """
 
+import json
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
@@ -50,8 +51,8 @@ async def test_omdb_search_movie():
 
         # Mock search response
         mock_response = AsyncMock()
-        mock_response.json = Mock(
-            return_value={
+        mock_response.content = json.dumps(
+            {
                 "Search": [
                     {
                         "Title": "Moana",
@@ -64,7 +65,7 @@ async def test_omdb_search_movie():
                 "totalResults": "1",
                 "Response": "True",
             }
-        )
+        ).encode()
         mock_response.raise_for_status = Mock()
 
         with patch.object(provider._client, "get", return_value=mock_response):
@@ -86,18 +87,20 @@ async def test_omdb_search_series():
         provider = OMDbProvider()
 
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "Search": [
-                {
-                    "Title": "Firebuds",
-                    "Year": "2022",
-                    "imdbID": "tt12345",
-                    "Type": "series",
-                }
-            ],
-            "totalResults": "1",
-            "Response": "True",
-        }
+        mock_response.content = json.dumps(
+            {
+                "Search": [
+                    {
+                        "Title": "Firebuds",
+                        "Year": "2022",
+                        "imdbID": "tt12345",
+                        "Type": "series",
+                    }
+                ],
+                "totalResults": "1",
+                "Response": "True",
+            }
+        ).encode()
         mock_response.raise_for_status.return_value = None
 
         provider._client.get = AsyncMock(return_value=mock_response)
@@ -121,8 +124,8 @@ async def test_omdb_get_movie_details():
 
         # Mock details response
         mock_response = AsyncMock()
-        mock_response.json = Mock(
-            return_value={
+        mock_response.content = json.dumps(
+            {
                 "Title": "Moana",
                 "Year": "2016",
                 "imdbID": "tt3521164",
@@ -132,7 +135,7 @@ async def test_omdb_get_movie_details():
                 "Poster": "https://example.com/poster.jpg",
                 "Response": "True",
             }
-        )
+        ).encode()
         mock_response.raise_for_status = Mock()
 
         with patch.object(provider._client, "get", return_value=mock_response):
@@ -155,13 +158,15 @@ async def test_omdb_get_episode_details():
         provider = OMDbProvider()
 
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "Title": "Pilot",
-            "Season": "1",
-            "Episode": "1",
-            "SeriesID": "tt12345",
-            "Response": "True",
-        }
+        mock_response.content = json.dumps(
+            {
+                "Title": "Pilot",
+                "Season": "1",
+                "Episode": "1",
+                "SeriesID": "tt12345",
+                "Response": "True",
+            }
+        ).encode()
         mock_response.raise_for_status.return_value = None
 
         provider._client.get = AsyncMock(return_value=mock_response)
@@ -185,9 +190,9 @@ async def test_omdb_handles_not_found():
 
         # Mock not found response (OMDb returns Response: "False")
         mock_response = AsyncMock()
-        mock_response.json = Mock(
-            return_value={"Response": "False", "Error": "Movie not found!"}
-        )
+        mock_response.content = json.dumps(
+            {"Response": "False", "Error": "Movie not found!"}
+        ).encode()
         mock_response.raise_for_status = Mock()
 
         with patch.object(provider._client, "get", return_value=mock_response):
@@ -207,9 +212,9 @@ async def test_omdb_handles_search_no_results():
 
         # Mock no results response
         mock_response = AsyncMock()
-        mock_response.json = Mock(
-            return_value={"Response": "False", "Error": "Movie not found!"}
-        )
+        mock_response.content = json.dumps(
+            {"Response": "False", "Error": "Movie not found!"}
+        ).encode()
         mock_response.raise_for_status = Mock()
 
         with patch.object(provider._client, "get", return_value=mock_response):
@@ -134,3 +134,33 @@ def test_provider_handles_5xx_server_errors() -> None:
             provider_name="test", api_key_env_var="TEST_API_KEY"
         )
         assert provider.max_retries > 0  # Should allow retries
+
+
+@pytest.mark.asyncio
+async def test_providers_share_but_do_not_close_injected_client() -> None:
+    """Providers reuse an injected client and leave closing it to the owner."""
+    from namegnome_serve.metadata.providers import (
+        MusicBrainzProvider,
+        TVMazeProvider,
+        create_http_client,
+    )
+
+    client = create_http_client()
+    async with MusicBrainzProvider(http_client=client) as musicbrainz:
+        async with TVMazeProvider(http_client=client) as tvmaze:
+            assert musicbrainz._client is client
+            assert tvmaze._client is client
+
+    assert not client.is_closed
+    await client.aclose()
+
+
+def test_decode_json_parses_response_bytes() -> None:
+    """Provider responses are decoded from their raw bytes."""
+    import httpx
+
+    from namegnome_serve.metadata.providers.base import decode_json
+
+    response = httpx.Response(200, content='{"name": "Amélie", "id": 194}'.encode())
+
+    assert decode_json(response) == {"name": "Amélie", "id": 194}
@@ -10,6 +10,7 @@ Providers should automatically retry on:
 With exponential backoff and max retries.
 """
 
+import json
 from unittest.mock import AsyncMock, Mock, patch
 
 import httpx
@@ -43,7 +44,7 @@ async def test_provider_retries_on_429_rate_limit():
             else:
                 # Second call: success
                 mock_resp = Mock()
-                mock_resp.json.return_value = {"results": []}
+                mock_resp.content = json.dumps({"results": []}).encode()
                 mock_resp.raise_for_status = Mock()
                 return mock_resp
 
@@ -78,7 +79,7 @@ async def test_provider_retries_on_500_server_error():
                 )
             else:
                 mock_resp = AsyncMock()
-                mock_resp.json = Mock(return_value={"results": []})
+                mock_resp.content = json.dumps({"results": []}).encode()
                 mock_resp.raise_for_status = Mock()
                 return mock_resp
 
@@ -112,7 +113,7 @@ async def test_provider_retries_on_503_service_unavailable():
                 )
             else:
                 mock_resp = AsyncMock()
-                mock_resp.json = Mock(return_value={"results": []})
+                mock_resp.content = json.dumps({"results": []}).encode()
                 mock_resp.raise_for_status = Mock()
                 return mock_resp
 
@@ -200,7 +201,7 @@ async def test_provider_exponential_backoff():
                 )
             else:
                 mock_resp = AsyncMock()
-                mock_resp.json = Mock(return_value={"results": []})
+                mock_resp.content = json.dumps({"results": []}).encode()
                 mock_resp.raise_for_status = Mock()
                 return mock_resp
 
@@ -238,7 +239,7 @@ async def test_provider_retries_on_network_timeout():
                 raise httpx.TimeoutException("Request timed out")
             else:
                 mock_resp = AsyncMock()
-                mock_resp.json = Mock(return_value={"results": []})
+                mock_resp.content = json.dumps({"results": []}).encode()
                 mock_resp.raise_for_status = Mock()
                 return mock_resp
 
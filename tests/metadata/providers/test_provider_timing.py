@@ -4,6 +4,7 @@ This module tests provider performance and retry behavior with detailed timing.
 """
 
 import asyncio
+import json
 import time
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -44,7 +45,7 @@ async def test_provider_retry_timing():
             else:
                 # Third call: success
                 mock_resp = Mock()
-                mock_resp.json.return_value = {"results": []}
+                mock_resp.content = json.dumps({"results": []}).encode()
                 mock_resp.raise_for_status = Mock()
                 return mock_resp
 
@@ -99,7 +100,7 @@ async def test_provider_performance_comparison():
         tmdb_provider = TMDBProvider()
 
         mock_response = Mock()
-        mock_response.json.return_value = {"results": []}
+        mock_response.content = json.dumps({"results": []}).encode()
         mock_response.raise_for_status = Mock()
 
         with patch.object(tmdb_provider._client, "get", return_value=mock_response):
@@ -114,7 +115,7 @@ async def test_provider_performance_comparison():
     musicbrainz_provider = MusicBrainzProvider()
 
     mock_response = Mock()
-    mock_response.json.return_value = {"recordings": []}
+    mock_response.content = json.dumps({"recordings": []}).encode()
     mock_response.raise_for_status = Mock()
 
     with patch.object(musicbrainz_provider._client, "get", return_value=mock_response):
@@ -147,9 +148,9 @@ async def test_concurrent_provider_performance():
         # Mock response
         mock_response = Mock()
         if provider_name == "TMDB":
-            mock_response.json.return_value = {"results": []}
+            mock_response.content = json.dumps({"results": []}).encode()
         else:
-            mock_response.json.return_value = {"recordings": []}
+            mock_response.content = json.dumps({"recordings": []}).encode()
         mock_response.raise_for_status = Mock()
 
         with patch.object(provider._client, "get", return_value=mock_response):
@@ -202,8 +203,14 @@ def test_timing_diagnostics_integration():
 
     # Test provider timing recording
     record_provider_time("test_provider", 0.5)
-    assert "test_provider" in timing.provider_times
-    assert timing.provider_times["test_provider"] == [0.5]
+    record_provider_time("test_provider", 0.25)
+    assert "test_provider" in timing.provider_stats
+    assert timing.provider_stats["test_provider"] == {
+        "count": 2,
+        "sum": 0.75,
+        "min": 0.25,
+        "max": 0.5,
+    }
 
     checkpoint("Timing diagnostics verified", "All timing systems working")
 
@@ -213,5 +220,5 @@ def test_timing_diagnostics_integration():
 def reset_timing():
     """Reset timing state between tests."""
     timing.checkpoints.clear()
-    timing.provider_times.clear()
-    timing.start_time = time.time()
+    timing.provider_stats.clear()
+    timing.start_ns = time.perf_counter_ns()
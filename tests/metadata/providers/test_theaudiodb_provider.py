@@ -1,5 +1,6 @@
 """Unit tests for TheAudioDB provider."""
 
+import json
 from unittest.mock import AsyncMock, Mock
 
 import pytest
@@ -38,16 +39,18 @@ class TestTheAudioDBProvider:
 
         # Mock the HTTP response
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "artists": [
-                {
-                    "idArtist": "12345",
-                    "strArtist": "Queen",
-                    "strBiographyEN": "British rock band",
-                    "strCountry": "United Kingdom",
-                }
-            ]
-        }
+        mock_response.content = json.dumps(
+            {
+                "artists": [
+                    {
+                        "idArtist": "12345",
+                        "strArtist": "Queen",
+                        "strBiographyEN": "British rock band",
+                        "strCountry": "United Kingdom",
+                    }
+                ]
+            }
+        ).encode()
         mock_response.raise_for_status.return_value = None
 
         provider._client.get = AsyncMock(return_value=mock_response)
@@ -65,7 +68,7 @@ class TestTheAudioDBProvider:
 
         # Mock empty response
         mock_response = Mock()
-        mock_response.json.return_value = {"artists": None}
+        mock_response.content = json.dumps({"artists": None}).encode()
         mock_response.raise_for_status.return_value = None
 
         provider._client.get = AsyncMock(return_value=mock_response)
@@ -81,18 +84,20 @@ class TestTheAudioDBProvider:
 
         # Mock the HTTP response
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "artists": [
-                {
-                    "idArtist": "12345",
-                    "strArtist": "Queen",
-                    "strBiographyEN": "British rock band formed in 1970",
-                    "strCountry": "United Kingdom",
-                    "strGenre": "Rock",
-                    "strArtistLogo": "https://example.com/logo.png",
-                }
-            ]
-        }
+        mock_response.content = json.dumps(
+            {
+                "artists": [
+                    {
+                        "idArtist": "12345",
+                        "strArtist": "Queen",
+                        "strBiographyEN": "British rock band formed in 1970",
+                        "strCountry": "United Kingdom",
+                        "strGenre": "Rock",
+                        "strArtistLogo": "https://example.com/logo.png",
+                    }
+                ]
+            }
+        ).encode()
         mock_response.raise_for_status.return_value = None
 
         provider._client.get = AsyncMock(return_value=mock_response)
@@ -111,16 +116,18 @@ class TestTheAudioDBProvider:
 
         # Mock the HTTP response
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "album": [
-                {
-                    "idAlbum": "67890",
-                    "strAlbum": "A Night at the Opera",
-                    "strArtist": "Queen",
-                    "intYearReleased": "1975",
-                }
-            ]
-        }
+        mock_response.content = json.dumps(
+            {
+                "album": [
+                    {
+                        "idAlbum": "67890",
+                        "strAlbum": "A Night at the Opera",
+                        "strArtist": "Queen",
+                        "intYearReleased": "1975",
+                    }
+                ]
+            }
+        ).encode()
         mock_response.raise_for_status.return_value = None
 
         provider._client.get = AsyncMock(return_value=mock_response)
@@ -138,16 +145,18 @@ class TestTheAudioDBProvider:
 
         # Mock the HTTP response
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "track": [
-                {
-                    "idTrack": "11111",
-                    "strTrack": "Bohemian Rhapsody",
-                    "strArtist": "Queen",
-                    "strAlbum": "A Night at the Opera",
-                }
-            ]
-        }
+        mock_response.content = json.dumps(
+            {
+                "track": [
+                    {
+                        "idTrack": "11111",
+                        "strTrack": "Bohemian Rhapsody",
+                        "strArtist": "Queen",
+                        "strAlbum": "A Night at the Opera",
+                    }
+                ]
+            }
+        ).encode()
         mock_response.raise_for_status.return_value = None
 
         provider._client.get = AsyncMock(return_value=mock_response)
@@ -165,18 +174,20 @@ class TestTheAudioDBProvider:
 
         # Mock the HTTP response
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "artists": [
-                {
-                    "idArtist": "12345",
-                    "strArtist": "Queen",
-                    "strArtistLogo": "https://example.com/logo.png",
-                    "strArtistBanner": "https://example.com/banner.png",
-                    "strArtistClearart": "https://example.com/clearart.png",
-                    "strArtistFanart": "https://example.com/fanart.png",
-                }
-            ]
-        }
+        mock_response.content = json.dumps(
+            {
+                "artists": [
+                    {
+                        "idArtist": "12345",
+                        "strArtist": "Queen",
+                        "strArtistLogo": "https://example.com/logo.png",
+                        "strArtistBanner": "https://example.com/banner.png",
+                        "strArtistClearart": "https://example.com/clearart.png",
+                        "strArtistFanart": "https://example.com/fanart.png",
+                    }
+                ]
+            }
+        ).encode()
         mock_response.raise_for_status.return_value = None
 
         provider._client.get = AsyncMock(return_value=mock_response)
@@ -196,16 +207,18 @@ class TestTheAudioDBProvider:
 
         # Mock the HTTP response
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "album": [
-                {
-                    "idAlbum": "67890",
-                    "strAlbum": "A Night at the Opera",
-                    "strAlbumThumb": "https://example.com/thumb.jpg",
-                    "strAlbumSpine": "https://example.com/spine.jpg",
-                }
-            ]
-        }
+        mock_response.content = json.dumps(
+            {
+                "album": [
+                    {
+                        "idAlbum": "67890",
+                        "strAlbum": "A Night at the Opera",
+                        "strAlbumThumb": "https://example.com/thumb.jpg",
+                        "strAlbumSpine": "https://example.com/spine.jpg",
+                    }
+                ]
+            }
+        ).encode()
         mock_response.raise_for_status.return_value = None
 
         provider._client.get = AsyncMock(return_value=mock_response)
@@ -233,3 +246,23 @@ class TestTheAudioDBProvider:
         async with TheAudioDBProvider() as provider:
             assert isinstance(provider, TheAudioDBProvider)
             assert provider._client is not None
+
+    @pytest.mark.asyncio
+    async def test_shared_client_sends_user_agent_and_stays_open(self):
+        """A shared client gets the User-Agent per request and is not closed."""
+        import httpx
+
+        client = httpx.AsyncClient()
+        mock_response = Mock()
+        mock_response.content = json.dumps({"artists": []}).encode()
+        mock_response.raise_for_status = Mock()
+        client.get = AsyncMock(return_value=mock_response)  # type: ignore
+
+        async with TheAudioDBProvider(http_client=client) as provider:
+            assert provider._client is client
+            await provider.search_artist("Queen")
+
+        headers = client.get.call_args.kwargs["headers"]
+        assert "NameGnome" in headers["User-Agent"]
+        assert not client.is_closed
+        await client.aclose()
@@ -3,6 +3,7 @@
 Based on battle-tested patterns from mpv-scraper project.
 """
 
+import json
 import os
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -51,11 +52,9 @@ async def test_tmdb_search_movie_with_year():
 
     # Mock httpx response
     mock_response = Mock()
-    mock_response.json = Mock(
-        return_value={
-            "results": [{"id": 12345, "title": "Moana", "release_date": "2016-11-23"}]
-        }
-    )
+    mock_response.content = json.dumps(
+        {"results": [{"id": 12345, "title": "Moana", "release_date": "2016-11-23"}]}
+    ).encode()
     mock_response.raise_for_status = Mock()
 
     with patch.object(provider._client, "get", return_value=mock_response) as mock_get:
@@ -101,46 +100,44 @@ async def test_tmdb_get_movie_details():
     with patch.dict(os.environ, {"TMDB_API_KEY": "test_key"}):
         provider = TMDBProvider()
 
-        # Mock movie details response
+        # Details and images arrive in one response via append_to_response
         mock_details = Mock()
-        mock_details.json = Mock(
-            return_value={
+        mock_details.content = json.dumps(
+            {
                 "id": 12345,
                 "title": "Test Movie",
                 "overview": "A test movie",
                 "vote_average": 7.5,
                 "genres": [{"name": "Action"}],
+                "images": {
+                    "posters": [
+                        {
+                            "file_path": "/poster.jpg",
+                            "iso_3166_1": "US",
+                            "vote_average": 8.0,
+                        }
+                    ],
+                    "logos": [
+                        {
+                            "file_path": "/logo.png",
+                            "iso_3166_1": "US",
+                            "vote_average": 7.0,
+                        }
+                    ],
+                },
             }
-        )
+        ).encode()
         mock_details.raise_for_status = Mock()
 
-        # Mock images response
-        mock_images = Mock()
-        mock_images.json = Mock(
-            return_value={
-                "posters": [
-                    {
-                        "file_path": "/poster.jpg",
-                        "iso_3166_1": "US",
-                        "vote_average": 8.0,
-                    }
-                ],
-                "logos": [
-                    {
-                        "file_path": "/logo.png",
-                        "iso_3166_1": "US",
-                        "vote_average": 7.0,
-                    }
-                ],
-            }
-        )
-        mock_images.raise_for_status = Mock()
-
         with patch.object(
-            provider._client, "get", side_effect=[mock_details, mock_images]
-        ):
+            provider._client, "get", return_value=mock_details
+        ) as mock_get:
             details = await provider.get_movie_details(12345)
 
+            mock_get.assert_called_once()
+            params = mock_get.call_args.kwargs["params"]
+            assert params["append_to_response"] == "images"
+            assert "images" not in details
             assert details["id"] == 12345
             assert details["title"] == "Test Movie"
             assert "poster_url" in details
@@ -178,14 +175,14 @@ async def test_tmdb_normalizes_rating():
 
         # Mock response with 10-point scale rating
         mock_response = Mock()
-        mock_response.json = Mock(
-            return_value={
+        mock_response.content = json.dumps(
+            {
                 "id": 12345,
                 "title": "Test",
                 "vote_average": 7.5,  # 0-10 scale
                 "overview": "Test movie",
             }
-        )
+        ).encode()
         mock_response.raise_for_status = Mock()
 
         with patch.object(provider._client, "get", return_value=mock_response):
@@ -205,13 +202,9 @@ async def test_tmdb_search_tv_with_year_filter():
         provider = TMDBProvider()
 
     mock_response = Mock()
-    mock_response.json = Mock(
-        return_value={
-            "results": [
-                {"id": 2468, "name": "Firebuds", "first_air_date": "2022-09-21"}
-            ]
-        }
-    )
+    mock_response.content = json.dumps(
+        {"results": [{"id": 2468, "name": "Firebuds", "first_air_date": "2022-09-21"}]}
+    ).encode()
     mock_response.raise_for_status = Mock()
 
     with patch.object(provider._client, "get", return_value=mock_response) as mock_get:
@@ -235,13 +228,13 @@ async def test_tmdb_get_tv_episodes_for_season():
         provider = TMDBProvider()
 
     mock_response = AsyncMock()
-    mock_response.json = Mock(
-        return_value={
+    mock_response.content = json.dumps(
+        {
             "episodes": [
                 {"id": 1, "season_number": 1, "episode_number": 1, "name": "Pilot"}
             ]
         }
-    )
+    ).encode()
     mock_response.raise_for_status = Mock()
 
     with patch.object(provider._client, "get", return_value=mock_response) as mock_get:
@@ -263,35 +256,35 @@ async def test_tmdb_get_tv_episodes_all_seasons():
         provider = TMDBProvider()
 
     detail_response = AsyncMock()
-    detail_response.json = Mock(
-        return_value={
+    detail_response.content = json.dumps(
+        {
             "seasons": [
                 {"season_number": 1},
                 {"season_number": 0},  # specials should be skipped
                 {"season_number": 2},
             ]
         }
-    )
+    ).encode()
     detail_response.raise_for_status = Mock()
 
     season1_response = AsyncMock()
-    season1_response.json = Mock(
-        return_value={
+    season1_response.content = json.dumps(
+        {
             "episodes": [
                 {"id": 11, "season_number": 1, "episode_number": 1, "name": "S1E1"}
             ]
         }
-    )
+    ).encode()
     season1_response.raise_for_status = Mock()
 
     season2_response = AsyncMock()
-    season2_response.json = Mock(
-        return_value={
+    season2_response.content = json.dumps(
+        {
             "episodes": [
                 {"id": 21, "season_number": 2, "episode_number": 1, "name": "S2E1"}
             ]
         }
-    )
+    ).encode()
     season2_response.raise_for_status = Mock()
 
     with patch.object(
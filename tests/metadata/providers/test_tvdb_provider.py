@@ -8,6 +8,7 @@ TVDB v3 API (legacy) specifics:
 - Episodes require series ID → season → episode lookups
 """
 
+import json
 import os
 from typing import Any
 from unittest.mock import AsyncMock, Mock, patch
@@ -26,9 +27,9 @@ async def test_tvdb_authenticates_and_caches_token():
 
         # Mock authentication response
         mock_auth_response = AsyncMock()
-        mock_auth_response.json = AsyncMock(
-            return_value={"token": "test_jwt_token_12345"}
-        )
+        mock_auth_response.content = json.dumps(
+            {"token": "test_jwt_token_12345"}
+        ).encode()
         mock_auth_response.raise_for_status = Mock()
 
         with patch.object(
@@ -49,6 +50,28 @@ async def test_tvdb_authenticates_and_caches_token():
             mock_post.assert_not_called()
 
 
+@pytest.mark.asyncio
+async def test_tvdb_authenticate_caches_token_for_later_requests():
+    """authenticate() logs in once so later requests reuse the token."""
+    from namegnome_serve.metadata.providers.tvdb import TVDBProvider
+
+    with patch.dict(os.environ, {"TVDB_API_KEY": "test_api_key"}):
+        provider = TVDBProvider()
+
+        mock_auth_response = AsyncMock()
+        mock_auth_response.content = json.dumps({"token": "warm_token"}).encode()
+        mock_auth_response.raise_for_status = Mock()
+
+        with patch.object(
+            provider._client, "post", return_value=mock_auth_response
+        ) as mock_post:
+            await provider.authenticate()
+            headers = await provider._get_auth_headers()
+
+        mock_post.assert_called_once()
+        assert headers["Authorization"] == "Bearer warm_token"
+
+
 @pytest.mark.asyncio
 async def test_tvdb_uses_bearer_token_in_headers():
     """Test that TVDB uses Bearer token for all API requests."""
@@ -76,8 +99,8 @@ async def test_tvdb_search_series():
 
         # Mock search response
         mock_response = AsyncMock()
-        mock_response.json = AsyncMock(
-            return_value={
+        mock_response.content = json.dumps(
+            {
                 "data": [
                     {
                         "id": 305288,
@@ -87,7 +110,7 @@ async def test_tvdb_search_series():
                     }
                 ]
             }
-        )
+        ).encode()
         mock_response.raise_for_status = Mock()
 
         with patch.object(
@@ -118,8 +141,8 @@ async def test_tvdb_get_series_episodes():
 
         # Mock episodes response (paginated)
         mock_page1 = AsyncMock()
-        mock_page1.json = AsyncMock(
-            return_value={
+        mock_page1.content = json.dumps(
+            {
                 "data": [
                     {
                         "id": 8675309,
@@ -130,12 +153,12 @@ async def test_tvdb_get_series_episodes():
                 ],
                 "links": {"next": 2},
             }
-        )
+        ).encode()
         mock_page1.raise_for_status = Mock()
 
         mock_page2 = AsyncMock()
-        mock_page2.json = AsyncMock(
-            return_value={
+        mock_page2.content = json.dumps(
+            {
                 "data": [
                     {
                         "id": 8675310,
@@ -146,7 +169,7 @@ async def test_tvdb_get_series_episodes():
                 ],
                 "links": {},
             }
-        )
+        ).encode()
         mock_page2.raise_for_status = Mock()
 
         with patch.object(
@@ -174,12 +197,12 @@ async def test_tvdb_handles_401_reauth():
 
         # Mock new auth
         mock_auth = AsyncMock()
-        mock_auth.json = AsyncMock(return_value={"token": "fresh_token"})
+        mock_auth.content = json.dumps({"token": "fresh_token"}).encode()
         mock_auth.raise_for_status = Mock()
 
         # Mock successful retry
         mock_success = AsyncMock()
-        mock_success.json = AsyncMock(return_value={"data": []})
+        mock_success.content = json.dumps({"data": []}).encode()
         mock_success.raise_for_status = Mock()
 
         # First GET raises 401, second GET succeeds
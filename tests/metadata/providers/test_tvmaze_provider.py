@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from unittest.mock import AsyncMock, Mock, patch
 
 import httpx
@@ -17,12 +18,12 @@ async def test_tvmaze_search_series_returns_shows() -> None:
     provider = TVMazeProvider()
 
     mock_response = AsyncMock()
-    mock_response.json = Mock(
-        return_value=[
+    mock_response.content = json.dumps(
+        [
             {"score": 1.0, "show": {"id": 42, "name": "Firebuds", "premiered": "2022"}},
             {"score": 0.9, "show": {"id": 84, "name": "Firebug", "premiered": None}},
         ]
-    )
+    ).encode()
     mock_response.raise_for_status = Mock()
 
     with patch.object(provider._client, "get", return_value=mock_response) as mock_get:
@@ -69,7 +70,7 @@ async def test_tvmaze_get_episode_returns_payload() -> None:
         "season": 1,
         "number": 1,
     }
-    mock_response.json = Mock(return_value=payload)
+    mock_response.content = json.dumps(payload).encode()
     mock_response.raise_for_status = Mock()
 
     with patch.object(provider._client, "get", return_value=mock_response) as mock_get:
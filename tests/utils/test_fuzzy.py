@@ -0,0 +1,66 @@
+"""Tests for the fuzzy scoring helpers.
+
+Scores come from rapidfuzz when installed and from the pure-Python fallback
+otherwise; both must return the same scores.
+"""
+
+import importlib
+
+import pytest
+
+from namegnome_serve.utils import fuzzy
+from namegnome_serve.utils.fuzzy import token_set_ratio
+
+# (left, right, expected) - expected = 100 * (1 - indel distance / length sum)
+TOKEN_SET_FIXTURES = [
+    ("The Office", "The Offices", 100 - 100 * 1 / 21),
+    ("Braking Bad", "Breaking Bad", 100 - 100 * 1 / 23),
+    ("abc", "abd", 100 - 100 * 2 / 6),
+    ("kitten", "sitting", 100 - 100 * 5 / 13),
+    ("Doctor Who 2005", "Doctor Who 1963", 100 - 100 * 6 / 30),
+    ("Doctor Who 2005", "doctor who", 100.0),
+    ("Lost", "", 0.0),
+]
+
+
+@pytest.fixture(params=["python", "rapidfuzz"])
+def backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Run a test against both scoring backends."""
+    if request.param == "rapidfuzz":
+        pytest.importorskip("rapidfuzz")
+        monkeypatch.setattr(fuzzy, "_fuzz", importlib.import_module("rapidfuzz.fuzz"))
+    else:
+        monkeypatch.setattr(fuzzy, "_fuzz", None)
+    return str(request.param)
+
+
+@pytest.mark.parametrize(("left", "right", "expected"), TOKEN_SET_FIXTURES)
+def test_token_set_ratio_backends_agree(
+    backend: str, left: str, right: str, expected: float
+) -> None:
+    """Test that both backends return the same normalised Indel scores."""
+    assert fuzzy.token_set_ratio(left, right) == pytest.approx(expected)
+
+
+def test_token_set_ratio_ignores_order_and_case() -> None:
+    """Test that word order and case do not affect the score."""
+    assert token_set_ratio("office the", "The Office") == pytest.approx(100.0)
+
+
+def test_token_set_ratio_scores_subsets_as_full_match() -> None:
+    """Test that a string containing all words of the other scores 100."""
+    assert token_set_ratio("Breaking Bad US", "Breaking Bad") == pytest.approx(100.0)
+
+
+def test_token_set_ratio_ranks_typos_above_different_titles() -> None:
+    """Test that a typo clears the mapper thresholds against a different title."""
+    typo = token_set_ratio("Braking Bad", "Breaking Bad")
+    different = token_set_ratio("Braking Bad", "Breaking Point")
+
+    assert typo >= 90
+    assert typo - different >= 10
+
+
+def test_token_set_ratio_handles_empty_strings() -> None:
+    """Test that an empty string never matches."""
+    assert token_set_ratio("", "Lost") == 0.0
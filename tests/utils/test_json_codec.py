@@ -0,0 +1,51 @@
+"""Tests for the JSON codec helpers.
+
+The codec prefers orjson when installed and falls back to the standard
+library with byte-for-byte compatible compact output.
+"""
+
+import pytest
+
+from namegnome_serve.utils import json_codec
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_round_trip(monkeypatch: pytest.MonkeyPatch, use_orjson: bool) -> None:
+    """Test that dumps/loads round-trip with and without orjson."""
+    if use_orjson and not json_codec.HAS_ORJSON:
+        pytest.skip("orjson not installed")
+    if not use_orjson:
+        monkeypatch.setattr(json_codec, "_orjson", None)
+
+    payload = {"title": "Amélie", "season": 1, "tags": ["a", "b"], "ok": True}
+    encoded = json_codec.dumps(payload)
+
+    assert isinstance(encoded, bytes)
+    assert (
+        encoded == '{"title":"Amélie","season":1,"tags":["a","b"],"ok":true}'.encode()
+    )
+    assert json_codec.loads(encoded) == payload
+    assert json_codec.loads(memoryview(encoded)) == payload
+    assert json_codec.loads(encoded.decode()) == payload
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_sorted_and_indented_output(
+    monkeypatch: pytest.MonkeyPatch, use_orjson: bool
+) -> None:
+    """Test that key sorting and indentation match the standard library."""
+    import json
+
+    if use_orjson and not json_codec.HAS_ORJSON:
+        pytest.skip("orjson not installed")
+    if not use_orjson:
+        monkeypatch.setattr(json_codec, "_orjson", None)
+
+    payload = {"b": [1, {"d": None, "c": "é"}], "a": {}, "e": []}
+
+    assert json_codec.dumps(payload, sort_keys=True) == json.dumps(
+        payload, ensure_ascii=False, separators=(",", ":"), sort_keys=True
+    ).encode("utf-8")
+    assert json_codec.dumps_indented(payload, sort_keys=True) == json.dumps(
+        payload, ensure_ascii=False, indent=2, sort_keys=True
+    ).encode("utf-8")